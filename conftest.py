@@ -61,3 +61,35 @@ def expand_np_ndarray(arr):
                 nested_elem = [nested_elem]
             results_list.extend(nested_elem)
     return results_list
+
+
+@pytest.helpers.register
+def make_evc_system(controller=None, reward_noise=0.0):
+    """Return the Input, Reward and Decision Mechanisms of, and a System controlled by **controller**
+    (default: an EVCControlMechanism) that controls the drift rate and threshold of its Decision DDM
+    """
+    from psyneulink.components.functions.function import BogaczEtAl, DRIFT_RATE, THRESHOLD
+    from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+    from psyneulink.components.process import Process
+    from psyneulink.components.system import System
+    from psyneulink.globals.keywords import IDENTITY_MATRIX
+    from psyneulink.library.mechanisms.processing.integrator.ddm import DDM, PROBABILITY_UPPER_THRESHOLD, \
+        RESPONSE_TIME
+    from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
+
+    Input = TransferMechanism()
+    Reward = TransferMechanism(noise=reward_noise)
+    Decision = DDM(
+        function=BogaczEtAl(drift_rate=1.0, threshold=1.0, noise=0.5, starting_point=0, t0=0.45),
+        output_states=[RESPONSE_TIME, PROBABILITY_UPPER_THRESHOLD]
+    )
+    task_process = Process(pathway=[Input, IDENTITY_MATRIX, Decision])
+    reward_process = Process(pathway=[Reward])
+    s = System(
+        processes=[task_process, reward_process],
+        controller=controller or EVCControlMechanism,
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)],
+        control_signals=[(DRIFT_RATE, Decision), (THRESHOLD, Decision)]
+    )
+    return Input, Reward, Decision, s
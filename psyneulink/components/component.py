@@ -397,13 +397,15 @@ from enum import Enum, IntEnum
 import numpy as np
 import typecheck as tc
 
-from psyneulink.globals.context import Context, ContextFlags, _get_time
+from psyneulink.globals.context import \
+    Context, ContextFlags, _get_context, _get_execution_value, _get_time, _get_time_stamp, _resolve_time_stamp, \
+    _set_execution_value
 from psyneulink.globals.keywords import COMPONENT_INIT, CONTEXT, CONTROL_PROJECTION, DEFERRED_INITIALIZATION, FUNCTION, FUNCTION_CHECK_ARGS, FUNCTION_PARAMS, INITIALIZING, INIT_FULL_EXECUTE_METHOD, INPUT_STATES, LEARNING, LEARNING_PROJECTION, LOG_ENTRIES, MATRIX, MODULATORY_SPEC_KEYWORDS, NAME, OUTPUT_STATES, PARAMS, PARAMS_CURRENT, PREFS_ARG, SEPARATOR_BAR, SIZE, USER_PARAMS, VALUE, VARIABLE, kwComponentCategory
 from psyneulink.globals.log import LogCondition
 from psyneulink.globals.preferences.componentpreferenceset import ComponentPreferenceSet, kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel, PreferenceSet
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, is_instance_or_subclass, is_matrix, iscompatible, kwCompatibilityLength, object_has_single_value, prune_unused_args
+from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, _component_renamed, convert_all_elements_to_np_array, convert_to_np_array, is_instance_or_subclass, is_matrix, iscompatible, kwCompatibilityLength, object_has_single_value, prune_unused_args
 
 __all__ = [
     'Component', 'COMPONENT_BASE_CLASS', 'component_keywords', 'ComponentError', 'ComponentLog',
@@ -743,6 +745,12 @@ class Component(object):
     current_execution_time : tuple(`Time.RUN`, `Time.TRIAL`, `Time.PASS`, `Time.TIME_STEP`)
         see `current_execution_time <Component_Current_Execution_Time>`
 
+    random_state : np.random.RandomState
+        the random number generator from which the Component draws any random values (e.g., for `noise
+        <Integrator.noise>`);  unless one has been assigned (e.g., by the **seed** of a `System <System.seed>`), this is
+        the `numpy.random` module, the functions of which draw from numpy's global random number generator (and so
+        are affected by ``np.random.seed``).
+
     name : str
         see `name <Component_Name>`
 
@@ -867,6 +875,9 @@ class Component(object):
     #                      insuring that assignment by one instance will not affect the value of others.
     name = None
 
+    # Component-specific random number generator (see random_state property);  None uses numpy's global generator
+    _random_state = None
+
     # IMPLEMENTATION NOTE: Primarily used to track and prevent recursive calls to assign_params from setters.
     prev_context = None
 
@@ -2765,16 +2776,19 @@ class Component(object):
     @property
     def current_execution_time(self):
         try:
-            return self._current_execution_time
+            time_stamp = self._current_execution_time_stamp
         except AttributeError:
             self._update_current_execution_time(self.context.string)
+            time_stamp = self._current_execution_time_stamp
+        return _resolve_time_stamp(time_stamp)
 
     def _get_current_execution_time(self, context):
-        from psyneulink.globals.log import _get_context
         return _get_time(self, context_flags=_get_context(context))
 
     def _update_current_execution_time(self, context):
-        self._current_execution_time = self._get_current_execution_time(context=context)
+        # Only a time stamp (index into the Clock's record of times) is taken here;
+        #    it is resolved into a time tuple when current_execution_time is accessed
+        self._current_execution_time_stamp = _get_time_stamp(self, context_flags=_get_context(context))
 
     def _update_value(self, context=None):
         """Evaluate execute method
@@ -2784,14 +2798,15 @@ class Component(object):
     def _update_variable(self, value):
         '''
             Used to mirror assignments to local variable in an attribute
-            Knowingly not threadsafe
+            Stored separately for each execution (see Context_Execution_Values)
         '''
-        self._variable = value
+        if not _set_execution_value(self, VARIABLE, value):
+            self._variable = value
         return value
 
     @property
     def variable(self):
-        return self._variable
+        return _get_execution_value(self, VARIABLE, self._variable)
 
     def _change_function(self, to_function):
         pass
@@ -2810,6 +2825,7 @@ class Component(object):
                                  format(self.__class__.__name__, value))
 
         self._name = value
+        _component_renamed()
 
     @property
     def size(self):
@@ -2895,11 +2911,13 @@ class Component(object):
 
     @property
     def value(self):
-        return self._value
+        # The value in the current execution, if any (see Context_Execution_Values)
+        return _get_execution_value(self, VALUE, self._value)
 
     @value.setter
     def value(self, assignment):
-        self._value = assignment
+        if not _set_execution_value(self, VALUE, assignment):
+            self._value = assignment
         self.log._log_value(assignment)
 
     @property
@@ -2950,6 +2968,21 @@ class Component(object):
     def runtimeParamStickyAssignmentPref(self, setting):
         self.prefs.runtimeParamStickyAssignmentPref = setting
 
+    @property
+    def random_state(self):
+        if self._random_state is None:
+            # The functions of the numpy.random module draw from numpy's global RandomState (so that np.random.seed
+            #    applies), and provide the same methods as a RandomState
+            return np.random
+        return self._random_state
+
+    @random_state.setter
+    def random_state(self, random_state):
+        if random_state is not None and not isinstance(random_state, np.random.RandomState):
+            raise ComponentError("{} attribute of {} must be a {} or None".
+                                 format('random_state', self.name, np.random.RandomState.__name__))
+        self._random_state = random_state
+
     @property
     def context(self):
         try:
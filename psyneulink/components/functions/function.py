@@ -174,6 +174,17 @@ of the `function <Function_Base.function>` can be modified when it is executed,
 call to the `function <Function_Base.function>`.  For `Mechanisms <Mechanism>`, this can also be done by specifying
 `runtime_params <Mechanism_Runtime_Parameters>` for the Mechanism when it is `executed <Mechanism_Base.execute>`.
 
+.. _Function_Current_Params:
+
+When it is called, the `function <Function_Base.function>` uses the current value of each of its parameters:  the
+`value <ParameterState.value>` of the corresponding `ParameterState` of its `owner <Function_Base.owner>` if there is
+one, and otherwise the value of the Function's attribute for the parameter.  The first time a parameter is read, the
+source of its value is resolved and stored, and used for subsequent reads until the Function is assigned a new
+`owner <Function_Base.owner>`, or the `ParameterStates <ParameterState>` of its owner or of the Function itself
+are changed.
+`get_current_function_params <Function_Base.get_current_function_params>` returns the current values of several
+parameters at once.
+
 Class Reference
 ---------------
 
@@ -191,11 +202,12 @@ import typecheck as tc
 
 from psyneulink.components.component import ComponentError, DefaultsFlexibility, function_type, method_type, parameter_keywords
 from psyneulink.components.shellclasses import Function
-from psyneulink.globals.context import ContextFlags
-from psyneulink.globals.keywords import ACCUMULATOR_INTEGRATOR_FUNCTION, ADAPTIVE_INTEGRATOR_FUNCTION, ALL, ARGUMENT_THERAPY_FUNCTION, AUTO_ASSIGN_MATRIX, AUTO_DEPENDENT, BACKPROPAGATION_FUNCTION, BETA, BIAS, COMBINATION_FUNCTION_TYPE, COMBINE_MEANS_FUNCTION, CONSTANT_INTEGRATOR_FUNCTION, CONTEXT, CORRELATION, CROSS_ENTROPY, CUSTOM_FUNCTION, DECAY, DIFFERENCE, DISTANCE_FUNCTION, DISTANCE_METRICS, DIST_FUNCTION_TYPE, DIST_MEAN, DIST_SHAPE, DRIFT_DIFFUSION_INTEGRATOR_FUNCTION, DistanceMetrics, ENERGY, ENTROPY, EUCLIDEAN, EXAMPLE_FUNCTION_TYPE, EXECUTING, EXPONENTIAL_DIST_FUNCTION, EXPONENTIAL_FUNCTION, EXPONENTS, FHN_INTEGRATOR_FUNCTION, FULL_CONNECTIVITY_MATRIX, FUNCTION, FUNCTION_OUTPUT_TYPE, FUNCTION_OUTPUT_TYPE_CONVERSION, FUNCTION_PARAMS, GAIN, GAMMA_DIST_FUNCTION, HEBBIAN_FUNCTION, HIGH, HOLLOW_MATRIX, IDENTITY_MATRIX, INCREMENT, INITIALIZER, INITIALIZING, INPUT_STATES, INTEGRATOR_FUNCTION, INTEGRATOR_FUNCTION_TYPE, INTERCEPT, LEARNING, LEARNING_FUNCTION_TYPE, LEARNING_RATE, LINEAR_COMBINATION_FUNCTION, LINEAR_FUNCTION, LINEAR_MATRIX_FUNCTION, LOGISTIC_FUNCTION, LOW, MATRIX, MATRIX_KEYWORD_NAMES, MATRIX_KEYWORD_VALUES, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, NOISE, NORMALIZING_FUNCTION_TYPE, NORMAL_DIST_FUNCTION, OBJECTIVE_FUNCTION_TYPE, OFFSET, ONE_HOT_FUNCTION, OPERATION, ORNSTEIN_UHLENBECK_INTEGRATOR_FUNCTION, OUTPUT_STATES, OUTPUT_TYPE, PARAMETER_STATE_PARAMS, PARAMS, PEARSON, PREDICTION_ERROR_DELTA_FUNCTION, PROB, PROB_INDICATOR, PRODUCT, RANDOM_CONNECTIVITY_MATRIX, RATE, RECEIVER, REDUCE_FUNCTION, RL_FUNCTION, SCALE, SIMPLE_INTEGRATOR_FUNCTION, SLOPE, SOFTMAX_FUNCTION, STABILITY_FUNCTION, STANDARD_DEVIATION, SUM, TDLEARNING_FUNCTION, TIME_STEP_SIZE, TRANSFER_FUNCTION_TYPE, UNIFORM_DIST_FUNCTION, USER_DEFINED_FUNCTION, USER_DEFINED_FUNCTION_TYPE, UTILITY_INTEGRATOR_FUNCTION, VARIABLE, WALD_DIST_FUNCTION, WEIGHTS, kwComponentCategory, kwPreferenceSetName
+from psyneulink.globals.context import ContextFlags, _ExecutionAttribute, _get_execution_id
+from psyneulink.globals.keywords import ACCUMULATOR_INTEGRATOR_FUNCTION, ADAPTIVE_INTEGRATOR_FUNCTION, ALL, ARGUMENT_THERAPY_FUNCTION, AUTO_ASSIGN_MATRIX, AUTO_DEPENDENT, BACKPROPAGATION_FUNCTION, BETA, BIAS, COMBINATION_FUNCTION_TYPE, COMBINE_MEANS_FUNCTION, CONSTANT_INTEGRATOR_FUNCTION, CONTEXT, CORRELATION, CROSS_ENTROPY, CUSTOM_FUNCTION, DECAY, DIFFERENCE, DISTANCE_FUNCTION, DISTANCE_METRICS, DIST_FUNCTION_TYPE, DIST_MEAN, DIST_SHAPE, DRIFT_DIFFUSION_INTEGRATOR_FUNCTION, DistanceMetrics, ENERGY, ENTROPY, EUCLIDEAN, EXAMPLE_FUNCTION_TYPE, EXECUTING, EXPONENTIAL_DIST_FUNCTION, EXPONENTIAL_FUNCTION, EXPONENTS, FHN_INTEGRATOR_FUNCTION, FULL_CONNECTIVITY_MATRIX, FUNCTION, FUNCTION_OUTPUT_TYPE, FUNCTION_OUTPUT_TYPE_CONVERSION, FUNCTION_PARAMS, GAIN, GAMMA_DIST_FUNCTION, HEBBIAN_FUNCTION, HIGH, HOLLOW_MATRIX, IDENTITY_MATRIX, INCREMENT, INITIALIZER, INITIALIZING, INPUT_STATES, INTEGRATOR_FUNCTION, INTEGRATOR_FUNCTION_TYPE, INTERCEPT, LEARNING, LEARNING_FUNCTION_TYPE, LEARNING_RATE, LINEAR_COMBINATION_FUNCTION, LINEAR_FUNCTION, LINEAR_MATRIX_FUNCTION, LOGISTIC_FUNCTION, LOW, MATRIX, MATRIX_KEYWORD_NAMES, MATRIX_KEYWORD_VALUES, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, NOISE, NORMALIZING_FUNCTION_TYPE, NORMAL_DIST_FUNCTION, OBJECTIVE_FUNCTION_TYPE, OFFSET, ONE_HOT_FUNCTION, OPERATION, ORNSTEIN_UHLENBECK_INTEGRATOR_FUNCTION, OUTPUT_STATES, OUTPUT_TYPE, PARAMETER_STATE_PARAMS, PARAMS, PARAMS_CURRENT, PEARSON, PREDICTION_ERROR_DELTA_FUNCTION, PROB, PROB_INDICATOR, PRODUCT, RANDOM_CONNECTIVITY_MATRIX, RATE, RECEIVER, REDUCE_FUNCTION, RL_FUNCTION, SCALE, SIMPLE_INTEGRATOR_FUNCTION, SLOPE, SOFTMAX_FUNCTION, STABILITY_FUNCTION, STANDARD_DEVIATION, SUM, TDLEARNING_FUNCTION, TIME_STEP_SIZE, TRANSFER_FUNCTION_TYPE, UNIFORM_DIST_FUNCTION, USER_DEFINED_FUNCTION, USER_DEFINED_FUNCTION_TYPE, UTILITY_INTEGRATOR_FUNCTION, VARIABLE, WALD_DIST_FUNCTION, WEIGHTS, kwComponentCategory, kwPreferenceSetName
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref, kpRuntimeParamStickyAssignmentPref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 from psyneulink.globals.registry import register_category
+from psyneulink.globals import utilities
 from psyneulink.globals.utilities import is_distance_metric, is_iterable, is_matrix, is_numeric, iscompatible, np_array_less_than_2d, parameter_spec
 
 __all__ = [
@@ -279,18 +291,20 @@ OVERRIDE_PARAM = 'OVERRIDE'
 DISABLE_PARAM = 'DISABLE'
 
 
+# A single ndarray value is returned as is by reduce, rather than copied by stacking it with np.array
+
 class MultiplicativeParam():
     attrib_name = MULTIPLICATIVE_PARAM
     name = 'MULTIPLICATIVE'
     init_val = 1
-    reduce = lambda x : np.product(np.array(x), axis=0)
+    reduce = lambda x : x[0] if len(x) == 1 and isinstance(x[0], np.ndarray) else np.product(np.array(x), axis=0)
 
 
 class AdditiveParam():
     attrib_name = ADDITIVE_PARAM
     name = 'ADDITIVE_PARAM'
     init_val = 0
-    reduce = lambda x : np.sum(np.array(x), axis=0)
+    reduce = lambda x : x[0] if len(x) == 1 and isinstance(x[0], np.ndarray) else np.sum(np.array(x), axis=0)
 
 # IMPLEMENTATION NOTE:  USING A namedtuple DOESN'T WORK, AS CAN'T COPY PARAM IN Component._validate_param
 # ModulationType = namedtuple('ModulationType', 'attrib_name, name, init_val, reduce')
@@ -450,6 +464,43 @@ def get_param_value_for_function(owner, function):
         return None
 
 
+class _CurrentParamStates(dict):
+    '''The ParameterStates stored by Function_Base._get_current_param_state, for the Function's owner and the
+    ParameterStates of the owner and the Function as they were when it was created;  a copy of a Function starts empty
+    '''
+    def __init__(self, function=None):
+        super().__init__()
+        self._binding = None if function is None else self._get_binding(function)
+
+    @staticmethod
+    def _get_binding(function):
+        owner = function.owner
+        owner_param_states = getattr(owner, '_parameter_states', None)
+        param_states = getattr(function, '_parameter_states', None)
+        return (owner,
+                owner_param_states, getattr(owner_param_states, '_version', None),
+                param_states, getattr(param_states, '_version', None),
+                utilities._component_names_version)
+
+    def is_current(self, function):
+        '''Return True if the stored ParameterStates are still those for **function**'''
+        binding = self._binding
+        if binding is None:
+            return False
+        owner, owner_param_states, owner_version, param_states, version, names_version = binding
+        if function.owner is not owner or names_version != utilities._component_names_version:
+            return False
+        if owner_param_states is not None and owner_param_states._version != owner_version:
+            return False
+        if param_states is not None and param_states._version != version:
+            return False
+        return (getattr(owner, '_parameter_states', None) is owner_param_states
+                and getattr(function, '_parameter_states', None) is param_states)
+
+    def __deepcopy__(self, memo):
+        return _CurrentParamStates()
+
+
 class Function_Base(Function):
     """
     Function_Base(           \
@@ -600,6 +651,11 @@ class Function_Base(Function):
 
     variableClassDefault_locked = False
 
+    # Names of attributes that carry state from one execution to the next (e.g., previous_value of an Integrator);
+    #    used by System._cache_state and System._restore_state;  each must also be declared on the class as an
+    #    _ExecutionAttribute, so that it is stored separately for each execution (see Context_Execution_Values)
+    stateful_attributes = []
+
     class ClassDefaults(Function.ClassDefaults):
         variable = np.array([0])
 
@@ -668,18 +724,70 @@ class Function_Base(Function):
                                 format(param, param_name, self.__class__.__name__, owner_name))
 
     def get_current_function_param(self, param_name):
+        """Return the current value of the parameter named **param_name** (see `Function_Current_Params`)"""
+        if not self._current_param_states.is_current(self):
+            self._bind_current_param_states()
+        try:
+            parameter_state = self._current_param_states[param_name]
+        except KeyError:
+            parameter_state = self._get_current_param_state(param_name)
+        if parameter_state is None:
+            return getattr(self, param_name)
+        return parameter_state.value
+
+    def get_current_function_params(self, *param_names):
+        """Return a tuple with the current value of each of the parameters named in **param_names**
+        (see `Function_Current_Params`)"""
+        if not self._current_param_states.is_current(self):
+            self._bind_current_param_states()
+        current_param_states = self._current_param_states
+        values = []
+        for param_name in param_names:
+            try:
+                parameter_state = current_param_states[param_name]
+            except KeyError:
+                parameter_state = self._get_current_param_state(param_name)
+            values.append(getattr(self, param_name) if parameter_state is None else parameter_state.value)
+        return tuple(values)
+
+    # The ParameterState that provides the current value of each parameter (or None if it is the Function's
+    #    attribute), resolved for the owner and ParameterStates as they were when they were stored
+    _current_param_states = _CurrentParamStates()
+    _owner = None
+    deepcopy_shared_keys = Function.deepcopy_shared_keys | {'_owner'}
+
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, assignment):
+        self._owner = assignment
+        self._bind_current_param_states()
+
+    def _bind_current_param_states(self):
+        self._current_param_states = _CurrentParamStates(self)
+
+    def _get_current_param_state(self, param_name):
+        '''Return (and store) the ParameterState for the parameter named **param_name** of the Function's owner or,
+        if there is none, of the Function itself;  return None if neither has one (the parameter's current value is
+        then the value of the Function's attribute)
+        '''
         if param_name == "variable":
             raise FunctionError("The method 'get_current_function_param' is intended for retrieving the current value "
                                 "of a function parameter. 'variable' is not a function parameter. If looking for {}'s "
                                 "default variable, try {}.instance_defaults.variable.".format(self.name, self.name))
-        try:
-            return self.owner._parameter_states[param_name].value
-        except (AttributeError, TypeError):
+
+        parameter_state = None
+        for component in (self.owner, self):
             try:
-                return self._parameter_states[param_name].value
+                parameter_state = component._parameter_states[param_name]
+                break
             except (AttributeError, TypeError):
+                continue
 
-                return getattr(self, param_name)
+        self._current_param_states[param_name] = parameter_state
+        return parameter_state
 
     @property
     def functionOutputType(self):
@@ -976,6 +1084,7 @@ class UserDefinedFunction(Function_Base):
     UserDefinedFunction(        \
          custom_function=None,  \
          default_variable=None, \
+         jit=False,             \
          params=None,           \
          owner=None,            \
          name=None,             \
@@ -996,8 +1105,8 @@ class UserDefinedFunction(Function_Base):
 
     * It must have **at least one argument** (that can be a positional or a keyword argument);  this will be treated
       as the `variable <UserDefinedFunction.variable>` attribute of the UDF's `function <UserDefinedFunction.function>`.
-      When the UDF calls the function or method that it wraps, an initial attempt is made to do so with **variable**
-      as the name of the first argument; if that fails, it is called positionally.  The argument is always passed as a
+      When the UDF calls the function or method that it wraps, it is passed positionally (or by its name, if it is a
+      keyword-only argument).  The argument is always passed as a
       2d np.array, that may contain one or more items (elements in axis 0), depending upon the Component to which the
       UDF is assigned.  It is the user's responsibility to insure that the number of items expected in the first
       argument of the function or method is compatible with the circumstances in which it will be called.
@@ -1018,8 +1127,9 @@ class UserDefinedFunction(Function_Base):
     .. _UDF_Params_Context:
 
     * It may include **context** and **params** arguments;  these are not required, but can be included to receive
-      information about the current conditions of execution.  When the function or method is called, an initial attempt
-      is made to do so with these arguments; if that fails, it is called again without them.
+      information about the current conditions of execution.  They are passed to the function or method only if
+      they appear in its signature (or if it accepts arbitrary keyword arguments).  The signature is inspected once,
+      when the UDF is created, so the function or method is called only once each time the UDF is executed.
     ..
     .. _UDF_Modulatory_Params:
 
@@ -1036,6 +1146,15 @@ class UserDefinedFunction(Function_Base):
       # IMPLEMENT INTERFACE FOR OTHER ModulationParam TYPES (i.e., for ability to add new custom ones)
       COMMENT
 
+    .. _UDF_JIT:
+
+    * If **jit** is `True` in the constructor for the UDF, the function is compiled using `numba
+      <http://numba.pydata.org>`_ if it is installed;  this can substantially speed up numeric functions that are
+      executed often (for example, the functions of GatingSignals or the cost functions of ControlSignals).  The
+      function is compiled the first time it is called;  if numba is not installed, or the function cannot be compiled
+      (for example, because it uses Python objects that numba does not support, or has **params** or **context**
+      arguments), then the Python function is used.
+
     .. tip::
        The format of the `variable <UserDefinedFunction.variable>` passed to the `custom_function
        <UserDefinedFunction.custom_function>` function can be verified by adding a ``print(variable)`` or
@@ -1243,6 +1362,9 @@ class UserDefinedFunction(Function_Base):
         specifies the function to "wrap." It can be any function or method, including a lambda function;
         see `above <UDF_Description>` for additional details.
 
+    jit : bool : default False
+        specifies whether **custom_function** is compiled using numba, if it is installed (see `above <UDF_JIT>`).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the function.
         This can be used to define an `additive_param <UserDefinedFunction.additive_param>` and/or
@@ -1271,6 +1393,10 @@ class UserDefinedFunction(Function_Base):
     custom_function : function
         the user-specified function: called by the Function's `owner <Function_Base.owner>` when it is executed.
 
+    jit : bool
+        indicates whether `custom_function <UserDefinedFunction.custom_function>` is compiled using numba
+        (see `above <UDF_JIT>`);  if numba is not installed, or compilation fails, the Python function is used.
+
     additive_param : str
         this contains the name of the additive_param, if one has been specified for the UDF
         (see `above <UDF_Modulatory_Params>` for details).
@@ -1318,11 +1444,14 @@ class UserDefinedFunction(Function_Base):
     def __init__(self,
                  custom_function=None,
                  default_variable=None,
+                 jit:bool=False,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None,
                  **kwargs):
 
+        self.jit = jit
+
         def get_cust_fct_args(custom_function):
             """Get args of custom_function
             Return:
@@ -1399,6 +1528,9 @@ class UserDefinedFunction(Function_Base):
                                                   **self.cust_fct_params
                                                   )
 
+        # Resolve how custom_function is called here, rather than each time it is called (see `UDF_Params_Context`)
+        self._instantiate_custom_function_call(custom_function)
+
         super().__init__(default_variable=default_variable,
                          function=custom_function,
                          params=params,
@@ -1408,24 +1540,66 @@ class UserDefinedFunction(Function_Base):
 
         self.functionOutputType = None
 
-    def function(self, **kwargs):
+    @property
+    def custom_function(self):
+        return self._custom_function
 
-        # Update value of parms in cust_fct_params
-        for param in self.cust_fct_params:
-            # First check for value passed in params as runtime param:
-            if PARAMS in kwargs and kwargs[PARAMS] is not None and param in kwargs[PARAMS]:
-                self.cust_fct_params[param] = kwargs[PARAMS][param]
-            else:
-            # Otherwise, get current value from ParameterState (in case it is being modulated by ControlSignal(s)
-                self.cust_fct_params[param] = self.get_current_function_param(param)
-        kwargs.update(self.cust_fct_params)
+    @custom_function.setter
+    def custom_function(self, value):
+        if self.paramValidationPref and hasattr(self, PARAMS_CURRENT):
+            self._assign_params(request_set={CUSTOM_FUNCTION: value}, context=ContextFlags.PROPERTY)
+        else:
+            self._custom_function = value
+            if hasattr(self, '_custom_function_call'):
+                self._instantiate_custom_function_call(value)
 
-        try:
-            # Try calling with full list of args (including context and params)
-            return self.custom_function(**kwargs)
-        except TypeError:
-            # Try calling with just variable and cust_fct_params
-            return self.custom_function(kwargs[VARIABLE], **self.cust_fct_params)
+    def _instantiate_custom_function_call(self, custom_function):
+        """Resolve, from its signature, how custom_function is called, and assign a closure that calls it directly
+
+        The closure takes the variable, the current values of the custom_function's params, and the params and
+        context (and any other keyword arguments) passed to the UDF's function, and passes to custom_function only
+        the arguments in its signature.
+        """
+        from inspect import Parameter, signature
+
+        arguments = list(signature(custom_function).parameters.values())
+        accepts_kwargs = any(arg.kind is Parameter.VAR_KEYWORD for arg in arguments)
+        pass_params = accepts_kwargs or any(arg.name == PARAMS for arg in arguments)
+        pass_context = accepts_kwargs or any(arg.name == CONTEXT for arg in arguments)
+        variable_name = arguments[0].name if arguments and arguments[0].kind is Parameter.KEYWORD_ONLY else None
+
+        fct = custom_function
+        if self.jit:
+            fct = _jit_compile(custom_function)
+
+        def call_custom_function(variable, cust_fct_params, params, context, kwargs):
+            if pass_params:
+                cust_fct_params[PARAMS] = params
+            if pass_context:
+                cust_fct_params[CONTEXT] = context
+            if accepts_kwargs:
+                cust_fct_params.update(kwargs)
+            if variable_name is not None:
+                cust_fct_params[variable_name] = variable
+                return fct(**cust_fct_params)
+            return fct(variable, **cust_fct_params)
+
+        self._custom_function_call = call_custom_function
+        self._cust_fct_param_names = tuple(self.cust_fct_params)
+
+    def function(self, variable=None, params=None, context=None, **kwargs):
+
+        # Get current values of params in cust_fct_params from their ParameterStates
+        #    (in case they are being modulated by ControlSignal(s)), unless passed in params as runtime params
+        param_names = self._cust_fct_param_names
+        cust_fct_params = dict(zip(param_names, self.get_current_function_params(*param_names)))
+        if params is not None:
+            for param in param_names:
+                if param in params:
+                    cust_fct_params[param] = params[param]
+        self.cust_fct_params.update(cust_fct_params)
+
+        return self._custom_function_call(variable, cust_fct_params, params, context, kwargs)
 
 
 # region **********************************  COMBINATION FUNCTIONS  ****************************************************
@@ -3579,7 +3753,7 @@ class OneHot(TransferFunction):  # ---------------------------------------------
             if not prob_dist.any():
                 return v
             cum_sum = np.cumsum(prob_dist)
-            random_value = np.random.uniform()
+            random_value = self.random_state.uniform()
             chosen_item = next(element for element in cum_sum if element > random_value)
             chosen_in_cum_sum = np.where(cum_sum == chosen_item, 1, 0)
             if self.mode is PROB:
@@ -4448,6 +4622,177 @@ def get_matrix(specification, rows=1, cols=1, context=None):
 
 # region ***********************************  INTEGRATOR FUNCTIONS *****************************************************
 
+def _is_scalar_value(param, value):
+    """Return True if param is a single number (or 0d array) equal to value"""
+    return np.ndim(param) == 0 and not callable(param) and param == value
+
+
+def _jit_compile(custom_function):
+    """Return a version of custom_function compiled by numba (when it is first called), if numba is installed
+
+    If numba is not installed, custom_function is returned;  if it cannot be compiled, a warning is issued on the
+    first call, and custom_function is used from then on.
+    """
+    try:
+        import numba
+    except ImportError:
+        return custom_function
+    try:
+        from numba.core.errors import NumbaError
+    except ImportError:
+        from numba.errors import NumbaError
+
+    compiled = numba.njit(custom_function)
+    fct = [compiled]
+
+    def call_compiled(*args, **kwargs):
+        try:
+            return fct[0](*args, **kwargs)
+        except NumbaError as e:
+            warnings.warn("{} could not be compiled by numba, so the Python function will be used ({})".
+                          format(getattr(custom_function, '__name__', custom_function), e))
+            fct[0] = custom_function
+            return custom_function(*args, **kwargs)
+
+    return call_compiled
+
+
+def _get_batch_function(fct):
+    """Return fct if it can generate an array of values in one call (i.e., takes a **size** argument), else None
+
+    This is the case for the `function <DistributionFunction.function>` and _execute methods of a DistributionFunction
+    (the latter is what is assigned when a DistributionFunction is specified as noise).
+    """
+    if (isinstance(getattr(fct, '__self__', None), DistributionFunction)
+            and getattr(fct, '__name__', None) in {'function', '_execute'}):
+        return fct
+    return None
+
+
+def _try_execute_param(param, var):
+    """Execute any callable(s) in param, generating a value for each element of var
+
+    If param is a single callable, it generates a value for every element of var;  if it is a list or array,
+    each callable item generates the value for the corresponding element.  A DistributionFunction generates the values
+    for each run of consecutive elements to which it is assigned in a single (vectorized) call;  other callables are
+    called once per element.  Either way, the values are drawn in the order of the elements.
+    """
+
+    # param is a list; if any element is callable, execute it
+    if isinstance(param, (np.ndarray, list)):
+        # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
+        param = np.atleast_2d(param)
+        if param.dtype != object:
+            return param
+        # Group consecutive elements with the same callable, so that a DistributionFunction is called once for each
+        #    group, while values are still drawn in the order of the elements
+        groups = []
+        for i in range(len(param)):
+            for j in range(len(param[i])):
+                if callable(param[i][j]):
+                    if groups and groups[-1][0] == param[i][j] and groups[-1][1][-1] == previous_index:
+                        groups[-1][1].append((i, j))
+                    else:
+                        groups.append((param[i][j], [(i, j)]))
+                previous_index = (i, j)
+        for fct, indices in groups:
+            batch_function = _get_batch_function(fct)
+            if batch_function is not None:
+                values = batch_function(size=len(indices))
+                for (i, j), value in zip(indices, values):
+                    param[i][j] = value
+            else:
+                for i, j in indices:
+                    param[i][j] = fct()
+
+    # param is one function
+    elif callable(param):
+        # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
+        var = np.atleast_2d(var)
+        batch_function = _get_batch_function(param)
+        if batch_function is not None and var.dtype != object:
+            param = batch_function(size=var.shape)
+        else:
+            new_param = []
+            for row in var:
+                new_row = []
+                for item in row:
+                    new_row.append(param())
+                new_param.append(new_row)
+            param = new_param
+
+    return param
+
+
+# Butcher tableau of the Dormand-Prince 5(4) method; the 5th order weights are the last row of _DOPRI_A
+_DOPRI_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DOPRI_A = [[],
+            [1/5],
+            [3/40, 9/40],
+            [44/45, -56/15, 32/9],
+            [19372/6561, -25360/2187, 64448/6561, -212/729],
+            [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+            [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]]
+_DOPRI_ERROR = np.array([35/384 - 5179/57600,
+                         0,
+                         500/1113 - 7571/16695,
+                         125/192 - 393/640,
+                         -2187/6784 + 92097/339200,
+                         11/84 - 187/2100,
+                         -1/40])
+
+
+def _dormand_prince(derivative, time, value, end_time, tolerance, step_size=None, max_steps=100000):
+    """Integrate dvalue/dt = derivative(time, value) from time to end_time with adaptive Dormand-Prince 5(4) steps
+
+    The step size is chosen so that the local error estimate of each step is within **tolerance** (used as both the
+    absolute and the relative tolerance, elementwise).  **step_size** is the size of the first step attempted;  if it
+    is None, end_time - time is tried first.  Returns the value at end_time, and the step size to try first on the
+    next call.
+    """
+    value = np.asarray(value, dtype=float)
+    remaining = end_time - time
+    if remaining <= 0:
+        return value, step_size
+    if step_size is None or step_size <= 0:
+        step_size = remaining
+
+    slopes = [derivative(time, value)]
+    for num_steps in range(max_steps):
+        step = min(step_size, end_time - time)
+        for i in range(1, 7):
+            stage_value = value + step * sum(a * k for a, k in zip(_DOPRI_A[i], slopes) if a)
+            stage_slope = derivative(time + _DOPRI_C[i] * step, stage_value)
+            if i < len(slopes):
+                slopes[i] = stage_slope
+            else:
+                slopes.append(stage_slope)
+        # stage_value of the last stage is the 5th order solution
+        new_value = stage_value
+        error = step * sum(e * k for e, k in zip(_DOPRI_ERROR, slopes) if e)
+        scale = tolerance + tolerance * np.maximum(np.abs(value), np.abs(new_value))
+        error_ratio = np.max(np.abs(error) / scale) if error.size else 0.0
+
+        if error_ratio <= 1:
+            time += step
+            value = new_value
+            # First Same As Last: the slope at the end of this step begins the next one
+            slopes = [slopes[6]]
+            if time >= end_time or np.isclose(time, end_time, rtol=0, atol=EPSILON * max(1, abs(end_time))):
+                if step == step_size:
+                    step_size = step * min(5.0, 0.9 * error_ratio ** -0.2) if error_ratio > 0 else 5.0 * step
+                return value, step_size
+            step_size = step * min(5.0, 0.9 * error_ratio ** -0.2) if error_ratio > 0 else 5.0 * step
+        else:
+            step_size = step * max(0.2, 0.9 * error_ratio ** -0.2)
+            slopes = slopes[:1]
+            if time + step_size == time:
+                raise FunctionError("Step size required to integrate to within tolerance ({}) fell below the "
+                                    "precision of the time ({})".format(tolerance, time))
+
+    raise FunctionError("Adaptive integration did not reach time {} within {} steps".format(end_time, max_steps))
+
+
 #  Integrator
 #  DDM_BogaczEtAl
 #  DDM_NavarroAndFuss
@@ -4568,6 +4913,9 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
 
     componentName = INTEGRATOR_FUNCTION
 
+    stateful_attributes = ['previous_value']
+    previous_value = _ExecutionAttribute('previous_value')
+
     paramClassDefaults = Function_Base.paramClassDefaults.copy()
     # paramClassDefaults.update({INITIALIZER: ClassDefaults.variable})
     paramClassDefaults.update({
@@ -4765,27 +5113,7 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
 
 
     def _try_execute_param(self, param, var):
-
-        # param is a list; if any element is callable, execute it
-        if isinstance(param, (np.ndarray, list)):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            param = np.atleast_2d(param)
-            for i in range(len(param)):
-                for j in range(len(param[i])):
-                    if callable(param[i][j]):
-                        param[i][j] = param[i][j]()
-        # param is one function
-        elif callable(param):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
-
-        return param
+        return _try_execute_param(param, var)
 
     def _euler(self, previous_value, previous_time, slope, time_step_size):
 
@@ -5905,6 +6233,9 @@ class DriftDiffusionIntegrator(
 
     componentName = DRIFT_DIFFUSION_INTEGRATOR_FUNCTION
 
+    stateful_attributes = ['previous_value', 'previous_time']
+    previous_time = _ExecutionAttribute('previous_time')
+
     multiplicative_param = RATE
     additive_param = OFFSET
 
@@ -5997,8 +6328,9 @@ class DriftDiffusionIntegrator(
 
         previous_value = np.atleast_2d(self.previous_value)
 
+        # Draw an independent sample for each element of the integral in a single call
         value = previous_value + rate * variable * time_step_size  \
-                + np.sqrt(time_step_size * noise) * np.random.normal()
+                + np.sqrt(time_step_size * noise) * self.random_state.normal(size=previous_value.shape)
 
         if np.all(abs(value) < threshold):
             adjusted_value = value + offset
@@ -6057,6 +6389,8 @@ class OrnsteinUhlenbeckIntegrator(
         t0=0.0,                         \
         decay=1.0,                      \
         initializer=0.0,                \
+        integration_method="EULER",     \
+        tolerance=1e-6,                 \
         params=None,                    \
         owner=None,                     \
         prefs=None,                     \
@@ -6093,6 +6427,14 @@ class OrnsteinUhlenbeckIntegrator(
         `default_variable <OrnsteinUhlenbeckIntegrator.default_variable>` (see `initializer
         <OrnsteinUhlenbeckIntegrator.initializer>` for details).
 
+    integration_method : str : default "EULER"
+        specifies how the drift is integrated over each `time_step_size <OrnsteinUhlenbeckIntegrator.time_step_size>`:
+        "EULER" (a single Forward Euler step) or "RK45" (Dormand-Prince 5(4) steps of adaptive size; see
+        `integration_method <OrnsteinUhlenbeckIntegrator.integration_method>`).
+
+    tolerance : float : default 1e-6
+        specifies the absolute and relative error allowed in each step when **integration_method** is "RK45".
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -6139,6 +6481,21 @@ class OrnsteinUhlenbeckIntegrator(
         If initializer is a list or array, it must be the same length as `variable
         <OrnsteinUhlenbeckIntegrator.default_variable>`.
 
+    integration_method : str
+        the method used to integrate the drift over each `time_step_size <OrnsteinUhlenbeckIntegrator.time_step_size>`.
+        If it is "RK45", as many Dormand-Prince steps are taken as are needed to keep the error of each within
+        `tolerance <OrnsteinUhlenbeckIntegrator.tolerance>`, so that `time_step_size
+        <OrnsteinUhlenbeckIntegrator.time_step_size>` can be set to the entire interval to be simulated and
+        integrated in a single execution.  In either case, `noise <OrnsteinUhlenbeckIntegrator.noise>` is sampled
+        once per execution.  For "EULER", its variance is `noise <OrnsteinUhlenbeckIntegrator.noise>` *
+        `time_step_size <OrnsteinUhlenbeckIntegrator.time_step_size>`;  for "RK45", it is the exact variance of the
+        Ornstein-Uhlenbeck process over `time_step_size <OrnsteinUhlenbeckIntegrator.time_step_size>`,
+        :math:`noise \\frac{e^{2\\, decay\\, time\\_step\\_size} - 1}{2\\, decay}`.
+
+    tolerance : float
+        the absolute and relative error allowed in each step when `integration_method
+        <OrnsteinUhlenbeckIntegrator.integration_method>` is "RK45".
+
     previous_value : 1d np.array : default ClassDefaults.variable
         stores previous value with which `variable <OrnsteinUhlenbeckIntegrator.variable>` is integrated.
 
@@ -6161,6 +6518,10 @@ class OrnsteinUhlenbeckIntegrator(
 
     componentName = ORNSTEIN_UHLENBECK_INTEGRATOR_FUNCTION
 
+    stateful_attributes = ['previous_value', 'previous_time', '_adaptive_step_size']
+    previous_time = _ExecutionAttribute('previous_time')
+    _adaptive_step_size = _ExecutionAttribute('_adaptive_step_size')
+
     multiplicative_param = RATE
     additive_param = OFFSET
 
@@ -6181,6 +6542,8 @@ class OrnsteinUhlenbeckIntegrator(
                  t0=0.0,
                  decay=1.0,
                  initializer=None,
+                 integration_method="EULER",
+                 tolerance=1e-6,
                  params: tc.optional(dict) = None,
                  owner=None,
                  prefs: is_pref_set = None):
@@ -6193,10 +6556,13 @@ class OrnsteinUhlenbeckIntegrator(
                                                   t0=t0,
                                                   noise=noise,
                                                   offset=offset,
+                                                  integration_method=integration_method,
+                                                  tolerance=tolerance,
                                                   params=params)
 
         # Assign here as default, for use in initialization of function
         self.previous_value = initializer
+        self._adaptive_step_size = None
 
         super().__init__(
             default_variable=default_variable,
@@ -6215,6 +6581,17 @@ class OrnsteinUhlenbeckIntegrator(
                 "Invalid noise parameter for {}. OrnsteinUhlenbeckIntegrator requires noise parameter to be a float. "
                 "Noise parameter is used to construct the standard DDM noise distribution".format(self.name))
 
+    def _validate_params(self, request_set, target_set=None, context=None):
+        super()._validate_params(request_set=request_set,
+                                 target_set=target_set,
+                                 context=context)
+        if self.integration_method not in {"EULER", "RK45"}:
+            raise FunctionError("Invalid integration method ({}) selected for {}. Choose 'EULER' or 'RK45'".
+                                format(self.integration_method, self.name))
+        if self.tolerance <= 0:
+            raise FunctionError("tolerance parameter ({}) of {} must be greater than 0".
+                                format(self.tolerance, self.name))
+
     def function(self,
                  variable=None,
                  params=None,
@@ -6252,12 +6629,31 @@ class OrnsteinUhlenbeckIntegrator(
         time_step_size = self.get_current_function_param(TIME_STEP_SIZE)
         decay = self.get_current_function_param(DECAY)
         noise = self.get_current_function_param(NOISE)
+        integration_method = self.get_current_function_param("integration_method")
 
         previous_value = np.atleast_2d(self.previous_value)
 
         # dx = (lambda*x + A)dt + c*dW
-        value = previous_value + (decay * previous_value - rate * variable) * time_step_size + np.sqrt(
-            time_step_size * noise) * np.random.normal()
+        if integration_method == "RK45":
+            drift = rate * variable
+            # the drift does not depend on time, so each execution is integrated from 0 to time_step_size
+            value, step_size = _dormand_prince(lambda time, x: decay * x - drift,
+                                               0,
+                                               previous_value,
+                                               time_step_size,
+                                               self.get_current_function_param("tolerance"),
+                                               step_size=self._adaptive_step_size)
+            # the exact variance of the noise accumulated over time_step_size, during which it also decays
+            decay = np.asarray(decay, dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                noise_variance = np.where(decay == 0,
+                                          time_step_size * noise,
+                                          noise * np.expm1(2 * decay * time_step_size) / (2 * decay))
+        else:
+            value = previous_value + (decay * previous_value - rate * variable) * time_step_size
+            step_size = None
+            noise_variance = time_step_size * noise
+        value = value + np.sqrt(noise_variance) * self.random_state.normal(size=previous_value.shape)
 
         # If this NOT an initialization run, update the old value and time
         # If it IS an initialization run, leave as is
@@ -6267,6 +6663,8 @@ class OrnsteinUhlenbeckIntegrator(
         if self.context.initialization_status != ContextFlags.INITIALIZING:
             self.previous_value = adjusted_value
             self.previous_time += time_step_size
+            if step_size is not None:
+                self._adaptive_step_size = step_size
 
         return adjusted_value
 
@@ -6295,6 +6693,7 @@ class OrnsteinUhlenbeckIntegrator(
         self.value = new_previous_value
         self.previous_value = new_previous_value
         self.previous_time = new_previous_time
+        self._adaptive_step_size = None
         return self.value
 
 class FHNIntegrator(Integrator):  # --------------------------------------------------------------------------------
@@ -6322,6 +6721,7 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
         uncorrelated_activity=0.0       \
         time_constant_w = 12.5,         \
         integration_method="RK4"        \
+        tolerance=1e-6,                 \
         params=None,                    \
         owner=None,                     \
         prefs=None,                     \
@@ -6329,8 +6729,8 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
 
     .. _FHNIntegrator:
 
-    The FHN Integrator function in PsyNeuLink implements the Fitzhugh-Nagumo model using a choice of Euler or 4th Order
-    Runge-Kutta numerical integration.
+    The FHN Integrator function in PsyNeuLink implements the Fitzhugh-Nagumo model using a choice of Euler, 4th Order
+    Runge-Kutta, or adaptive-step Dormand-Prince numerical integration.
 
     In order to support several common representations of the model, the FHNIntegrator includes many parameters, some of
     which would not be sensible to use in combination. The equations of the Fitzhugh-Nagumo model are expressed below in
@@ -6559,8 +6959,11 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
         scaling factor on the dv/dt equation
 
     integration_method: str : default "RK4"
-        selects the numerical integration method. Currently, the choices are: "RK4" (4th Order Runge-Kutta) or "EULER"
-        (Forward Euler)
+        selects the numerical integration method. Currently, the choices are: "RK4" (4th Order Runge-Kutta), "EULER"
+        (Forward Euler) or "RK45" (Dormand-Prince 5(4) with adaptive step size;  see `FHNIntegrator_Adaptive`).
+
+    tolerance : float : default 1e-6
+        specifies the absolute and relative error allowed in each step when **integration_method** is "RK45".
 
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
@@ -6664,14 +7067,39 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
     time_constant_w : float : default 12.5
         scaling factor on the dv/dt equation
 
+    integration_method : str
+        the numerical integration method used:  "RK4", "EULER" or "RK45".
+
+    tolerance : float
+        the absolute and relative error allowed in each step when `integration_method
+        <FHNIntegrator.integration_method>` is "RK45".
+
     prefs : PreferenceSet or specification dict : default Function.classPreferences
         the `PreferenceSet` for the Function (see `prefs <Function_Base.prefs>` for details).
+
+    .. _FHNIntegrator_Adaptive:
+
+    **Adaptive Integration**
+
+    When `integration_method <FHNIntegrator.integration_method>` is "RK45", each execution of the function advances
+    v and w by `time_step_size <FHNIntegrator.time_step_size>` using as many Dormand-Prince steps as are needed to keep
+    the error of each within `tolerance <FHNIntegrator.tolerance>`, with the size of each step adapted to the
+    trajectory.  `time_step_size <FHNIntegrator.time_step_size>` can therefore be set to the entire interval to be
+    simulated (e.g., the duration of a `TRIAL`), so that it is integrated in a single execution rather than in
+    many fixed-size steps.  Unlike "RK4" and "EULER", which hold the coupling terms (w in dv/dt and v in dw/dt) at
+    their values from the previous execution, "RK45" integrates v and w jointly.
     """
 
     MODE = 'mode'
 
     componentName = FHN_INTEGRATOR_FUNCTION
 
+    stateful_attributes = ['previous_v', 'previous_w', 'previous_time', '_adaptive_step_size']
+    previous_v = _ExecutionAttribute('previous_v')
+    previous_w = _ExecutionAttribute('previous_w')
+    previous_time = _ExecutionAttribute('previous_time')
+    _adaptive_step_size = _ExecutionAttribute('_adaptive_step_size')
+
     class ClassDefaults(Integrator.ClassDefaults):
         variable = np.array([1.0])
         initializer = np.array([1.0])
@@ -6712,6 +7140,7 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
                  mode=1.0,
                  uncorrelated_activity=0.0,
                  integration_method="RK4",
+                 tolerance=1e-6,
                  params: tc.optional(dict)=None,
                  owner=None,
                  prefs: is_pref_set = None):
@@ -6738,6 +7167,7 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
                                                   mode=mode,
                                                   uncorrelated_activity=uncorrelated_activity,
                                                   integration_method=integration_method,
+                                                  tolerance=tolerance,
                                                   time_constant_w=time_constant_w,
                                                   params=params,
                                                   )
@@ -6745,6 +7175,7 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
         self.previous_v = self.initial_v
         self.previous_w = self.initial_w
         self.previous_time = self.t_0
+        self._adaptive_step_size = None
 
         super().__init__(
             default_variable=default_variable,
@@ -6759,9 +7190,12 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
         super()._validate_params(request_set=request_set,
                                  target_set=target_set,
                                  context=context)
-        if self.integration_method not in {"RK4", "EULER"}:
-            raise FunctionError("Invalid integration method ({}) selected for {}. Choose 'RK4' or 'EULER'".
+        if self.integration_method not in {"RK4", "EULER", "RK45"}:
+            raise FunctionError("Invalid integration method ({}) selected for {}. Choose 'RK4', 'EULER' or 'RK45'".
                                 format(self.integration_method, self.name))
+        if self.tolerance <= 0:
+            raise FunctionError("tolerance parameter ({}) of {} must be greater than 0".
+                                format(self.tolerance, self.name))
 
     def _euler_FHN(self, variable, previous_value_v, previous_value_w, previous_time, slope_v, slope_w, time_step_size, a_v,
                    threshold, b_v, c_v, d_v, e_v, f_v, time_constant_v, mode, a_w, b_w, c_w, uncorrelated_activity,
@@ -6918,6 +7352,25 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
 
         return new_v, new_w
 
+    def _dormand_prince_FHN(self, variable, previous_value_v, previous_value_w, previous_time, time_step_size, a_v,
+                            threshold, b_v, c_v, d_v, e_v, f_v, time_constant_v, mode, a_w, b_w, c_w,
+                            uncorrelated_activity, time_constant_w, tolerance):
+
+        def derivative(time, value):
+            v, w = value
+            return np.array([(a_v*(v**3) + (1+threshold)*b_v*(v**2) + (-threshold)*c_v*v + d_v
+                              + e_v*w + f_v*variable)/time_constant_v,
+                             (mode*a_w*v + b_w*w + c_w + (1-mode)*uncorrelated_activity)/time_constant_w])
+
+        value = np.array(np.broadcast_arrays(previous_value_v, previous_value_w, variable)[:2], dtype=float)
+        value, step_size = _dormand_prince(derivative,
+                                           previous_time,
+                                           value,
+                                           previous_time + time_step_size,
+                                           tolerance,
+                                           step_size=self._adaptive_step_size)
+        return value[0], value[1], step_size
+
     def dv_dt(self, variable, time, v, w, a_v, threshold, b_v, c_v, d_v, e_v, f_v, time_constant_v):
 
         val= (a_v*(v**3) + (1+threshold)*b_v*(v**2) + (-threshold)*c_v*v + d_v
@@ -6979,22 +7432,13 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
 
         """
 
-        a_v = self.get_current_function_param("a_v")
-        b_v = self.get_current_function_param("b_v")
-        c_v = self.get_current_function_param("c_v")
-        d_v = self.get_current_function_param("d_v")
-        e_v = self.get_current_function_param("e_v")
-        f_v = self.get_current_function_param("f_v")
-        time_constant_v = self.get_current_function_param("time_constant_v")
-        threshold = self.get_current_function_param("threshold")
-        a_w = self.get_current_function_param("a_w")
-        b_w = self.get_current_function_param("b_w")
-        c_w = self.get_current_function_param("c_w")
-        uncorrelated_activity = self.get_current_function_param("uncorrelated_activity")
-        time_constant_w = self.get_current_function_param("time_constant_w")
-        mode = self.get_current_function_param("mode")
-        integration_method = self.get_current_function_param("integration_method")
-        time_step_size = self.get_current_function_param(TIME_STEP_SIZE)
+        (a_v, b_v, c_v, d_v, e_v, f_v, time_constant_v, threshold,
+         a_w, b_w, c_w, uncorrelated_activity, time_constant_w,
+         mode, integration_method, time_step_size) = self.get_current_function_params(
+            "a_v", "b_v", "c_v", "d_v", "e_v", "f_v", "time_constant_v", "threshold",
+            "a_w", "b_w", "c_w", "uncorrelated_activity", "time_constant_w",
+            "mode", "integration_method", TIME_STEP_SIZE)
+        step_size = None
 
         if integration_method == "RK4":
             approximate_values = self._runge_kutta_4_FHN(variable,
@@ -7042,6 +7486,29 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
                                                  c_w,
                                                  uncorrelated_activity,
                                                  time_constant_w)
+
+        elif integration_method == "RK45":
+            *approximate_values, step_size = \
+                self._dormand_prince_FHN(variable,
+                                         self.previous_v,
+                                         self.previous_w,
+                                         self.previous_time,
+                                         time_step_size,
+                                         a_v,
+                                         threshold,
+                                         b_v,
+                                         c_v,
+                                         d_v,
+                                         e_v,
+                                         f_v,
+                                         time_constant_v,
+                                         mode,
+                                         a_w,
+                                         b_w,
+                                         c_w,
+                                         uncorrelated_activity,
+                                         time_constant_w,
+                                         self.get_current_function_param("tolerance"))
         else:
             raise FunctionError("Invalid integration method ({}) selected for {}".
                                 format(integration_method, self.name))
@@ -7050,6 +7517,8 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
             self.previous_v = approximate_values[0]
             self.previous_w = approximate_values[1]
             self.previous_time += time_step_size
+            if step_size is not None:
+                self._adaptive_step_size = step_size
 
         return self.previous_v, self.previous_w, self.previous_time
 
@@ -7087,6 +7556,7 @@ class FHNIntegrator(Integrator):  # --------------------------------------------
         self._initial_w = new_previous_w
         self.previous_w = new_previous_w
         self.previous_time = new_previous_time
+        self._adaptive_step_size = None
         self.value = new_previous_v, new_previous_w, new_previous_time
         return [new_previous_v], [new_previous_w], [new_previous_time]
 
@@ -7226,6 +7696,11 @@ class AccumulatorIntegrator(Integrator):  # ------------------------------------
     multiplicative_param = RATE
     additive_param = INCREMENT
 
+    # if True, increment is added in place to a previous_value that was allocated by the function itself
+    #    (set for the MATRIX ParameterState of a MappingProjection)
+    _increment_in_place = False
+    _allocated_value = None
+
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
@@ -7378,7 +7853,25 @@ class AccumulatorIntegrator(Integrator):  # ------------------------------------
 
         previous_value = np.atleast_2d(self.previous_value)
 
-        value = previous_value * rate + noise + increment
+        # Avoid computing (and allocating) terms that have no effect, as is the case for the MATRIX ParameterState
+        #    of a MappingProjection (rate 1 and no noise), which is only incremented when it is learning
+        value = previous_value
+        if not _is_scalar_value(rate, 1):
+            value = value * rate
+        if not _is_scalar_value(noise, 0):
+            value = value + noise
+        if not _is_scalar_value(increment, 0):
+            # previous_value can be updated in place only if no one else holds it (e.g., as the initializer), and
+            #    outside of an execution_context block (in which it may be shared with other executions)
+            if (self._increment_in_place
+                    and value is self._allocated_value
+                    and _get_execution_id() is None
+                    and self.context.initialization_status != ContextFlags.INITIALIZING
+                    and np.shape(increment) in {(), value.shape}):
+                value += increment
+            else:
+                value = value + increment
+                self._allocated_value = value
 
         # If this NOT an initialization run, update the old value
         # If it IS an initialization run, leave as is
@@ -7535,6 +8028,10 @@ class AGTUtilityIntegrator(Integrator):  # -------------------------------------
 
     componentName = UTILITY_INTEGRATOR_FUNCTION
 
+    stateful_attributes = ['previous_short_term_utility', 'previous_long_term_utility']
+    previous_short_term_utility = _ExecutionAttribute('previous_short_term_utility')
+    previous_long_term_utility = _ExecutionAttribute('previous_long_term_utility')
+
     multiplicative_param = RATE
     additive_param = OFFSET
 
@@ -8319,6 +8816,14 @@ class NavarroAndFuss(IntegratorFunction):
 # region ************************************   DISTRIBUTION FUNCTIONS   ***********************************************
 
 class DistributionFunction(Function_Base):
+    """Abstract class of `Function` that returns random samples from a distribution.
+
+    The `function <DistributionFunction.function>` of every DistributionFunction takes an optional **size** argument;
+    if it is specified, an array of that shape is returned, containing independent samples drawn in a single call to
+    the Function's `random_state <Component.random_state>` (this is used, for example, to generate the `noise
+    <Integrator.noise>` for all of the elements of an Integrator's variable at once);  otherwise, a single sample is
+    returned.
+    """
     componentType = DIST_FUNCTION_TYPE
 
 
@@ -8421,14 +8926,15 @@ class NormalDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
 
-        result = np.random.normal(mean, standard_deviation)
+        result = self.random_state.normal(mean, standard_deviation, size=size)
 
         return result
 
@@ -8539,7 +9045,8 @@ class UniformToNormalDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
 
         try:
             from scipy.special import erfinv
@@ -8552,7 +9059,7 @@ class UniformToNormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
 
-        sample = np.random.rand(1)[0]
+        sample = self.random_state.random_sample(size)
         return ((np.sqrt(2) * erfinv(2 * sample - 1)) * standard_deviation) + mean
 
 class ExponentialDist(DistributionFunction):
@@ -8635,12 +9142,13 @@ class ExponentialDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         beta = self.get_current_function_param(BETA)
-        result = np.random.exponential(beta)
+        result = self.random_state.exponential(beta, size=size)
 
         return result
 
@@ -8734,13 +9242,14 @@ class UniformDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         low = self.get_current_function_param(LOW)
         high = self.get_current_function_param(HIGH)
-        result = np.random.uniform(low, high)
+        result = self.random_state.uniform(low, high, size=size)
 
         return result
 
@@ -8835,14 +9344,15 @@ class GammaDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         scale = self.get_current_function_param(SCALE)
         dist_shape = self.get_current_function_param(DIST_SHAPE)
 
-        result = np.random.gamma(dist_shape, scale)
+        result = self.random_state.gamma(dist_shape, scale, size=size)
 
         return result
 
@@ -8935,14 +9445,15 @@ class WaldDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         scale = self.get_current_function_param(SCALE)
         mean = self.get_current_function_param(DIST_MEAN)
 
-        result = np.random.wald(mean, scale)
+        result = self.random_state.wald(mean, scale, size=size)
 
         return result
 
@@ -9783,18 +10294,16 @@ class Hebbian(LearningFunction):  # --------------------------------------------
         if self.learning_rate_dim == 1:
             variable = variable * learning_rate
 
-        # Generate the column array from the variable
-        # col = variable.reshape(len(variable),1)
-        col = np.array(np.matrix(variable).T)
-
-        # Calculate weight chhange matrix
-        weight_change_matrix = variable * col
+        # Calculate weight change matrix (the outer product of variable with itself), and zero and scale it in place
+        #    rather than in copies of it
+        size = len(variable)
+        weight_change_matrix = np.multiply.outer(variable, variable, out=np.empty((size, size)))
         # Zero diagonals (i.e., don't allow correlation of a unit with itself to be included)
-        weight_change_matrix = weight_change_matrix * (1-np.identity(len(variable)))
+        np.fill_diagonal(weight_change_matrix, 0)
 
         # If learning_rate is scalar or 2d, multiply it by the weight change matrix
         if self.learning_rate_dim in {0, 2}:
-            weight_change_matrix = weight_change_matrix * learning_rate
+            weight_change_matrix *= learning_rate
 
         return weight_change_matrix
 
@@ -10104,6 +10613,11 @@ class BackPropagation(LearningFunction):
     The BackPropagation `function <BackPropagation.function>` returns the *weight_change_matrix* as well as
     :math:`\\frac{\delta E}{\delta W}`.
 
+    The `batch_function <BackPropagation.batch_function>` method computes the same quantities for a minibatch of
+    trials, in which the values for each trial are stacked as the rows of 2d arrays;  the *weight_change_matrix* it
+    returns is the sum of the weight changes for the individual trials, computed as a single matrix product of the
+    (transposed) activation_inputs and :math:`\\frac{\delta E}{\delta W}` (see `System_Learning_Minibatch`).
+
     Arguments
     ---------
 
@@ -10446,6 +10960,56 @@ class BackPropagation(LearningFunction):
 
         return [weight_change_matrix, dE_dW]
 
+    def batch_function(self, activation_input, activation_output, error_signal, error_matrix):
+        """Calculate the summed weight change matrix for a minibatch of trials.
+
+        Arguments
+        ---------
+
+        activation_input : 2d np.array
+            `activation_input <BackPropagation.activation_input>` for each trial in the minibatch (one per row).
+
+        activation_output : 2d np.array
+            `activation_output <BackPropagation.activation_output>` for each trial in the minibatch (one per row).
+
+        error_signal : 2d np.array
+            `error_signal <BackPropagation.error_signal>` for each trial in the minibatch (one per row).
+
+        error_matrix : 2d np.array or ParameterState
+            matrix of weights that were used to generate the error_signals from the activation_outputs.
+
+        Returns
+        -------
+
+        weight change matrix : 2d np.array
+            the sum of the modifications to make to the matrix for each trial in the minibatch.
+
+        weighted error signals : 2d np.array
+            :math:`\\frac{\delta E}{\delta W}` for each trial in the minibatch (one per row).
+
+        """
+        from psyneulink.components.states.parameterstate import ParameterState
+        if isinstance(error_matrix, ParameterState):
+            error_matrix = error_matrix.value
+
+        if self.learning_rate is None:
+            learning_rate = self.default_learning_rate
+        else:
+            learning_rate = self.learning_rate
+
+        activation_input = np.atleast_2d(activation_input)
+        activation_output = np.atleast_2d(activation_output)
+
+        # Each row is the derivative of the error with respect to the weights for one trial
+        dE_dA = np.dot(np.atleast_2d(error_signal), np.transpose(error_matrix))
+        dA_dW = self.activation_derivative_fct(input=activation_input, output=activation_output)
+        dE_dW = dE_dA * dA_dW
+
+        # Summed over trials, the outer products of activation_input and dE_dW are a single matrix product
+        weight_change_matrix = learning_rate * np.dot(activation_input.T, dE_dW)
+
+        return [weight_change_matrix, dE_dW]
+
 
 class TDLearning(Reinforcement):
     """
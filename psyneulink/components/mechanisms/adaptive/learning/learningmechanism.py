@@ -1211,6 +1211,50 @@ class LearningMechanism(AdaptiveMechanism_Base):
         self.value = [self.learning_signal, self.error_signal]
         return self.value
 
+    def _execute_batch(self, activation_input, activation_output, error_signals, context=None):
+        """Execute LearningMechanism function for a minibatch of trials and return the weighted error_signals
+
+        activation_input, activation_output and each item of error_signals are 2d arrays with one row per trial;
+        error_signals must be in the same order as the LearningMechanism's `error_signal_input_states`.
+
+        The summed learning_signal is assigned to `learning_signal <LearningMechanism.learning_signal>`, and the
+        error_signal for the last trial in the minibatch to `error_signal <LearningMechanism.error_signal>`,
+        and the LearningMechanism's OutputStates are updated, so that its LearningProjections can be executed
+        as usual.
+
+        Returns
+        -------
+
+        2d np.array : summed weighted error_signals, one row per trial
+
+        """
+        error_matrices = [self.error_matrices[self.input_states.index(s) - ERROR_OUTPUT_INDEX]
+                          for s in self.error_signal_input_states]
+
+        # Compute learning_signal for each error_signal (and corresponding error-Matrix) and sum them
+        summed_learning_signal = summed_error_signal = None
+        for error_signal_input, error_matrix in zip(error_signals, error_matrices):
+            learning_signal, error_signal = self.function_object.batch_function(activation_input,
+                                                                                activation_output,
+                                                                                error_signal_input,
+                                                                                error_matrix)
+            if summed_learning_signal is None:
+                summed_learning_signal = learning_signal
+                summed_error_signal = error_signal
+            else:
+                summed_learning_signal += learning_signal
+                summed_error_signal += error_signal
+
+        self.learning_signal = summed_learning_signal
+        self.error_signal = summed_error_signal[-1]
+
+        if self.reportOutputPref:
+            print("\n{} weight change matrix: \n{}\n".format(self.name, self.learning_signal))
+
+        self.value = [self.learning_signal, self.error_signal]
+        self._update_output_states(context=context)
+        return summed_error_signal
+
     @property
     def learning_enabled(self):
         try:
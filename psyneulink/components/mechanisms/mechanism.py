@@ -868,7 +868,7 @@ from psyneulink.components.states.modulatorysignals.modulatorysignal import _is_
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import REMOVE_STATES, _parse_state_spec
-from psyneulink.globals.context import ContextFlags
+from psyneulink.globals.context import ContextFlags, _ExecutionAttribute
 from psyneulink.globals.keywords import \
     CHANGED, COMMAND_LINE, EVC_SIMULATION, EXECUTING, EXECUTION_PHASE, FUNCTION, FUNCTION_PARAMS, \
     INITIALIZATION_STATUS, INITIALIZING, INIT_FUNCTION_METHOD_ONLY, INIT__EXECUTE__METHOD_ONLY, \
@@ -1220,6 +1220,10 @@ class Mechanism_Base(Mechanism):
     className = componentCategory
     suffix = " " + className
 
+    # Stored separately for each execution (see Context_Execution_Values)
+    _execution_id = _ExecutionAttribute('_execution_id')
+    _is_finished = _ExecutionAttribute('_is_finished')
+
     class ClassDefaults(Mechanism.ClassDefaults):
         variable = np.array([[0]])
         function = Linear
@@ -1253,6 +1257,11 @@ class Mechanism_Base(Mechanism):
     #    (such as OutputStates)
     initMethod = INIT__EXECUTE__METHOD_ONLY
 
+    # Assigned by System when it is instantiated (see _build_steady_state_execute);
+    #    used by execute in place of its full sequence when the Mechanism is executed by the System
+    #    with no runtime_params and reporting off
+    _steady_state_execute = None
+
     # Note:  the following enforce encoding as 2D np.ndarrays,
     #        to accomodate multiple States:  one 1D np.ndarray per state
     variableEncodingDim = 2
@@ -2087,6 +2096,19 @@ class Mechanism_Base(Mechanism):
         context = context or ContextFlags.COMMAND_LINE
         if not self.context.source or context & ContextFlags.COMMAND_LINE:
             self.context.source = ContextFlags.COMMAND_LINE
+
+        # Use steady-state path if it has been built (by a System) and nothing it skips is needed for this execution
+        if (self._steady_state_execute is not None
+                and input is None
+                and not runtime_params
+                and not self.runtime_params_in_use
+                and self.context.initialization_status == ContextFlags.INITIALIZED
+                and self.context.execution_phase & (ContextFlags.PROCESSING |
+                                                    ContextFlags.LEARNING |
+                                                    ContextFlags.SIMULATION)
+                and not self.prefs.reportOutputPref):
+            return self._steady_state_execute(context=context)
+
         if self.context.initialization_status == ContextFlags.INITIALIZED:
             self.context.string = "{} EXECUTING {}: {}".format(context.name,self.name,
                                                                ContextFlags._get_context_string(
@@ -2209,27 +2231,7 @@ class Mechanism_Base(Mechanism):
             runtime_params=runtime_params,
             context=context
         )
-
-        # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
-        #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
-        #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
-        if (isinstance(value, list) and
-            (all(isinstance(item, np.ndarray) for item in value) and
-                all(
-                        all(item.shape[i]==value[0].shape[0]
-                            for i in range(len(item.shape)))
-                        for item in value))):
-                pass
-        else:
-            converted_to_2d = np.atleast_2d(value)
-            # If return_value is a list of heterogenous elements, return as is
-            #     (satisfies requirement that return_value be an array of possibly multidimensional values)
-            if converted_to_2d.dtype == object:
-                pass
-            # Otherwise, return value converted to 2d np.array
-            else:
-                # return converted_to_2d
-                value = converted_to_2d
+        value = self._convert_value_to_2d(value)
 
         # Set status based on whether self.value has changed
         self.status = value
@@ -2250,6 +2252,69 @@ class Mechanism_Base(Mechanism):
 
         return self.value
 
+    def _convert_value_to_2d(self, value):
+        """Return value as 2d np.array unless it is a list of arrays or has heterogenous elements"""
+
+        # Already 2d (the usual case), so no need for the tests below
+        if isinstance(value, np.ndarray) and value.ndim == 2 and value.dtype != object:
+            return value
+
+        # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
+        #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
+        #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
+        if (isinstance(value, list) and
+            (all(isinstance(item, np.ndarray) for item in value) and
+                all(
+                        all(item.shape[i]==value[0].shape[0]
+                            for i in range(len(item.shape)))
+                        for item in value))):
+                return value
+
+        converted_to_2d = np.atleast_2d(value)
+        # If return_value is a list of heterogenous elements, return as is
+        #     (satisfies requirement that return_value be an array of possibly multidimensional values)
+        if converted_to_2d.dtype == object:
+            return value
+        # Otherwise, return value converted to 2d np.array
+        return converted_to_2d
+
+    def _build_steady_state_execute(self):
+        """Assign _steady_state_execute if the Mechanism receives its input from Projections
+
+        Called by System once it has been instantiated;  a Mechanism whose primary InputState receives no Projections
+        gets its input from the execute method's input arg (or its default variable), and so always uses the full
+        execute method.
+        """
+        if self.input_states and self.input_state.path_afferents:
+            self._steady_state_execute = self._execute_steady_state
+        else:
+            self._steady_state_execute = None
+
+    def _execute_steady_state(self, context=None):
+        """Execute the Mechanism without the steps of execute that are not needed once it is initialized
+
+        Used by execute when called by a System with no runtime_params, none in use from a previous execution,
+        and reportOutputPref off.  Skips assignment of context.string (assigned by the System),
+        the initialization branches, validation of runtime_params, and _check_args.
+        """
+        variable = self._update_variable(self._update_input_states(context=context))
+        function_variable = self._parse_function_variable(variable)
+
+        self._update_parameter_states(context=context)
+
+        value = self._convert_value_to_2d(self._execute(variable=variable,
+                                                        function_variable=function_variable,
+                                                        context=context))
+        self.status = value
+        self.value = value
+
+        self._update_output_states(context=context)
+
+        self._increment_execution_count()
+        self._update_current_execution_time(context=context)
+
+        return self.value
+
     def run(
         self,
         inputs,
@@ -194,6 +194,27 @@ After each execution of the Mechanism the result of `function <TransferMechanism
 <OutputState.value>` of each of its `OutputStates <OutputState>`, and to the 1st item of the Mechanism's
 `output_values <TransferMechanism.output_values>` attribute.
 
+.. _Transfer_Settling:
+
+Settling
+~~~~~~~~
+
+A TransferMechanism that integrates its input (i.e., is in `integrator_mode <TransferMechanism.integrator_mode>`),
+or that has a `recurrent_projection <RecurrentTransferMechanism.recurrent_projection>` (such as a
+`RecurrentTransferMechanism` or `LCA`), can be run to convergence within a single execution, rather than by the
+`Scheduler` executing it on many successive `PASS`\es until a `Condition` is satisfied.  Calling its
+`configure_settling <TransferMechanism.configure_settling>` method sets `settle_mode <TransferMechanism.settle_mode>`
+to True;  each execution then repeats the steps described above -- with the input it receives from other Mechanisms
+held constant, and the input from its `recurrent_projection <RecurrentTransferMechanism.recurrent_projection>`
+recomputed from the result of the previous step and combined with the others by its InputState's `function
+<InputState.function>` -- until the change in its result on a step is no greater than `settle_convergence_criterion
+<TransferMechanism.settle_convergence_criterion>`, the absolute value of any element of its result reaches
+`settle_threshold <TransferMechanism.settle_threshold>`, or `settle_max_steps <TransferMechanism.settle_max_steps>`
+steps have been taken.  The number of steps taken is assigned to `num_settle_steps
+<TransferMechanism.num_settle_steps>` and, if the Mechanism is executed in a `System`, each step is counted by the
+System's `Scheduler` as an execution of the Mechanism, so that `Conditions <Condition>` that depend on the number of
+times it has executed (such as `AfterNCalls`) treat the steps as they would separate executions.
+
 
 .. _Transfer_Reinitialization:
 
@@ -307,14 +328,14 @@ import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import Component, function_type, method_type
-from psyneulink.components.functions.function import Function, TransferFunction, AdaptiveIntegrator, Linear, NormalizingFunction, DistributionFunction, UserDefinedFunction
+from psyneulink.components.functions.function import Function, TransferFunction, AdaptiveIntegrator, Linear, NormalizingFunction, DistributionFunction, UserDefinedFunction, _try_execute_param
 from psyneulink.components.mechanisms.adaptive.control.controlmechanism import _is_control_spec
 from psyneulink.components.mechanisms.mechanism import Mechanism, MechanismError
 from psyneulink.components.mechanisms.processing.processingmechanism import ProcessingMechanism_Base
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.outputstate import OutputState, PRIMARY, StandardOutputStates, standard_output_states
 from psyneulink.globals.context import ContextFlags
-from psyneulink.globals.keywords import FUNCTION, INITIALIZER, INITIALIZING, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, MEAN, MEDIAN, NAME, NOISE, NORMALIZING_FUNCTION_TYPE, OWNER_VALUE, PROB, RATE, RESULT, RESULTS, STANDARD_DEVIATION, TRANSFER_FUNCTION_TYPE, TRANSFER_MECHANISM, VARIABLE, VARIANCE
+from psyneulink.globals.keywords import FUNCTION, FUNCTION_PARAMS, INITIALIZER, INITIALIZING, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, MEAN, MEDIAN, NAME, NOISE, NORMALIZING_FUNCTION_TYPE, OWNER_VALUE, PROB, RATE, RESULT, RESULTS, STANDARD_DEVIATION, TRANSFER_FUNCTION_TYPE, TRANSFER_MECHANISM, VARIABLE, VARIANCE
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import append_type_to_name, iscompatible
@@ -639,6 +660,22 @@ class TransferMechanism(ProcessingMechanism_Base):
         the change in `value <TransferMechanism.value>` from the previous execution of the TransferMechanism
         (i.e., `value <TransferMechanism.value>` - `previous_value <TransferMechanism.previous_value>`).
 
+    settle_mode : bool : default False
+        determines whether each execution of the Mechanism is repeated internally until its result converges
+        (see `Transfer_Settling`);  set to True by `configure_settling <TransferMechanism.configure_settling>`.
+
+    settle_max_steps : int : default 100
+        the maximum number of steps taken in an execution when `settle_mode <TransferMechanism.settle_mode>` is True.
+
+    settle_convergence_criterion : float or None : default 1e-4
+        the largest change in any element of the result on a step for which it is considered to have converged.
+
+    settle_threshold : float or None : default None
+        a value that, if reached by the absolute value of any element of the result, ends settling.
+
+    num_settle_steps : int
+        the number of steps taken on the last execution in which `settle_mode <TransferMechanism.settle_mode>` was True.
+
     output_states : *ContentAddressableList[OutputState]*
         list of Mechanism's `OutputStates <OutputStates>`; by default there is one OutputState for each InputState,
         with the base name `RESULT` (see `TransferMechanism_OutputStates` for additional details).
@@ -678,6 +715,12 @@ class TransferMechanism(ProcessingMechanism_Base):
 
     standard_output_states = standard_output_states.copy()
 
+    settle_mode = False
+    settle_max_steps = 100
+    settle_convergence_criterion = 1e-4
+    settle_threshold = None
+    num_settle_steps = 0
+
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
@@ -858,28 +901,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                                                                             self.name))
 
     def _try_execute_param(self, param, var):
-
-        # param is a list; if any element is callable, execute it
-        if isinstance(param, (np.ndarray, list)):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            param = np.atleast_2d(param)
-            for i in range(len(param)):
-                for j in range(len(param[i])):
-                    if callable(param[i][j]):
-                        param[i][j] = param[i][j]()
-
-        # param is one function
-        elif callable(param):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
-
-        return param
+        return _try_execute_param(param, var)
 
     def _instantiate_parameter_states(self, function=None, context=None):
 
@@ -1007,6 +1029,17 @@ class TransferMechanism(ProcessingMechanism_Base):
         # FIX:     WHICH SHOULD BE DEFAULTED TO 0.0??
         # Use self.instance_defaults.variable to initialize state of input
 
+        outputs = self._transfer(function_variable, runtime_params, context)
+
+        if self.settle_mode and self.context.initialization_status != ContextFlags.INITIALIZING:
+            outputs = self._settle(variable, outputs, runtime_params, context)
+
+        return outputs
+
+    def _transfer(self, function_variable, runtime_params, context):
+        """Execute one step of the TransferMechanism's function (including its integrator_function if in
+        integrator_mode), and clip the result"""
+
         # FIX: NEED TO GET THIS TO WORK WITH CALL TO METHOD:
         integrator_mode = self.integrator_mode
         noise = self.get_current_mechanism_param("noise")
@@ -1042,6 +1075,93 @@ class TransferMechanism(ProcessingMechanism_Base):
 
         return outputs
 
+    def _settle(self, variable, outputs, runtime_params, context):
+        """Repeat _transfer until the result converges, holding the input from other Mechanisms constant
+
+        On each step, the recurrent_projection (if there is one) is executed with the result of the previous step,
+        and the InputState that receives it combines its new value with the values of its other afferents using
+        the InputState's function, as it would on the next execution.  The first step has already been taken (its
+        result is **outputs**).  Returns the result of the last step.
+        """
+        max_steps = self.settle_max_steps
+        convergence_criterion = self.settle_convergence_criterion
+        threshold = self.settle_threshold
+
+        recurrent_projection = getattr(self, 'recurrent_projection', None)
+        if recurrent_projection is not None:
+            recurrent_state = recurrent_projection.receiver
+            recurrent_state_index = self.input_states.index(recurrent_state)
+            # values of the InputState's PathwayProjections, as last combined;  that of the recurrent_projection
+            #    is replaced on each step
+            path_proj_values = list(recurrent_state._path_proj_values)
+            recurrent_value_index = None
+            for i in range(len(path_proj_values)):
+                if path_proj_values[i] is recurrent_projection.value:
+                    recurrent_value_index = i
+                    break
+            if recurrent_value_index is None:
+                # the recurrent_projection did not contribute to the InputState's value on this execution
+                recurrent_projection = None
+            try:
+                # pass only function params (which implement the effects of any ModulatoryProjections)
+                state_function_params = recurrent_state.stateParams[FUNCTION_PARAMS]
+            except (AttributeError, KeyError, TypeError):
+                state_function_params = None
+
+        previous_result = np.asarray(self.value[0]) if self.value is not None else None
+        num_steps = 1
+        while num_steps < max_steps:
+            result = np.asarray(outputs[0])
+            if threshold is not None and np.any(np.abs(result) >= threshold):
+                break
+            if (convergence_criterion is not None and previous_result is not None
+                    and previous_result.shape == result.shape
+                    and np.max(np.abs(result - previous_result)) <= convergence_criterion):
+                break
+            previous_result = result
+
+            if recurrent_projection is not None:
+                path_proj_values[recurrent_value_index] = recurrent_projection.execute(variable=result,
+                                                                                       context=context)
+                recurrent_state._path_proj_values = list(path_proj_values)
+                recurrent_state.value = recurrent_state.execute(runtime_params=state_function_params,
+                                                                context=context)
+                variable = variable.copy()
+                variable[recurrent_state_index] = recurrent_state.value
+            outputs = self._transfer(self._parse_function_variable(variable), runtime_params, context)
+            num_steps += 1
+
+        self.num_settle_steps = num_steps
+
+        return outputs
+
+    def configure_settling(self, max_steps=100, convergence_criterion=1e-4, threshold=None):
+        """Execute the Mechanism in `settle_mode <TransferMechanism.settle_mode>` (see `Transfer_Settling`).
+
+        Arguments
+        ---------
+
+        max_steps : int : default 100
+            the maximum number of steps taken in an execution.
+
+        convergence_criterion : float or None : default 1e-4
+            the largest change in any element of the result on a step for which it is considered to have converged;
+            if it is None, convergence is not tested.
+
+        threshold : float or None : default None
+            a value that, if reached by the absolute value of any element of the result, ends settling.
+        """
+        if not isinstance(max_steps, numbers.Integral) or max_steps < 1:
+            raise TransferError("max_steps arg for configure_settling method of {} ({}) must be an integer "
+                                "greater than 0".format(self.name, max_steps))
+        if convergence_criterion is not None and convergence_criterion < 0:
+            raise TransferError("convergence_criterion arg for configure_settling method of {} ({}) must not be "
+                                "negative".format(self.name, convergence_criterion))
+        self.settle_max_steps = max_steps
+        self.settle_convergence_criterion = convergence_criterion
+        self.settle_threshold = threshold
+        self.settle_mode = True
+
     def _report_mechanism_execution(self, input, params, output):
         """Override super to report previous_input rather than input, and selected params
         """
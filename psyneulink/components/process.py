@@ -461,12 +461,12 @@ from psyneulink.components.shellclasses import Mechanism, Process_Base, Projecti
 from psyneulink.components.states.modulatorysignals.learningsignal import LearningSignal
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import _instantiate_state, _instantiate_state_list
-from psyneulink.globals.context import ContextFlags
-from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMPONENT_INIT, ENABLED, EXECUTING, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INITIAL_VALUES, INTERNAL, LEARNING, LEARNING_PROJECTION, MAPPING_PROJECTION, MATRIX, NAME, OBJECTIVE_MECHANISM, ORIGIN, PARAMETER_STATE, PATHWAY, PROCESS, PROCESS_INIT, SENDER, SINGLETON, TARGET, TERMINAL, kwProcessComponentCategory, kwReceiverArg, kwSeparator
+from psyneulink.globals.context import ContextFlags, _get_execution_value, _set_execution_value
+from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMPONENT_INIT, ENABLED, EXECUTING, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INITIAL_VALUES, INTERNAL, LEARNING, LEARNING_PROJECTION, MAPPING_PROJECTION, MATRIX, NAME, OBJECTIVE_MECHANISM, ORIGIN, PARAMETER_STATE, PATHWAY, PROCESS, PROCESS_INIT, SENDER, SINGLETON, TARGET, TERMINAL, VALUE, kwProcessComponentCategory, kwReceiverArg, kwSeparator
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import append_type_to_name, convert_to_np_array, iscompatible
+from psyneulink.globals.utilities import _get_unique_id, append_type_to_name, convert_to_np_array, iscompatible
 
 __all__ = [
     'DEFAULT_PHASE_SPEC', 'DEFAULT_PROJECTION_MATRIX', 'defaultInstanceCount', 'kwProcessInputState', 'kwTarget',
@@ -2123,7 +2123,6 @@ class Process(Process_Base):
             self.context.execution_phase = ContextFlags.PROCESSING
             self.context.source = context
             self.context.string = EXECUTING + " " + PROCESS + " " + self.name
-        from psyneulink.globals.environment import _get_unique_id
         self._execution_id = execution_id or _get_unique_id()
         for mech in self.mechanisms:
             mech._execution_id = self._execution_id
@@ -2295,6 +2294,7 @@ class Process(Process_Base):
             call_after_trial=None,
             call_before_time_step=None,
             call_after_time_step=None,
+            results_sink=None,
     ):
         """Run a sequence of executions
 
@@ -2361,12 +2361,17 @@ class Process(Process_Base):
         call_after_time_step : Function : default None
             called after each `TIME_STEP` of each trial is executed.
 
+        results_sink : ResultsSink : default None
+            receives the result of each `TRIAL` in place of the Process' `results <Process.results>` attribute
+            (see `Run_Results`).
+
         Returns
         -------
 
         <Process>.results : List[OutputState.value]
             list of the `value <OutputState.value>`\\s of the `primary OutputState <OutputState_Primary>` for the
-            `terminal_mechanism <Process.terminal_mechanism>` of the Process returned for each execution.
+            `terminal_mechanism <Process.terminal_mechanism>` of the Process returned for each execution
+            (or, if **results_sink** is specified, its `results <ResultsSink.results>` attribute).
 
         """
 
@@ -2385,6 +2390,7 @@ class Process(Process_Base):
                    call_after_trial=call_after_trial,
                    call_before_time_step=call_before_time_step,
                    call_after_time_step=call_after_time_step,
+                   results_sink=results_sink,
         )
     def _report_process_initiation(self, input=None, separator=False):
         """
@@ -2569,11 +2575,12 @@ class ProcessInputState(OutputState):
 
     @property
     def value(self):
-        return self._value
+        return _get_execution_value(self, VALUE, self._value)
 
     @value.setter
     def value(self, assignment):
-        self._value = assignment
+        if not _set_execution_value(self, VALUE, assignment):
+            self._value = assignment
         self.owner._update_input()
 
 ProcessTuple = namedtuple('ProcessTuple', 'process, input')
@@ -515,6 +515,8 @@ class MappingProjection(PathwayProjection_Base):
                                                                             initializer=matrix,
                                                                             # rate=initial_rate
                                                                                )
+        # learning increments the matrix in place, rather than replacing it on each update
+        self._parameter_states[MATRIX].function_object._increment_in_place = True
         self._parameter_states[MATRIX]._function = self._parameter_states[MATRIX].function_object.function
 
         # # Assign ParameterState the same Log as the MappingProjection, so that its entries are accessible to Mechanisms
@@ -167,6 +167,16 @@ methods.  All of these take one or more values of `ControlSignalCosts`, each of
 How the enabled components are combined is determined by the `cost_combination_function`.  By default, the values of
 the enabled cost components are summed, however this can be modified by specifying the `cost_combination_function`.
 
+.. _ControlSignal_Batch_Costs:
+
+The costs for a set of candidate `intensity` values can be computed in a single call to the ControlSignal's
+`compute_costs <ControlSignal.compute_costs>` method, without changing its `cost <ControlSignal.cost>` or any other
+of its attributes.  The cost functions are called with the array of candidate values (and, if the
+`cost_combination_function` is a `Reduce` or `LinearCombination` Function, it is called once with all of the
+components), so that Functions such as `Exponential` and `Linear` evaluate the costs for all of the candidates at once;
+other (e.g., custom) functions are called once for each candidate.  The `adjustment_cost` of each candidate is
+computed from the ControlSignal's current `last_intensity`, and its current `duration_cost` is used for all of them.
+
     COMMENT:
     .. _ControlSignal_Toggle_Costs:
 
@@ -300,14 +310,14 @@ from psyneulink.components.component import function_type, method_type
 # import Components
 # FIX: EVCControlMechanism IS IMPORTED HERE TO DEAL WITH COST FUNCTIONS THAT ARE DEFINED IN EVCControlMechanism
 #            SHOULD THEY BE LIMITED TO EVC??
-from psyneulink.components.functions.function import CombinationFunction, Exponential, IntegratorFunction, Linear, Reduce, SimpleIntegrator, TransferFunction, _is_modulation_param, is_function_type
+from psyneulink.components.functions.function import CombinationFunction, Exponential, IntegratorFunction, Linear, LinearCombination, Reduce, SimpleIntegrator, TransferFunction, _is_modulation_param, is_function_type
 from psyneulink.components.shellclasses import Function
 from psyneulink.components.states.modulatorysignals.modulatorysignal import ModulatorySignal
 from psyneulink.components.states.outputstate import SEQUENTIAL
 from psyneulink.components.states.state import State_Base
-from psyneulink.globals.context import ContextFlags
+from psyneulink.globals.context import ContextFlags, _get_execution_value, _set_execution_value
 from psyneulink.globals.defaults import defaultControlAllocation
-from psyneulink.globals.keywords import ALLOCATION_SAMPLES, AUTO, COMMAND_LINE, CONTROLLED_PARAMS, CONTROL_PROJECTION, CONTROL_SIGNAL, OFF, ON, OUTPUT_STATE_PARAMS, PARAMETER_STATE, PARAMETER_STATES, PROJECTION_TYPE, RECEIVER, SUM
+from psyneulink.globals.keywords import ALLOCATION_SAMPLES, AUTO, COMMAND_LINE, CONTROLLED_PARAMS, CONTROL_PROJECTION, CONTROL_SIGNAL, OFF, ON, OUTPUT_STATE_PARAMS, PARAMETER_STATE, PARAMETER_STATES, PROJECTION_TYPE, RECEIVER, SUM, VALUE
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import is_numeric, iscompatible, kwCompatibilityLength, kwCompatibilityNumeric, kwCompatibilityType
@@ -394,6 +404,17 @@ class ControlSignalCosts(IntEnum):
     DEFAULTS           = INTENSITY_COST
 
 
+def _apply_cost_function(cost_function, values):
+    """Return cost_function evaluated for each of values (a 1d array)
+
+    The method of a PsyNeuLink Function is called once with the entire array;  any other function is called
+    once for each value.
+    """
+    if isinstance(getattr(cost_function, '__self__', None), Function):
+        return np.asarray(cost_function(values), dtype=float).reshape(len(values))
+    return np.array([float(np.sum(cost_function(value))) for value in values])
+
+
 class ControlSignalError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -656,6 +677,10 @@ class ControlSignal(ModulatorySignal):
         PROJECTION_TYPE: CONTROL_PROJECTION,
         CONTROLLED_PARAMS:None
     })
+
+    # Set by a ControlMechanism that has computed the costs for the allocations it is evaluating
+    #    (using compute_costs), so that they are not also computed each time the ControlSignal is updated
+    _defer_costs = False
     #endregion
 
 
@@ -948,11 +973,61 @@ class ControlSignal(ModulatorySignal):
 
     def update(self, params=None, context=None):
         super().update(params=params, context=context)
-        self._compute_costs()
+        if not self._defer_costs:
+            self._compute_costs()
 
     def _execute(self, variable=None, function_variable=None, runtime_params=None, context=None):
         return float(super()._execute(variable=variable, function_variable=function_variable, runtime_params=runtime_params, context=context))
 
+    def compute_costs(self, intensities):
+        """Compute the `cost <ControlSignal.cost>` for each of a set of candidate `intensity` values.
+
+        The ControlSignal's attributes are not changed (see `ControlSignal_Batch_Costs` for details).
+
+        Arguments
+        ---------
+
+        intensities : 1d array
+            candidate values of `intensity` for which to compute the costs.
+
+        Returns
+        -------
+
+        costs : 1d np.array
+            the `cost <ControlSignal.cost>` for each of the **intensities**.
+
+        """
+        intensities = np.asarray(intensities, dtype=float).reshape(-1)
+        num_intensities = len(intensities)
+        intensity_costs = adjustment_costs = duration_costs = np.zeros(num_intensities)
+
+        if self.cost_options & ControlSignalCosts.INTENSITY_COST:
+            intensity_costs = _apply_cost_function(self.intensity_cost_function, intensities)
+
+        if self.cost_options & ControlSignalCosts.ADJUSTMENT_COST:
+            try:
+                intensity_changes = intensities - self.last_intensity
+            except AttributeError:
+                intensity_changes = np.zeros(num_intensities)
+            adjustment_costs = _apply_cost_function(self.adjustment_cost_function, intensity_changes)
+
+        if self.cost_options & ControlSignalCosts.DURATION_COST:
+            duration_costs = np.full(num_intensities, float(np.sum(self.duration_cost)))
+
+        # One row of cost components for each candidate intensity
+        cost_components = np.column_stack([intensity_costs, adjustment_costs, duration_costs])
+
+        cost_combination_function = self.cost_combination_function
+        combination_function_object = getattr(cost_combination_function, '__self__', None)
+        if isinstance(combination_function_object, Reduce):
+            costs = cost_combination_function(cost_components)
+        elif isinstance(combination_function_object, LinearCombination):
+            costs = cost_combination_function(cost_components.T)
+        else:
+            costs = [cost_combination_function(list(components)) for components in cost_components]
+
+        return np.maximum(0.0, np.asarray(costs, dtype=float).reshape(num_intensities))
+
     def _compute_costs(self):
         """Compute costs based on self.value."""
 
@@ -1187,11 +1262,12 @@ class ControlSignal(ModulatorySignal):
         if self.context.initialization_status & (ContextFlags.DEFERRED_INIT | ContextFlags.INITIALIZING):
             return None
         else:
-            return self._value
+            return _get_execution_value(self, VALUE, self._value)
 
     @value.setter
     def value(self, assignment):
-        self._value = assignment
+        if not _set_execution_value(self, VALUE, assignment):
+            self._value = assignment
         self.log._log_value(assignment)
 
     @property
@@ -825,23 +825,25 @@ class ParameterState(State_Base):
             # return self.function(function_variable, runtime_params, context)
             return super()._execute(function_variable, runtime_params=runtime_params, context=context)
         else:
-            # Most commonly, ParameterState is for the parameter of a function
-            try:
-                param_value = getattr(self.owner.function_object, '_'+ self.name)
-                # param_value = self.owner.function_object.params[self.name]
-
-           # Otherwise, should be for an attribute of the ParameterState's owner:
-            except AttributeError:
-                # param_value = self.owner.params[self.name]
-                param_value = getattr(self.owner, '_'+ self.name)
-
             return super()._execute(
                 variable=variable,
-                function_variable=param_value,
+                function_variable=self._get_base_value(),
                 runtime_params=runtime_params,
                 context=context
             )
 
+    def _get_base_value(self):
+        """Return the backingfield ("base") value of the parameter, before it is modulated"""
+        # Most commonly, ParameterState is for the parameter of a function
+        try:
+            return getattr(self.owner.function_object, '_'+ self.name)
+            # param_value = self.owner.function_object.params[self.name]
+
+        # Otherwise, should be for an attribute of the ParameterState's owner:
+        except AttributeError:
+            # param_value = self.owner.params[self.name]
+            return getattr(self.owner, '_'+ self.name)
+
     @property
     def pathway_projections(self):
         raise ParameterStateError("PROGRAM ERROR: Attempt to access {} for {}; {}s do not have {}s".
@@ -740,7 +740,7 @@ import typecheck as tc
 from psyneulink.components.component import Component, ComponentError, component_keywords, function_type, method_type
 from psyneulink.components.functions.function import Function, Linear, LinearCombination, ModulationParam, _get_modulated_param, get_param_value_for_keyword
 from psyneulink.components.shellclasses import Mechanism, Process_Base, Projection, State
-from psyneulink.globals.context import ContextFlags
+from psyneulink.globals.context import ContextFlags, _ExecutionAttribute
 from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMMAND_LINE, CONTEXT, CONTROL_PROJECTION_PARAMS, \
     CONTROL_SIGNAL_SPECS, DEFERRED_INITIALIZATION, EXPONENT, FUNCTION, FUNCTION_PARAMS, \
     GATING_PROJECTION_PARAMS, GATING_SIGNAL_SPECS, INITIALIZING, INPUT_STATES, LEARNING_PROJECTION_PARAMS, \
@@ -997,6 +997,11 @@ class State_Base(State):
     componentCategory = kwStateComponentCategory
     className = STATE
     suffix = " " + className
+
+    # Assigned in each update, and stored separately for each execution (see Context_Execution_Values)
+    stateParams = _ExecutionAttribute('stateParams')
+    _path_proj_values = _ExecutionAttribute('_path_proj_values')
+    _mod_proj_values = _ExecutionAttribute('_mod_proj_values')
     paramsType = None
 
     class ClassDefaults(State.ClassDefaults):
@@ -1877,8 +1882,7 @@ class State_Base(State):
 
         #For each projection: get its params, pass them to it, get the projection's value, and append to relevant list
         self._path_proj_values = []
-        for value in self._mod_proj_values:
-            self._mod_proj_values[value] = []
+        self._mod_proj_values = {mod_param: [] for mod_param in self._mod_proj_values}
 
         from psyneulink.components.process import ProcessInputState
         from psyneulink.components.projections.pathway.pathwayprojection import PathwayProjection_Base
@@ -1947,9 +1951,10 @@ class State_Base(State):
                 projection_params = None
 
             # Update LearningSignals only if context == LEARNING;  otherwise, assign zero for projection_value
+            #    (as a scalar, rather than an array of zeros the size of the matrix being learned)
             # Note: done here rather than in its own method in order to exploit parsing of params above
             if isinstance(projection, LearningProjection) and self.context.execution_phase != ContextFlags.LEARNING:
-                projection_value = projection.value * 0.0
+                projection_value = 0.0
             else:
                 projection_value = projection.execute(variable=projection.sender.value,
                                                       runtime_params=projection_params,
@@ -1985,6 +1990,10 @@ class State_Base(State):
                     else:
                         self.value = type_match(projection_value, type(self.value))
                         return
+                # The value of a LearningProjection is used as is, since the param it modulates may hold
+                #    the scalar zero assigned above on a previous update outside of the LEARNING phase
+                elif isinstance(projection, LearningProjection):
+                    mod_value = projection_value
                 else:
                     mod_value = type_match(projection_value, type(mod_param_value))
                 self._mod_proj_values[mod_meta_param].append(mod_value)
@@ -324,6 +324,20 @@ that a target value be provided for each `TARGET` Mechanism of the System (liste
    applied until the Mechanisms that receive the Projections being learned are next executed; see :ref:`Lazy Evaluation
    <LINK>` for an explanation of "lazy" updating).
 
+.. _System_Learning_Minibatch:
+
+*Minibatch Learning*. By default, the weight changes for each `TRIAL` are computed and applied in that `TRIAL`.
+If the **learning_batch_size** argument of the System's `run <System.run>` method is specified (or its
+`learning_batch_size <System.learning_batch_size>` attribute is assigned) a value greater than 1, then learning is
+executed in minibatches:  in each `TRIAL`, the System's `TARGET` Mechanisms are executed, and the activities and
+errors used by its `LearningMechanisms <LearningMechanism>` are recorded;  once that number of `TRIAL`\\s has been
+executed (or the run ends), each LearningMechanism is executed once, computing the weight change for the entire
+minibatch as a single matrix product (see `batch_function <BackPropagation.batch_function>`), and the `matrix
+<MappingProjection.matrix>` of each learned Projection is then updated once.  The weight change applied is the sum of
+the changes for each `TRIAL` in the minibatch (computed using the weights at the start of the minibatch), so the
+`learning_rate <System.learning_rate>` may need to be scaled accordingly.  The **termination_learning** Conditions
+are not used in this mode, and all of the LearningMechanisms must use the `BackPropagation` LearningFunction.
+
 
 .. _System_Execution_Control:
 
@@ -423,10 +437,12 @@ Class Reference
 
 """
 
+import copy
 import inspect
 import logging
 import math
 import numbers
+import random
 import re
 import warnings
 
@@ -440,22 +456,22 @@ from toposort import toposort, toposort_flatten
 from psyneulink.components.component import Component
 from psyneulink.components.mechanisms.adaptive.control.controlmechanism import ControlMechanism, OBJECTIVE_MECHANISM
 from psyneulink.components.mechanisms.adaptive.learning.learningauxiliary import _assign_error_signal_projections, _get_learning_mechanisms
-from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import LearningMechanism
+from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import ACTIVATION_INPUT, ACTIVATION_OUTPUT, LearningMechanism
 from psyneulink.components.mechanisms.mechanism import MechanismList
 from psyneulink.components.mechanisms.processing.objectivemechanism import DEFAULT_MONITORED_STATE_EXPONENT, DEFAULT_MONITORED_STATE_MATRIX, DEFAULT_MONITORED_STATE_WEIGHT, ObjectiveMechanism
 from psyneulink.components.process import Process, ProcessList, ProcessTuple
 from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
 from psyneulink.components.projections.projection import Projection
-from psyneulink.components.shellclasses import Mechanism, Process_Base, System_Base
+from psyneulink.components.shellclasses import Function, Mechanism, Process_Base, System_Base
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.parameterstate import ParameterState
-from psyneulink.globals.context import ContextFlags
-from psyneulink.globals.keywords import ALL, COMPONENT_INIT, CONROLLER_PHASE_SPEC, CONTROL, CONTROLLER, CYCLE, EVC_SIMULATION, EXECUTING, FUNCTION, FUNCTIONS, INITIALIZED, INITIALIZE_CYCLE, INITIALIZING, INITIAL_VALUES, INTERNAL, LABELS, LEARNING, MATRIX, MONITOR_FOR_CONTROL, ORIGIN, PROJECTIONS, SAMPLE, SINGLETON, SYSTEM, SYSTEM_INIT, TARGET, TERMINAL, VALUES, kwSeparator, kwSystemComponentCategory
+from psyneulink.globals.context import ContextFlags, _ExecutionAttribute
+from psyneulink.globals.keywords import ALL, COMPONENT_INIT, CONROLLER_PHASE_SPEC, CONTROL, CONTROLLER, CYCLE, EVC_SIMULATION, EXECUTING, FUNCTION, FUNCTIONS, INITIALIZED, INITIALIZE_CYCLE, INITIALIZING, INITIAL_VALUES, INTERNAL, LABELS, LEARNING, MATRIX, MONITOR_FOR_CONTROL, NOISE, ORIGIN, PROJECTIONS, SAMPLE, SINGLETON, SYSTEM, SYSTEM_INIT, TARGET, TERMINAL, VALUES, kwSeparator, kwSystemComponentCategory
 from psyneulink.globals.log import Log
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, append_type_to_name, convert_to_np_array, iscompatible
+from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, _get_unique_id, append_type_to_name, convert_to_np_array, iscompatible
 from psyneulink.scheduling.scheduler import Scheduler
 
 __all__ = [
@@ -491,10 +507,28 @@ LEARNING_MECHANISMS = 'learning_mechanisms'
 CONTROL_MECHANISM = 'control_mechanism'
 CONTROL_PROJECTION_RECEIVERS = 'control_projection_receivers'
 
+# _cache_state() keywords
+RANDOM_STATE = 'random_state'
+
 SystemRegistry = {}
 
 kwSystemInputState = 'SystemInputState'
 
+def _copy_state_value(value):
+    """Return a copy of value that does not share any mutable data with it (used by System._cache_state)"""
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return value.copy()
+    if value is None or isinstance(value, (numbers.Number, str)):
+        return value
+    return copy.deepcopy(value)
+
+
+def _copy_counts(counts):
+    """Copy a Scheduler's counts_total or counts_useable ({execution_id: {key: {node: int}}}) without its nodes"""
+    return {execution_id: {key: dict(node_counts) for key, node_counts in counts_by_key.items()}
+            for execution_id, counts_by_key in counts.items()}
+
+
 class MonitoredOutputStatesOption(AutoNumber):
     """Specifies OutputStates to be monitored by a `ControlMechanism <ControlMechanism>`
     (see `ObjectiveMechanism_Monitored_Output_States` for a more complete description of their meanings."""
@@ -545,6 +579,7 @@ class System(System_Base):
         targets=None,                             \
         params=None,                              \
         name=None,                                \
+        seed=None,                                \
         prefs=None)
 
     Base class for System.
@@ -626,6 +661,10 @@ class System(System_Base):
         or following the execution of any `Process` or System to which the LearningMechanism belongs and for which a
         `learning_rate <LearningMechanism.learning_rate>` was set).
 
+    learning_batch_size : int : default None
+        the number of `TRIAL`\\s over which weight changes are accumulated before they are applied;  if it is `None`
+        or 1, learning is executed in every `TRIAL` (see `System_Learning_Minibatch`).
+
     targets : 2d nparray
         used as template for the values of the System's `target_input_states`, and to represent the targets specified in
         the **targets** argument of System's `execute <System.execute>` and `run <System.run>` methods.
@@ -757,6 +796,14 @@ class System(System_Base):
     results : List[OutputState.value]
         list of return values (OutputState.value) from the sequence of executions.
 
+    seed : int or None
+        seeds the `random_state <Component.random_state>` of every Mechanism and Function in the System (including
+        any `DistributionFunctions <DistributionFunction>` used as `noise <TransferMechanism.noise>`).  Each Component
+        is assigned its own `np.random.RandomState`, seeded from **seed** and the Component's position in the System,
+        so that executions are reproducible (including in parallel workers) independently of numpy's global random
+        number generator.  If it is `None`, Components draw from numpy's global random number generator.
+        Assigning a new value reseeds all of the Components.
+
     name : str
         the name of the System; if it is not specified in the **name** argument of the constructor, a default is
         assigned by SystemRegistry (see `Naming` for conventions used for default and duplicate names).
@@ -773,6 +820,9 @@ class System(System_Base):
     suffix = " " + className
     componentType = "System"
 
+    # Stored separately for each execution (see Context_Execution_Values)
+    _execution_id = _ExecutionAttribute('_execution_id')
+
     registry = SystemRegistry
 
     classPreferenceLevel = PreferenceLevel.CATEGORY
@@ -798,6 +848,8 @@ class System(System_Base):
         'learning': False
     })
 
+    learning_batch_size = None
+
     # FIX 5/23/17: ADD control_signals ARGUMENT HERE (AND DOCUMENT IT ABOVE)
     @tc.typecheck
     def __init__(self,
@@ -815,6 +867,7 @@ class System(System_Base):
                  params=None,
                  name=None,
                  scheduler=None,
+                 seed=None,
                  prefs:is_pref_set=None,
                  context=None):
 
@@ -866,6 +919,16 @@ class System(System_Base):
         # Assign controller
         self._instantiate_controller(control_mech_spec=controller, context=context)
 
+        # Assign random_state of Components (after controller, so that its prediction Mechanisms are included)
+        self._seed = None
+        if seed is not None:
+            self.seed = seed
+
+        # Build steady-state execute method of Mechanisms (now that all of their Projections have been instantiated)
+        for mech in self._get_stateful_components():
+            if isinstance(mech, Mechanism):
+                mech._build_steady_state_execute()
+
         # IMPLEMENT CORRECT REPORTING HERE
         # if self.prefs.reportOutputPref:
         #     print("\n{0} initialized with:\n- pathway: [{1}]".
@@ -2505,7 +2568,6 @@ class System(System_Base):
             self.context.string = EXECUTING + " " + SYSTEM + " " + self.name
 
         # Update execution_id for self and all mechanisms in graph (including learning) and controller
-        from psyneulink.globals.environment import _get_unique_id
         self._execution_id = execution_id or _get_unique_id()
         # FIX: GO THROUGH LEARNING GRAPH HERE AND ASSIGN EXECUTION TOKENS FOR ALL MECHANISMS IN IT
         # self.learning_execution_list
@@ -2599,7 +2661,10 @@ class System(System_Base):
             self.context.execution_phase = ContextFlags.LEARNING
             self.context.string = self.context.string.replace(EXECUTING, LEARNING + ' ')
 
-            self._execute_learning(context)
+            if self.learning_batch_size is not None and self.learning_batch_size > 1:
+                self._execute_learning_minibatch(context)
+            else:
+                self._execute_learning(context)
 
             self.context.execution_phase = ContextFlags.IDLE
             self.context.string = self.context.string.replace(LEARNING, EXECUTING)
@@ -2664,6 +2729,10 @@ class System(System_Base):
                 mechanism.execute(runtime_params=rt_params, context=context)
                 mechanism.context.execution_phase = ContextFlags.IDLE
 
+                # the steps taken by a Mechanism in settle_mode count as executions of it for the Scheduler
+                if getattr(mechanism, 'settle_mode', False):
+                    self.scheduler_processing._add_settle_steps(mechanism, mechanism.num_settle_steps)
+
                 if self._report_system_output and  self._report_process_output:
 
                     # REPORT COMPLETION OF PROCESS IF ORIGIN:
@@ -2693,19 +2762,8 @@ class System(System_Base):
                 pass
             i += 1
 
-    def _execute_learning(self, context=None):
-        # Execute each LearningMechanism as well as LearningProjections in self.learning_execution_list
-
-        # FIRST, if targets were specified as a function, call the function now
-        #    (i.e., after execution of the pathways, but before learning)
-        # Note:  this accomodates functions that predicate the target on the outcome of processing
-        #        (e.g., for rewards in reinforcement learning)
-        from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import LearningMechanism
-        # if isinstance(self.targets, function_type):
-        #     self.current_targets = self.targets()
-        #     for i in range(len(self.target_mechanisms)):
-        #         self.target_input_states[i].value = self.current_targets[i]
-
+    def _assign_current_targets(self):
+        """Assign the targets for the current TRIAL to the System's target_input_states"""
         if not hasattr(self, "target"):
             self.target = self.targets
         if isinstance(self.target, dict):
@@ -2721,6 +2779,22 @@ class System(System_Base):
         elif isinstance(self.target, (list, np.ndarray)):
             for i in range(len(self.target_mechanisms)):
                 self.target_input_states[i].value = self.current_targets[i]
+
+    def _execute_learning(self, context=None):
+        # Execute each LearningMechanism as well as LearningProjections in self.learning_execution_list
+
+        # FIRST, if targets were specified as a function, call the function now
+        #    (i.e., after execution of the pathways, but before learning)
+        # Note:  this accomodates functions that predicate the target on the outcome of processing
+        #        (e.g., for rewards in reinforcement learning)
+        from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import LearningMechanism
+        # if isinstance(self.targets, function_type):
+        #     self.current_targets = self.targets()
+        #     for i in range(len(self.target_mechanisms)):
+        #         self.target_input_states[i].value = self.current_targets[i]
+
+        self._assign_current_targets()
+
         # NEXT, execute all components involved in learning
         if self.scheduler_learning is None:
             raise SystemError('System.py:_execute_learning - {0}\'s scheduler is None, '
@@ -2816,6 +2890,82 @@ class System(System_Base):
                              ))
                              # process_names))
 
+    def _execute_learning_minibatch(self, context=None):
+        """Execute the TARGET Mechanisms and record the values used for learning in the current TRIAL;
+        execute learning for the minibatch once learning_batch_size TRIALs have been recorded
+        (see `System_Learning_Minibatch`)
+        """
+        from psyneulink.components.functions.function import BackPropagation
+
+        # Determine, once, the order in which the LearningMechanisms are executed and the OutputStates they use
+        if getattr(self, '_learning_batch_order', None) is None:
+            learning_mechanisms = [component
+                                   for execution_set in Scheduler(graph=self.learning_execution_graph).consideration_queue
+                                   for component in execution_set if isinstance(component, LearningMechanism)]
+            for learning_mechanism in learning_mechanisms:
+                if not isinstance(learning_mechanism.function_object, BackPropagation):
+                    raise SystemError("Minibatch learning is supported only for LearningMechanisms that use {}; "
+                                      "{} in {} uses {}".format(BackPropagation.__name__, learning_mechanism.name,
+                                                                self.name, learning_mechanism.function_object.name))
+            # The OutputStates of Mechanisms (other than LearningMechanisms) that project to the LearningMechanisms
+            self._learning_batch_states = list(OrderedDict.fromkeys(
+                state.path_afferents[0].sender
+                for learning_mechanism in learning_mechanisms
+                for state in learning_mechanism.input_states
+                if not isinstance(state.path_afferents[0].sender.owner, LearningMechanism)))
+            self._learning_batch_order = learning_mechanisms
+            self._learning_batch = {state: [] for state in self._learning_batch_states}
+
+        self._assign_current_targets()
+
+        for target_mechanism in self.target_mechanisms:
+            target_mechanism.context.composition = self
+            target_mechanism.context.execution_phase = ContextFlags.LEARNING
+            target_mechanism.execute(context=context)
+            target_mechanism.context.execution_phase = ContextFlags.IDLE
+
+        for state in self._learning_batch_states:
+            self._learning_batch[state].append(np.array(state.value))
+
+        if len(self._learning_batch[self._learning_batch_states[0]]) >= self.learning_batch_size:
+            self._apply_learning_minibatch(context=context)
+
+    def _apply_learning_minibatch(self, context=None):
+        """Execute each LearningMechanism once for the recorded minibatch and update the learned matrices"""
+        batch = {state: np.array(values) for state, values in self._learning_batch.items()}
+        if not batch or not len(next(iter(batch.values()))):
+            return
+
+        # Execute LearningMechanisms in order, passing the batched error_signal of each to those that receive it
+        batch_error_signals = {}
+        for learning_mechanism in self._learning_batch_order:
+            error_signals = []
+            for state in learning_mechanism.error_signal_input_states:
+                sender = state.path_afferents[0].sender
+                if sender in batch:
+                    error_signals.append(batch[sender])
+                else:
+                    error_signals.append(batch_error_signals[sender.owner])
+            learning_mechanism.context.execution_phase = ContextFlags.LEARNING
+            batch_error_signals[learning_mechanism] = learning_mechanism._execute_batch(
+                activation_input=batch[learning_mechanism.input_states[ACTIVATION_INPUT].path_afferents[0].sender],
+                activation_output=batch[learning_mechanism.input_states[ACTIVATION_OUTPUT].path_afferents[0].sender],
+                error_signals=error_signals,
+                context=context)
+            learning_mechanism.context.execution_phase = ContextFlags.IDLE
+
+        # THEN update all MappingProjections
+        for learning_mechanism in self._learning_batch_order:
+            for projection in learning_mechanism.learned_projections:
+                if not isinstance(projection, MappingProjection):
+                    continue
+                projection.context.execution_phase = ContextFlags.LEARNING
+                projection._parameter_states[MATRIX].update(context=ContextFlags.COMPOSITION)
+                projection.context.execution_phase = ContextFlags.IDLE
+
+        for values in self._learning_batch.values():
+            values.clear()
+
     def run(self,
             inputs,
             num_trials=None,
@@ -2829,6 +2979,8 @@ class System(System_Base):
             call_after_time_step=None,
             termination_processing=None,
             termination_learning=None,
+            results_sink=None,
+            learning_batch_size=None,
             context=None):
         """Run a sequence of executions
 
@@ -2879,11 +3031,22 @@ class System(System_Base):
             a dictionary containing `Condition`\\ s that signal the end of the associated `TimeScale` within the :ref:`learning
             phase of execution <System_Execution_Learning>`
 
+        results_sink : ResultsSink : default None
+            receives the result of each execution in place of the System's `results <System.results>` attribute
+            (see `Run_Results`).
+
+        learning_batch_size : int : default None
+            if specified, assigns the System's `learning_batch_size <System.learning_batch_size>`, the number of
+            `TRIAL`\\s over which weight changes are accumulated before they are applied (see
+            `System_Learning_Minibatch`);  any weight changes remaining at the end of the run are applied before it
+            returns.
+
         Returns
         -------
 
         <System>.results : List[Mechanism.OutputValue]
-            list of the OutputValue for each `TERMINAL` Mechanism of the System returned for each execution.
+            list of the OutputValue for each `TERMINAL` Mechanism of the System returned for each execution
+            (or, if **results_sink** is specified, its `results <ResultsSink.results>` attribute).
 
         """
         if self.scheduler_processing is None:
@@ -2894,23 +3057,36 @@ class System(System_Base):
 
         self.initial_values = initial_values
 
+        if learning_batch_size is not None:
+            if not isinstance(learning_batch_size, numbers.Integral) or learning_batch_size < 1:
+                raise SystemError("learning_batch_size for {} ({}) must be an integer greater than 0".
+                                  format(self.name, learning_batch_size))
+            self.learning_batch_size = learning_batch_size
+
         logger.debug(inputs)
 
         from psyneulink.globals.environment import run
-        return run(self,
-                   inputs=inputs,
-                   num_trials=num_trials,
-                   initialize=initialize,
-                   initial_values=initial_values,
-                   targets=targets,
-                   learning=learning,
-                   call_before_trial=call_before_trial,
-                   call_after_trial=call_after_trial,
-                   call_before_time_step=call_before_time_step,
-                   call_after_time_step=call_after_time_step,
-                   termination_processing=termination_processing,
-                   termination_learning=termination_learning,
-                   context=ContextFlags.COMPOSITION)
+        results = run(self,
+                      inputs=inputs,
+                      num_trials=num_trials,
+                      initialize=initialize,
+                      initial_values=initial_values,
+                      targets=targets,
+                      learning=learning,
+                      call_before_trial=call_before_trial,
+                      call_after_trial=call_after_trial,
+                      call_before_time_step=call_before_time_step,
+                      call_after_time_step=call_after_time_step,
+                      termination_processing=termination_processing,
+                      termination_learning=termination_learning,
+                      results_sink=results_sink,
+                      context=ContextFlags.COMPOSITION)
+
+        # Apply the weight changes for any TRIALs remaining in an incomplete minibatch
+        if getattr(self, '_learning_batch_order', None) is not None:
+            self._apply_learning_minibatch(context=ContextFlags.COMPOSITION)
+
+        return results
 
     def _report_system_initiation(self):
         """Prints iniiation message, time_step, and list of Processes in System being executed
@@ -3153,42 +3329,197 @@ class System(System_Base):
             result.extend(sorted(dependency_set, key=lambda item : next(d_iter).name))
         return result
 
+    def _get_stateful_components(self):
+        """Return all Components of the System that can hold state from one execution to the next
+
+        Includes the Mechanisms in the System's execution_list and learning_execution_list, its controller (and any
+        prediction Mechanisms), all of their States, the Projections to those States, and the ParameterStates of those
+        Projections.
+        """
+        components = []
+        seen = set()
+
+        def add(component):
+            if id(component) not in seen:
+                seen.add(id(component))
+                components.append(component)
+
+        mechanisms = list(self.execution_list)
+        mechanisms.extend(c for c in self.learning_execution_list if isinstance(c, Mechanism))
+        if self.controller is not None:
+            mechanisms.append(self.controller)
+            try:
+                mechanisms.extend(self.controller.prediction_mechanisms)
+            except (AttributeError, TypeError):
+                pass
+
+        for mech in mechanisms:
+            add(mech)
+            for state in mech.states:
+                add(state)
+                for projection in state.all_afferents:
+                    add(projection)
+                    try:
+                        parameter_states = projection._parameter_states
+                    except AttributeError:
+                        continue
+                    for parameter_state in parameter_states:
+                        add(parameter_state)
+                        for mod_projection in parameter_state.mod_afferents:
+                            add(mod_projection)
+
+        return components
+
+    def _get_random_components(self):
+        """Return, in a fixed order, the Mechanisms and Functions of the System that can draw random values"""
+        from psyneulink.components.functions.function import DistributionFunction
+
+        components = []
+        seen = set()
+
+        def add(component):
+            if id(component) not in seen:
+                seen.add(id(component))
+                components.append(component)
+
+        def add_noise_functions(component):
+            try:
+                noise = getattr(component, NOISE)
+            except (AttributeError, TypeError):
+                return
+            for item in noise if isinstance(noise, (list, np.ndarray)) else [noise]:
+                # noise Functions are stored as their bound _execute (or function) methods
+                item = getattr(item, '__self__', item)
+                if isinstance(item, DistributionFunction):
+                    add(item)
+
+        for mech in self._get_stateful_components():
+            if not isinstance(mech, Mechanism):
+                continue
+            add(mech)
+            add_noise_functions(mech)
+            for function in (getattr(mech, 'function_object', None), getattr(mech, 'integrator_function', None)):
+                if isinstance(function, Function):
+                    add(function)
+                    add_noise_functions(function)
+
+        return components
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed):
+        self._seed = seed
+        for i, component in enumerate(self._get_random_components()):
+            component.random_state = None if seed is None else np.random.RandomState([seed, i])
+
     def _cache_state(self):
+        """Capture a snapshot of every stateful quantity in the System, and return it
+
+        The snapshot contains copies of:
+
+        - the `value <Component.value>` of every Mechanism, State and Projection in the System (including the
+          ParameterStates of MappingProjections, and thus any learned `matrix <MappingProjection.matrix>`);
+        - the `stateful_attributes <Function_Base.stateful_attributes>` (e.g., `previous_value
+          <Integrator.previous_value>` and `previous_time <DriftDiffusionIntegrator.previous_time>`) of the
+          Functions of those Components (including the `integrator_function <TransferMechanism.integrator_function>`
+          of a TransferMechanism);
+        - the `Clocks <Clock>` and counts of the System's `scheduler_processing` and `scheduler_learning`;
+        - the state of the global random number generators, and of the `random_state <Component.random_state>` of
+          any Component that has been assigned its own (see `seed <System.seed>`).
+
+        The snapshot is also stored in the System's ``_cached_state`` attribute, from which it is reinstated by
+        `_restore_state <System._restore_state>`.  No Components are copied or reconstructed.
+
+        Returns
+        -------
+
+        snapshot : dict
+        """
+
+        values = []
+        for component in self._get_stateful_components():
+            if hasattr(component, '_value'):
+                values.append((component, '_value', _copy_state_value(component._value)))
+            if isinstance(component, ParameterState):
+                # Base value of the parameter (see ParameterState._execute), which can be modified by learning
+                backing_field = '_' + component.name
+                for param_owner in (component.owner.function_object, component.owner):
+                    if hasattr(param_owner, backing_field):
+                        values.append((param_owner, backing_field,
+                                       _copy_state_value(getattr(param_owner, backing_field))))
+                        break
+            for function in (getattr(component, 'function_object', None),
+                             getattr(component, 'integrator_function', None)):
+                if not isinstance(function, Function):
+                    continue
+                if hasattr(function, '_value'):
+                    values.append((function, '_value', _copy_state_value(function._value)))
+                for attr in function.stateful_attributes:
+                    if hasattr(function, attr):
+                        values.append((function, attr, _copy_state_value(getattr(function, attr))))
+
+        schedulers = []
+        for scheduler in (self.scheduler_processing, self.scheduler_learning):
+            if scheduler is None:
+                continue
+            schedulers.append((scheduler,
+                               copy.deepcopy(scheduler.clocks),
+                               _copy_counts(scheduler.counts_total),
+                               _copy_counts(scheduler.counts_useable),
+                               {execution_id: len(execution_list)
+                                for execution_id, execution_list in scheduler.execution_list.items()}))
+
+        self._cached_state = {
+            VALUES: values,
+            SCHEDULER: schedulers,
+            RANDOM_STATE: (np.random.get_state(),
+                           random.getstate(),
+                           [(component, component._random_state.get_state())
+                            for component in self._get_random_components()
+                            if component._random_state is not None]),
+        }
+        return self._cached_state
+
+    def _restore_state(self, snapshot=None):
+        """Reinstate, in place, the quantities captured by `_cache_state <System._cache_state>`
+
+        Arguments
+        ---------
+
+        snapshot : dict : default None
+            a snapshot returned by `_cache_state <System._cache_state>`;  if it is not specified, the one most
+            recently cached for the System is used.  A snapshot can be restored any number of times.
+        """
+
+        if snapshot is None:
+            try:
+                snapshot = self._cached_state
+            except AttributeError:
+                raise SystemError("No state has been cached for {}; call _cache_state() before _restore_state()".
+                                  format(self.name))
+
+        for owner, attr, value in snapshot[VALUES]:
+            # Assign directly (rather than through properties) so that restoration is not logged
+            setattr(owner, attr, _copy_state_value(value))
+
+        for scheduler, clocks, counts_total, counts_useable, execution_list_lengths in snapshot[SCHEDULER]:
+            scheduler.clocks = copy.deepcopy(clocks)
+            scheduler.counts_total = _copy_counts(counts_total)
+            scheduler.counts_useable = _copy_counts(counts_useable)
+            for execution_id in list(scheduler.execution_list):
+                if execution_id in execution_list_lengths:
+                    del scheduler.execution_list[execution_id][execution_list_lengths[execution_id]:]
+                else:
+                    del scheduler.execution_list[execution_id]
 
-        # http://stackoverflow.com/questions/11218477/how-can-i-use-pickle-to-save-a-dict
-        # import pickle
-        #
-        # a = {'hello': 'world'}
-        #
-        # with open('filename.pickle', 'wb') as handle:
-        #     pickle.dump(a, handle, protocol=pickle.HIGHEST_PROTOCOL)
-        #
-        # with open('filename.pickle', 'rb') as handle:
-        #     b = pickle.load(handle)
-        #
-        # print a == b
-
-        # >>> import dill
-        # >>> pik = dill.dumps(d)
-
-        # import pickle
-        # with open('cached_PNL_sys.pickle', 'wb') as handle:
-        #     pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
-
-        # import dill
-        # self.cached_system = dill.dumps(self, recurse=True)
-
-        # def mechanisms_cache:
-        #     self.input_value = []
-        #     self.value= []
-        #     self.output_value = []
-        #
-        # for mech in self.mechanisms:
-        #     for
-        pass
-
-    def _restore_state(self):
-        pass
+        np_random_state, random_state, component_random_states = snapshot[RANDOM_STATE]
+        np.random.set_state(np_random_state)
+        random.setstate(random_state)
+        for component, component_random_state in component_random_states:
+            component._random_state.set_state(component_random_state)
 
     @property
     def function(self):
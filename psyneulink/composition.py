@@ -47,7 +47,6 @@ Class Reference
 """
 
 import logging
-import uuid
 from collections import Iterable, OrderedDict
 from enum import Enum
 
@@ -58,6 +57,7 @@ from psyneulink.components.projections.pathway.mappingprojection import MappingP
 from psyneulink.components.shellclasses import Mechanism, Projection
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import EXECUTING
+from psyneulink.globals.utilities import _get_unique_id
 from psyneulink.scheduling.scheduler import Scheduler
 from psyneulink.scheduling.time import TimeScale
 
@@ -409,7 +409,7 @@ class Composition(object):
         return self._scheduler_learning
 
     def _get_unique_id(self):
-        return uuid.uuid4()
+        return _get_unique_id()
 
     def add_mechanism(self, mech):
         '''
@@ -756,16 +756,16 @@ class Composition(object):
 
     def _assign_execution_ids(self, execution_id):
         '''
-            assigns the same uuid to each Mechanism in the composition's processing graph as well as all input
-            mechanisms for this composition. The uuid is either specified in the user's call to run(), or generated
-            randomly at run time.
+            assigns the same execution_id to each Mechanism in the composition's processing graph as well as all input
+            mechanisms for this composition. The execution_id is either specified in the user's call to run(), or generated
+            at run time.
         '''
 
-        # Traverse processing graph and assign one uuid to all of its mechanisms
+        # Traverse processing graph and assign one execution_id to all of its mechanisms
         self._execution_id = execution_id or self._get_unique_id()
         for v in self._graph_processing.vertices:
             v.component._execution_id = self._execution_id
-        # Assign the uuid to all input mechanisms
+        # Assign the execution_id to all input mechanisms
         for k in self.input_mechanisms.keys():
             self.input_mechanisms[k]._execution_id = self._execution_id
 
@@ -805,8 +805,8 @@ class Composition(object):
                 the scheduler object that owns the conditions that will instruct the Learning execution of this Composition. \
                 If not specified, the Composition will use its automatically generated scheduler
 
-            execution_id : UUID
-                execution_id will typically be set to none and assigned randomly at runtime
+            execution_id : int
+                execution_id will typically be set to none and assigned automatically at runtime
 
             call_before_time_step : callable
                 will be called before each `TIME_STEP` is executed
@@ -915,8 +915,8 @@ class Composition(object):
                 the scheduler object that owns the conditions that will instruct the Learning execution of
                 this Composition. If not specified, the Composition will use its automatically generated scheduler.
 
-            execution_id : UUID
-                execution_id will typically be set to none and assigned randomly at runtime.
+            execution_id : int
+                execution_id will typically be set to none and assigned automatically at runtime.
 
             num_trials : int
                 typically, the composition will infer the number of trials from the length of its input specification.
@@ -64,6 +64,72 @@ operating state of the Component:
        The `string <Context.string>` attribute of Context is not the same as, nor does it usually contain the same
        information as the string returned by the `flags_string <Context.flags_string>` method of Context.
 
+.. _Context_Execution_Context:
+
+Execution Contexts
+------------------
+
+The `execution_phase <Context.execution_phase>` and `source <Context.source>` fields of `flags <Context.flags>`, and
+the `composition <Context.composition>`, `execution_id <Context.execution_id>`, `execution_time
+<Context.execution_time>` and `string <Context.string>` attributes, describe the execution in which a Component is
+currently involved, and are modified throughout its execution.  Ordinarily, they are shared by all of the code that
+uses the Component, so that the same Components cannot be executed concurrently (e.g., in different threads).  Code
+executed within an `execution_context` block sees the values of these attributes when the block was entered, but
+any changes that it makes to them are private to the block (and the thread in which it is executed), and are
+discarded when the block exits;  the `initialization_status <Context.initialization_status>` of a Component is
+always shared.  For example, the following executes a Mechanism in two threads, each of which has its own
+`execution_phase <Context.execution_phase>` for it::
+
+    >>> import threading
+    >>> import psyneulink as pnl
+    >>> my_mech = pnl.TransferMechanism()
+    >>> def execute(phase):
+    ...     with pnl.execution_context():
+    ...         my_mech.context.execution_phase = phase
+    ...         my_mech.execute([1.0])
+    >>> threads = [threading.Thread(target=execute, args=(phase,))
+    ...            for phase in (pnl.ContextFlags.PROCESSING, pnl.ContextFlags.CONTROL)]
+    >>> for thread in threads:
+    ...     thread.start()
+    >>> for thread in threads:
+    ...     thread.join()
+
+Blocks can be nested, in which case the inner block starts with the values in the outer one.
+
+.. _Context_Execution_Values:
+
+Execution Values
+~~~~~~~~~~~~~~~~
+
+The attributes of a Component that are assigned when it is executed -- its `value <Component.value>` and `variable
+<Component.variable>` (for a Mechanism, State, Projection or Function), the `stateful_attributes
+<Function_Base.stateful_attributes>` of a Function (e.g., the `previous_value <Integrator.previous_value>` of an
+Integrator), and the execution_id assigned to a Mechanism by the System in which it is executed -- can also be stored
+separately for each of any number of executions, as can the counts and `Clock` of a `Scheduler`.  Code executed within
+an `execution_context` block for which an **execution_id** is specified reads and assigns these attributes for that
+execution:  if one has not yet been assigned in the execution, its value is read from the attributes shared by code
+outside of any execution (so that an execution starts from, or *forks*, the current state of the Components), but
+assigning it affects only that execution.  Values assigned in an execution are kept after the block exits, so that
+the execution can be continued by another block with the same **execution_id**, and are discarded by calling
+`delete_execution`.  For example, the following runs the trials of two independent sequences of inputs to the same
+System, interleaved with each other::
+
+    >>> my_integrator = pnl.TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+    >>> my_system = pnl.System(processes=[pnl.Process(pathway=[my_integrator])])
+    >>> for trial in range(3):
+    ...     for execution_id, input in (('low', 1.0), ('high', 10.0)):
+    ...         with pnl.execution_context(execution_id=execution_id):
+    ...             _ = my_system.run(inputs={my_integrator: [input]})
+    >>> with pnl.execution_context(execution_id='high'):
+    ...     my_integrator.value
+    array([[8.75]])
+    >>> pnl.delete_execution('low')
+    >>> pnl.delete_execution('high')
+
+Blocks for different executions can be executed concurrently in different threads.  The parameters of Components
+(including any that are modified by `learning <LearningMechanism>`) are shared by all executions, as are their `Log`
+and the `results <System.results>` of a System.
+
 COMMENT:
     IMPLEMENTATION NOTE: Use of ContextFlags in **context** argument of methods for context message-passing
         ContextFlags is also used for passing context messages to methods (in the **context** argument).
@@ -92,10 +158,11 @@ Class Reference
 
 """
 
+import threading
 import warnings
 from collections import namedtuple
+from contextlib import contextmanager
 from enum import IntEnum
-from uuid import UUID
 
 import typecheck as tc
 
@@ -109,6 +176,8 @@ from psyneulink.globals.keywords import \
 __all__ = [
     'Context',
     'ContextFlags',
+    'delete_execution',
+    'execution_context',
     '_get_context'
 ]
 
@@ -289,6 +358,136 @@ class ContextStatus(IntEnum):
     """Specifies all contexts."""
 
 
+# Holds the private execution states of each thread within an execution_context block, and the execution_id of
+#    the block
+_execution_local = threading.local()
+
+# Values of the attributes of Components assigned in each execution:  {execution_id: {(id(owner), name): (owner, value)}}
+#    (the owner is stored with its value so that its id is not reused while the execution exists)
+_execution_values = {}
+
+
+@contextmanager
+def execution_context(execution_id=None):
+    """execution_context(execution_id=None)
+
+    Context manager within which changes to the execution state of the `Context` of any Component are private to
+    the block and the current thread (see `Context_Execution_Context`).
+
+    Arguments
+    ---------
+
+    execution_id : hashable : default None
+        specifies the execution for which the values of Components are read and assigned within the block (see
+        `Context_Execution_Values`);  if it is None, the execution of the enclosing block (if any) is used.
+    """
+    outer_states = getattr(_execution_local, 'states', None)
+    outer_execution_id = getattr(_execution_local, 'execution_id', None)
+    if outer_states is None:
+        _execution_local.states = {}
+    else:
+        _execution_local.states = {key: (context, state._copy()) for key, (context, state) in outer_states.items()}
+    if execution_id is not None:
+        _execution_local.execution_id = execution_id
+    try:
+        yield
+    finally:
+        _execution_local.states = outer_states
+        _execution_local.execution_id = outer_execution_id
+
+
+def delete_execution(execution_id):
+    """Discard the values assigned to Components in the execution identified by **execution_id** (see
+    `Context_Execution_Values`)
+    """
+    _execution_values.pop(execution_id, None)
+
+
+def _get_execution_id():
+    """Return the execution_id of the current `execution_context` block (None if there is none)"""
+    return getattr(_execution_local, 'execution_id', None)
+
+
+def _get_execution_value(owner, name, default):
+    """Return the value of attribute **name** of **owner** in the current execution, or **default** if it has not
+    been assigned one in the execution (or if there is no current execution)
+    """
+    execution_id = getattr(_execution_local, 'execution_id', None)
+    if execution_id is None:
+        return default
+    try:
+        return _execution_values[execution_id][id(owner), name][1]
+    except KeyError:
+        return default
+
+
+def _set_execution_value(owner, name, value):
+    """Assign **value** to attribute **name** of **owner** in the current execution;  return False if there is no
+    current execution (in which case the caller assigns the shared attribute)
+    """
+    execution_id = getattr(_execution_local, 'execution_id', None)
+    if execution_id is None:
+        return False
+    _execution_values.setdefault(execution_id, {})[id(owner), name] = (owner, value)
+    return True
+
+
+_MISSING = object()
+
+
+class _ExecutionAttribute:
+    """Descriptor for an attribute of a Component that is stored separately for each execution (see
+    `Context_Execution_Values`);  the value shared outside of any execution is stored in the instance's __dict__
+    under the same name.
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            default = instance.__dict__[self.name]
+        except KeyError:
+            default = _MISSING
+        value = _get_execution_value(instance, self.name, default)
+        if value is _MISSING:
+            raise AttributeError("{!r} object has no attribute {!r}".format(owner.__name__, self.name))
+        return value
+
+    def __set__(self, instance, value):
+        if not _set_execution_value(instance, self.name, value):
+            instance.__dict__[self.name] = value
+
+
+@contextmanager
+def _shared_execution_state():
+    """Context manager within which changes to the execution state of a Context are shared, even within an
+    `execution_context` block
+    """
+    states = getattr(_execution_local, 'states', None)
+    _execution_local.states = None
+    try:
+        yield
+    finally:
+        _execution_local.states = states
+
+
+class _ExecutionState:
+    """The execution state of a Context private to an `execution_context` block
+
+    Has the same attributes as those of Context that store its execution state, except that _flags contains only the
+    execution_phase and source fields.
+    """
+    __slots__ = ('_flags', '_composition', '_execution_id', '_execution_time', '_string')
+
+    def _copy(self):
+        state = _ExecutionState()
+        for attr in self.__slots__:
+            setattr(state, attr, getattr(self, attr))
+        return state
+
+
 class Context():
     """Used to indicate the state of initialization and phase of execution of a Component, as well as the source of
     call of a method;  also used to specify and identify `conditions <Log_Conditions>` for `logging <Log>`.
@@ -347,7 +546,7 @@ class Context():
     composition : Composition
       the `Composition <Composition>` in which the `owner <Context.owner>` is currently being executed.
 
-    execution_id : UUID
+    execution_id : int
       the execution_id assigned to the Component by the Composition in which it is currently being executed.
 
     execution_time : TimeScale
@@ -370,10 +569,16 @@ class Context():
                  execution_phase=None,
                  # source=ContextFlags.COMPONENT,
                  source=ContextFlags.NONE,
-                 execution_id:UUID=None,
+                 execution_id=None,
                  string:str='', time=None):
 
         self.owner = owner
+        with _shared_execution_state():
+            self._initialize_attributes(composition, flags, initialization_status, execution_phase, source,
+                                        execution_id, string)
+
+    def _initialize_attributes(self, composition, flags, initialization_status, execution_phase, source,
+                               execution_id, string):
         self.composition = composition
         self.initialization_status = initialization_status
         self.execution_phase = execution_phase
@@ -399,10 +604,33 @@ class Context():
         self.execution_time = None
         self.string = string
 
+    def _get_execution_state(self, create=False):
+        """Return the object that holds the execution state of the Context in the current `execution_context` block
+        (or the Context itself, if not in a block).  If **create** is True, create the block's private state for the
+        Context if it doesn't have one yet;  otherwise, return the Context if it doesn't.
+        """
+        states = getattr(_execution_local, 'states', None)
+        if states is None:
+            return self
+        try:
+            return states[id(self)][1]
+        except KeyError:
+            if not create:
+                return self
+        state = _ExecutionState()
+        state._flags = self.flags & ~ContextFlags.INITIALIZATION_MASK
+        state._composition = self.composition
+        state._execution_id = self.execution_id
+        state._execution_time = self.execution_time
+        state._string = self.string
+        # The Context is stored with its state so that its id is not reused while the block is active
+        states[id(self)] = (self, state)
+        return state
+
     @property
     def composition(self):
         try:
-            return self._composition
+            return self._get_execution_state()._composition
         except AttributeError:
             self._composition = None
 
@@ -411,7 +639,7 @@ class Context():
         # from psyneulink.composition import Composition
         # if isinstance(composition, Composition):
         if composition is None or composition.__class__.__name__ in {'Composition', 'System'}:
-            self._composition = composition
+            self._get_execution_state(create=True)._composition = composition
         else:
             raise ContextError("Assignment to context.composition for {} ({}) "
                                "must be a Composition (or \'None\').".format(self.owner.name, composition))
@@ -419,15 +647,25 @@ class Context():
     @property
     def flags(self):
         try:
-            return self._flags
+            flags = self._flags
         except:
             self._flags = ContextFlags.UNINITIALIZED |ContextFlags.COMPONENT
-            return self._flags
+            flags = self._flags
+        state = self._get_execution_state()
+        if state is self:
+            return flags
+        # The initialization status is always shared
+        return flags & ContextFlags.INITIALIZATION_MASK | state._flags
 
     @flags.setter
     def flags(self, flags):
         if isinstance(flags, (ContextFlags, int)):
-            self._flags = flags
+            state = self._get_execution_state(create=True)
+            if state is self:
+                self._flags = flags
+            else:
+                state._flags = flags & ~ContextFlags.INITIALIZATION_MASK
+                self._flags = self._flags & ~ContextFlags.INITIALIZATION_MASK | flags & ContextFlags.INITIALIZATION_MASK
         else:
             raise ContextError("\'{}\'{} argument in call to {} must be a {} or an int".
                                format(FLAGS, flags, self.__name__, ContextFlags.__name__))
@@ -495,16 +733,38 @@ class Context():
             raise ContextError("Attempt to assign more than one flag ({}) to {}.context.source".
                                format(ContextFlags._get_context_string(flag), self.owner.name))
 
+    @property
+    def execution_id(self):
+        try:
+            return self._get_execution_state()._execution_id
+        except AttributeError:
+            return None
+
+    @execution_id.setter
+    def execution_id(self, execution_id):
+        self._get_execution_state(create=True)._execution_id = execution_id
+
     @property
     def execution_time(self):
         try:
-            return self._execution_time
+            return self._get_execution_state()._execution_time
         except:
             return None
 
     @execution_time.setter
     def execution_time(self, time):
-        self._execution_time = time
+        self._get_execution_state(create=True)._execution_time = time
+
+    @property
+    def string(self):
+        try:
+            return self._get_execution_state()._string
+        except AttributeError:
+            return ''
+
+    @string.setter
+    def string(self, string):
+        self._get_execution_state(create=True)._string = string
 
     def update_execution_time(self):
         if self.execution & ContextFlags.EXECUTING:
@@ -558,14 +818,21 @@ def _get_time(component, context_flags):
     Otherwise, returns (None, None, None)
 
     """
+    return _resolve_time_stamp(_get_time_stamp(component, context_flags))
+
+
+def _get_time_ref_mech(component):
+    """Return the Mechanism to which **component** belongs (cached on the Component, since this does not change)"""
+
+    try:
+        return component._time_ref_mech
+    except AttributeError:
+        pass
 
-    from psyneulink.globals.context import time
     from psyneulink.components.mechanisms.mechanism import Mechanism
     from psyneulink.components.states.state import State
     from psyneulink.components.projections.projection import Projection
 
-    no_time = time(None, None, None, None)
-
     # Get mechanism to which Component being logged belongs
     if isinstance(component, Mechanism):
         ref_mech = component
@@ -585,6 +852,20 @@ def _get_time(component, context_flags):
                        format(component.__class__.__name__,
                               Mechanism.__name__, State.__name__, Projection.__name__))
 
+    component._time_ref_mech = ref_mech
+    return ref_mech
+
+
+def _get_time_stamp(component, context_flags):
+    """Get a time stamp from the Clock of the System in which Component is being executed.
+
+    The time stamp is a tuple with the Clock and the index of its current time in the Clock's record of times;
+    it is resolved to a `time` tuple by `_resolve_time_stamp` only when needed.
+    Returns None if the Component is not being executed during Processing, Control or Learning in a System.
+    """
+
+    ref_mech = _get_time_ref_mech(component)
+
     # FIX: Modify to use component.owner.context.composition once that is implemented
     # Get System in which it is being (or was last) executed (if any):
 
@@ -593,35 +874,33 @@ def _get_time(component, context_flags):
     # if context_flags & (ContextFlags.COMMAND_LINE | ContextFlags.RUN | ContextFlags.TRIAL):
         if component.prev_context:
             context_flags = component.prev_context.flags
-            execution_context = component.prev_context.string
         else:
             context_flags = ContextFlags.UNINITIALIZED
-    else:
-        execution_context = component.context.string
 
     system = ref_mech.context.composition
 
     if system:
         execution_flags = context_flags & ContextFlags.EXECUTION_PHASE_MASK
-        if execution_flags == ContextFlags.PROCESSING or not execution_flags:
-            t = system.scheduler_processing.clock.time
-            t = time(t.run, t.trial, t.pass_, t.time_step)
-        elif execution_flags == ContextFlags.CONTROL:
-            t = system.scheduler_processing.clock.time
-            t = time(t.run, t.trial, t.pass_, t.time_step)
+        if execution_flags == ContextFlags.PROCESSING or execution_flags == ContextFlags.CONTROL or not execution_flags:
+            clock = system.scheduler_processing.clock
         elif execution_flags == ContextFlags.LEARNING:
-            t = system.scheduler_learning.clock.time
-            t = time(t.run, t.trial, t.pass_, t.time_step)
+            clock = system.scheduler_learning.clock
         else:
-            t = None
-
-    else:
-        if component.verbosePref:
-            offender = "\'{}\'".format(component.name)
-            if ref_mech is not component:
-                offender += " [{} of {}]".format(component.__class__.__name__, ref_mech.name)
-            warnings.warn("Attempt to log {} which is not in a System (logging is currently supported only "
-                          "when running Components within a System".format(offender))
-        t = None
-
-    return t or no_time
+            return None
+        return (clock, clock._time_index)
+
+    if component.verbosePref:
+        offender = "\'{}\'".format(component.name)
+        if ref_mech is not component:
+            offender += " [{} of {}]".format(component.__class__.__name__, ref_mech.name)
+        warnings.warn("Attempt to log {} which is not in a System (logging is currently supported only "
+                      "when running Components within a System".format(offender))
+    return None
+
+
+def _resolve_time_stamp(time_stamp):
+    """Return the `time` tuple for a time stamp returned by `_get_time_stamp` (all None if time_stamp is None)"""
+    if time_stamp is None:
+        return time(None, None, None, None)
+    clock, index = time_stamp
+    return time(*clock._get_time_by_index(index))
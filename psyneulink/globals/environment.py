@@ -162,6 +162,42 @@ items in the list of inputs will be used on the 6th and 7th trials, respectively
         s.run(inputs=input_dictionary,
               num_trials=7)
 
+.. _Run_Inputs_Streaming:
+
+Inputs that are too large to be specified as lists can be specified in either of two other forms, neither of which is
+converted to a list before the run begins:
+
+* a numeric np.ndarray -- including a memory-mapped one (e.g., returned by ``np.load(filename, mmap_mode='r')``) --
+  the first axis of which indexes trials;  its shape is validated once, when `run` is called, and the input for each
+  `TRIAL` is extracted only when that `TRIAL` is executed.
+
+* an iterator or generator (or other iterable that is not a list, tuple or np.ndarray) that produces the input for
+  one `TRIAL` each time it is called;  each input is validated and converted when it is produced.  Since the number of
+  inputs is not known in advance, the run ends when **num_trials** is reached or any input iterator is exhausted,
+  whichever comes first (if **num_trials** is not specified, it ends only when an iterator is exhausted).  Inputs
+  specified for other `ORIGIN` Mechanisms as lists or arrays are cycled as described above.
+
+Neither form can include `labels <Mechanism_Labels_Dicts>`.  Targets (see `below <Run_Targets>`) can be specified in
+the same forms.
+
+::
+
+        import numpy as np
+        import psyneulink as pnl
+
+        a = pnl.TransferMechanism(name='a')
+        b = pnl.TransferMechanism(name='b')
+
+        p1 = pnl.Process(pathway=[a, b])
+
+        s = pnl.System(processes=[p1])
+
+        def curriculum(num_trials):
+            for trial in range(num_trials):
+                yield [[np.sin(trial)]]
+
+        s.run(inputs={a: curriculum(10**7)})
+
 .. _Input_Specification_Examples:
 
 For convenience, condensed versions of the input specification described above are also accepted in the following
@@ -474,6 +510,43 @@ Shorthand - specify the targets in a list because there is only one learning seq
         ...       targets=target_list)
 
 
+.. _Run_Results:
+
+Results
+~~~~~~~
+
+By default, the result of each `TRIAL` (the `value <OutputState.value>` of the OutputStates of the Mechanism,
+or of the `TERMINAL` Mechanism(s) of the Process or System, being run) is appended to the ``results`` attribute of
+the Component being run, which is returned by `run`.  For long runs, a `ResultsSink` can be specified in the
+**results_sink** argument of `run` instead;  the result of each `TRIAL` is then passed to the sink (and not
+appended to ``results``), and `run` returns the sink's `results <ResultsSink.results>` attribute.  The following
+sinks are available:
+
+* `ArrayResultsSink` -- stores results in an ndarray that is preallocated for the number of `TRIAL`\s (for results
+  that have the same shape on every `TRIAL`);
+
+* `CallbackResultsSink` -- passes the result of each `TRIAL` to a function, and stores nothing;
+
+* `ChunkedFileResultsSink` -- stores results in a buffer of a fixed number of `TRIAL`\s, that is appended to a
+  file each time it is full;
+
+* `StatisticsResultsSink` -- keeps only the running mean, variance, minimum and maximum of the results.
+
+Other sinks can be implemented by subclassing `ResultsSink`.
+
+::
+
+        import psyneulink as pnl
+
+        a = pnl.TransferMechanism(name='a')
+        b = pnl.TransferMechanism(name='b')
+
+        s = pnl.System(processes=[pnl.Process(pathway=[a, b])])
+
+        stats = pnl.StatisticsResultsSink()
+        s.run(inputs={a: [[1.0], [2.0], [3.0]]}, results_sink=stats)
+        stats.mean    # array([[2.]])
+
 .. _Run_Class_Reference:
 
 Class Reference
@@ -482,6 +555,7 @@ Class Reference
 """
 
 import datetime
+import itertools
 import warnings
 from collections import Iterable
 from numbers import Number
@@ -495,10 +569,12 @@ from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import INPUT_LABELS_DICT, MECHANISM, \
     PROCESS, RUN, SAMPLE, SYSTEM, TARGET
 from psyneulink.globals.log import LogCondition
+from psyneulink.globals.utilities import _get_unique_id
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
-    'EXECUTION_SET_DIM', 'MECHANISM_DIM', 'RunError', 'STATE_DIM', 'run'
+    'ArrayResultsSink', 'CallbackResultsSink', 'ChunkedFileResultsSink', 'EXECUTION_SET_DIM', 'MECHANISM_DIM',
+    'ResultsSink', 'RunError', 'STATE_DIM', 'StatisticsResultsSink', 'run'
 ]
 
 EXECUTION_SET_DIM = 0
@@ -512,6 +588,269 @@ class RunError(Exception):
      def __str__(object):
          return repr(object.error_value)
 
+
+class ResultsSink():
+    """Receives the result of each `TRIAL` of a `run <Run>` in place of the ``results`` attribute of the Component run.
+
+    ResultsSink itself only counts the results it receives, discarding them.  Subclasses override `append
+    <ResultsSink.append>` to keep or process each result, and can override `open <ResultsSink.open>` and `close
+    <ResultsSink.close>` (see `Run_Results`).
+
+    Attributes
+    ----------
+
+    num_results : int
+        the number of results received since the sink was last opened.
+
+    results : object
+        returned by `run` when it is called with the sink;  None unless assigned by the subclass.
+    """
+
+    results = None
+
+    def __init__(self):
+        self.num_results = 0
+
+    def open(self, object, num_trials):
+        """Called by `run` before the first `TRIAL`;  **num_trials** is None if it is not known in advance."""
+        self.num_results = 0
+
+    def append(self, result):
+        """Called by `run` with the result of each `TRIAL`."""
+        self.num_results += 1
+
+    def close(self):
+        """Called by `run` after the last `TRIAL`."""
+        pass
+
+    @staticmethod
+    def _to_array(result, dtype=float):
+        try:
+            return np.asarray(result, dtype=dtype)
+        except ValueError:
+            raise RunError("Result ({}) of a trial does not have a fixed shape, as required by a {}".
+                           format(result, ResultsSink.__name__))
+
+
+class ArrayResultsSink(ResultsSink):
+    """Store the result of each `TRIAL` in a preallocated ndarray.
+
+    The array is allocated when `run` is called, with its first axis equal to the number of `TRIAL`\\s (or, if that
+    is not known in advance because the inputs are streamed, an initial size that is doubled whenever it is filled),
+    and the shape of each result taken from the first one (if **shape** is not specified).  The result of each
+    `TRIAL` is copied into the array, so results must have the same shape on every `TRIAL`.
+
+    Arguments
+    ---------
+
+    shape : tuple : default None
+        the shape of the result of a single `TRIAL`;  if it is not specified, it is determined from the first result.
+
+    dtype : numpy dtype : default float
+        the dtype of the array.
+
+    Attributes
+    ----------
+
+    results : ndarray
+        the results received so far, one per `TRIAL` along the first axis.
+    """
+
+    _initial_size = 1024
+
+    def __init__(self, shape=None, dtype=float):
+        super().__init__()
+        self.shape = shape
+        self.dtype = dtype
+        self._buffer = None
+
+    def open(self, object, num_trials):
+        super().open(object, num_trials)
+        self._num_trials = num_trials
+        self._buffer = None
+        if self.shape is not None:
+            self._allocate(self.shape)
+
+    def _allocate(self, shape):
+        size = self._num_trials if self._num_trials is not None else self._initial_size
+        self._buffer = np.empty((size,) + tuple(shape), dtype=self.dtype)
+
+    def append(self, result):
+        if self._buffer is None:
+            self._allocate(self._to_array(result, self.dtype).shape)
+        if self.num_results == len(self._buffer):
+            self._buffer = np.concatenate((self._buffer, np.empty_like(self._buffer)))
+        try:
+            self._buffer[self.num_results] = result
+        except ValueError:
+            raise RunError("Shape of result ({}) does not match the shape of the other results stored by {} ({})".
+                           format(np.shape(result), self.__class__.__name__, self._buffer.shape[1:]))
+        self.num_results += 1
+
+    @property
+    def results(self):
+        if self._buffer is None:
+            return None
+        return self._buffer[:self.num_results]
+
+
+class CallbackResultsSink(ResultsSink):
+    """Pass the result of each `TRIAL` to a function, without storing it.
+
+    Arguments
+    ---------
+
+    function : function
+        called with the number of the `TRIAL` (beginning at 0) and its result;  the result is the value assigned to
+        the Component, and so should be copied if it is to be kept.
+    """
+
+    def __init__(self, function):
+        super().__init__()
+        if not callable(function):
+            raise RunError("function arg for {} ({}) must be callable".format(self.__class__.__name__, function))
+        self.function = function
+
+    def append(self, result):
+        self.function(self.num_results, result)
+        self.num_results += 1
+
+
+class ChunkedFileResultsSink(ResultsSink):
+    """Store results in a buffer of **chunk_size** `TRIAL`\\s that is appended to a file whenever it is full.
+
+    Each chunk is written with ``np.save``, so that the file can be read (e.g., using `read
+    <ChunkedFileResultsSink.read>`) by calling ``np.load`` on it repeatedly.  Results must have the same shape on
+    every `TRIAL`.  The file is overwritten the first time the sink is used, and appended to in subsequent runs.
+
+    Arguments
+    ---------
+
+    filename : str
+        the file to which the results are written.
+
+    chunk_size : int : default 1000
+        the number of `TRIAL`\\s buffered before they are written.
+
+    dtype : numpy dtype : default float
+        the dtype in which results are written.
+
+    Attributes
+    ----------
+
+    results : str
+        the name of the file to which the results are written.
+    """
+
+    def __init__(self, filename, chunk_size=1000, dtype=float):
+        super().__init__()
+        self.filename = filename
+        self.results = filename
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self._chunk = None
+        self._num_in_chunk = 0
+        self._file_mode = 'wb'
+
+    def open(self, object, num_trials):
+        super().open(object, num_trials)
+        self._chunk = None
+        self._num_in_chunk = 0
+
+    def append(self, result):
+        if self._chunk is None:
+            self._chunk = np.empty((self.chunk_size,) + self._to_array(result, self.dtype).shape, dtype=self.dtype)
+        self._chunk[self._num_in_chunk] = result
+        self._num_in_chunk += 1
+        self.num_results += 1
+        if self._num_in_chunk == self.chunk_size:
+            self._write()
+
+    def close(self):
+        if self._num_in_chunk:
+            self._write()
+
+    def _write(self):
+        with open(self.filename, self._file_mode) as f:
+            np.save(f, self._chunk[:self._num_in_chunk])
+        self._file_mode = 'ab'
+        self._num_in_chunk = 0
+
+    def read(self):
+        """Return all of the results in the file, as a single ndarray."""
+        chunks = []
+        with open(self.filename, 'rb') as f:
+            while True:
+                try:
+                    chunks.append(np.load(f))
+                except (OSError, ValueError):
+                    break
+        return np.concatenate(chunks)
+
+
+class StatisticsResultsSink(ResultsSink):
+    """Keep only the running mean, variance, minimum and maximum of the results (computed elementwise).
+
+    The mean and variance are updated using Welford's algorithm.  Results must have the same shape on every `TRIAL`.
+    The statistics are reset each time the sink is passed to `run`.
+
+    Attributes
+    ----------
+
+    mean : ndarray
+        the mean of the results.
+
+    variance : ndarray
+        the (population) variance of the results.
+
+    min : ndarray
+        the minimum of the results.
+
+    max : ndarray
+        the maximum of the results.
+
+    results : StatisticsResultsSink
+        the sink itself.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._reset()
+
+    def open(self, object, num_trials):
+        super().open(object, num_trials)
+        self._reset()
+
+    def _reset(self):
+        self.mean = None
+        self._sum_squared_deviations = None
+        self.min = None
+        self.max = None
+
+    @property
+    def results(self):
+        return self
+
+    def append(self, result):
+        result = self._to_array(result)
+        if self.mean is None:
+            self.mean = np.zeros_like(result)
+            self._sum_squared_deviations = np.zeros_like(result)
+            self.min = result.copy()
+            self.max = result.copy()
+        self.num_results += 1
+        delta = result - self.mean
+        self.mean += delta / self.num_results
+        self._sum_squared_deviations += delta * (result - self.mean)
+        np.minimum(self.min, result, out=self.min)
+        np.maximum(self.max, result, out=self.max)
+
+    @property
+    def variance(self):
+        if not self.num_results:
+            return None
+        return self._sum_squared_deviations / self.num_results
+
 @tc.typecheck
 def run(object,
         inputs,
@@ -526,6 +865,7 @@ def run(object,
         call_after_time_step:tc.optional(callable)=None,
         termination_processing=None,
         termination_learning=None,
+        results_sink:tc.optional(ResultsSink)=None,
         context=ContextFlags.COMMAND_LINE):
     """run(                      \
     inputs,                      \
@@ -537,7 +877,8 @@ def run(object,
     call_before_trial=None,      \
     call_after_trial=None,       \
     call_before_time_step=None,  \
-    call_after_time_step=None,   \)
+    call_after_time_step=None,   \
+    results_sink=None)
 
     Run a sequence of executions for a `Process` or `System`.
 
@@ -572,7 +913,9 @@ def run(object,
     num_trials : int : default None
         the number of `TRIAL` \\s to run.  If it is `None` (the default), then a number of `TRIAL` \\s run will be equal
         equal to the number of items specified in the **inputs** argument.  If **num_trials** exceeds the number of
-        inputs, then the inputs will be cycled until the number of `TRIAL` \\s specified have been run.
+        inputs, then the inputs will be cycled until the number of `TRIAL` \\s specified have been run.  If any
+        inputs are streamed, and **num_trials** is `None`, the run ends only when a stream is exhausted (see
+        `Run_Inputs_Streaming`).
 
     initialize : bool default False
         calls the `initialize <System.initialize>` method of the System prior to the first `TRIAL`.
@@ -608,17 +951,21 @@ def run(object,
         a dictionary containing `Condition`\\ s that signal the end of the associated `TimeScale` within the :ref:`learning
         phase of execution <System_Execution_Learning>`
 
+    results_sink : ResultsSink : default None
+        receives the result of each `TRIAL` in place of ``<object>.results`` (see `Run_Results`).
+
    Returns
    -------
 
     <object>.results : List[OutputState.value]
         list of the values, for each `TRIAL`, of the OutputStates for a Mechanism run directly,
-        or of the OutputStates of the `TERMINAL` Mechanisms for the Process or System run.
+        or of the OutputStates of the `TERMINAL` Mechanisms for the Process or System run;
+        if **results_sink** is specified, its `results <ResultsSink.results>` attribute is returned instead.
     """
     from psyneulink.globals.context import ContextFlags
 
     # small version of 'sequence' format in the once case where it was still working (single origin mechanism)
-    if isinstance(inputs, (list, np.ndarray)):
+    if isinstance(inputs, (list, np.ndarray)) or _is_input_stream(inputs):
         if len(object.origin_mechanisms) == 1:
             inputs = {object.origin_mechanisms[0]: inputs}
         else:
@@ -633,9 +980,13 @@ def run(object,
                            "mechanisms.".format(object.name, len(object.origin_mechanisms)))
 
     inputs, num_inputs_sets = _adjust_stimulus_dict(object, inputs)
+    input_streams = {mech for mech in inputs if _is_input_stream(inputs[mech])}
 
     if num_trials is not None:
         num_trials = num_trials
+    elif input_streams:
+        # Note: if any inputs are streams, run until one is exhausted (inputs specified as lists or arrays are cycled)
+        num_trials = None
     else:
         num_trials = num_inputs_sets
 
@@ -646,7 +997,7 @@ def run(object,
         if isinstance(targets, dict):
             targets, num_targets = _adjust_target_dict(object, targets)
 
-        elif isinstance(targets, (list, np.ndarray)):
+        elif isinstance(targets, (list, np.ndarray)) or _is_input_stream(targets):
             # small version of former 'sequence' format -- only allowed if there is a single Target mechanism
             if len(object.target_mechanisms) == 1:
                 targets = {object.target_mechanisms[0].input_states[SAMPLE].path_afferents[0].sender.owner: targets}
@@ -663,8 +1014,10 @@ def run(object,
         else:
             raise RunError("Target values for {} must be specified in a dictionary.".format(object.name))
 
-        # if num_targets = -1, all targets were specified as functions
-        if num_targets != num_inputs_sets and num_targets != -1:
+        # if num_targets = -1, all targets were specified as functions;  if it is None, all were specified as streams;
+        #    if num_inputs_sets is None, all inputs were specified as streams, and the targets are cycled
+        if (num_targets != num_inputs_sets and num_targets != -1
+                and num_targets is not None and num_inputs_sets is not None):
             raise RunError("Number of target values specified ({}) for each learning sequence in {} must equal the "
                            "number of input values specified ({}) for each origin mechanism in {}."
                            .format(num_targets, object.name, num_inputs_sets, object.name))
@@ -717,69 +1070,100 @@ def run(object,
     # EXECUTE
     execution_inputs = {}
     execution_targets = {}
-    for execution in range(num_trials):
+    if targets is not None and not isinstance(targets, function_type):
+        target_streams = {mech for mech in targets if _is_input_stream(targets[mech])}
+    else:
+        target_streams = set()
+
+    if results_sink is not None:
+        results_sink.open(object, num_trials)
+
+    # the sink is closed even if a TRIAL raises an exception, so that results it has buffered are not lost
+    try:
+        for execution in (range(num_trials) if num_trials is not None else itertools.count()):
+
+            # Get inputs and targets for the trial (streams are advanced here, and end the run when exhausted)
+            input_num = execution%num_inputs_sets if num_inputs_sets else None
+            if targets is not None and num_inputs_sets is None and num_targets not in {-1, None}:
+                target_num = execution%num_targets
+            else:
+                target_num = input_num
+            try:
+                for mech in inputs:
+                    if mech in input_streams:
+                        execution_inputs[mech] = next(inputs[mech])
+                    else:
+                        execution_inputs[mech] = inputs[mech][input_num]
 
-        execution_id = _get_unique_id()
+                if targets is not None and not isinstance(targets, function_type):
+                    for mech in targets:
+                        if mech in target_streams:
+                            execution_targets[mech] = next(targets[mech])
+                        elif callable(targets[mech]):
+                            execution_targets[mech] = targets[mech]
+                        else:
+                            execution_targets[mech] = targets[mech][target_num]
+            except StopIteration:
+                break
 
-        if call_before_trial:
-            call_before_trial()
+            execution_id = _get_unique_id()
 
-        for time_step in range(time_steps):
+            if call_before_trial:
+                call_before_trial()
 
-            if call_before_time_step:
-                call_before_time_step()
+            for time_step in range(time_steps):
 
-            input_num = execution%num_inputs_sets
+                if call_before_time_step:
+                    call_before_time_step()
 
-            for mech in inputs:
-                execution_inputs[mech] = inputs[mech][input_num]
-            if object_type == SYSTEM:
-                object.inputs = execution_inputs
+                if object_type == SYSTEM:
+                    object.inputs = execution_inputs
 
-            # Assign targets:
-            if targets is not None:
+                # Assign targets:
+                if targets is not None:
 
-                if isinstance(targets, function_type):
-                    object.target = targets
-                else:
-                    for mech in targets:
-                        if callable(targets[mech]):
-                            execution_targets[mech] = targets[mech]
-                        else:
-                            execution_targets[mech] = targets[mech][input_num]
-                    if object_type is SYSTEM:
+                    if isinstance(targets, function_type):
+                        object.target = targets
+                    elif object_type is SYSTEM:
                         object.target = execution_targets
                         object.current_targets = execution_targets
 
-            if context == ContextFlags.COMMAND_LINE and not object.context.execution_phase == ContextFlags.SIMULATION:
-                object.context.execution_phase = ContextFlags.PROCESSING
-                object.context.string = RUN + ": EXECUTING " + object_type.upper() + " " + object.name
+                if (context == ContextFlags.COMMAND_LINE
+                        and not object.context.execution_phase == ContextFlags.SIMULATION):
+                    object.context.execution_phase = ContextFlags.PROCESSING
+                    object.context.string = RUN + ": EXECUTING " + object_type.upper() + " " + object.name
 
-            result = object.execute(
-                input=execution_inputs,
-                execution_id=execution_id,
-                termination_processing=termination_processing,
-                termination_learning=termination_learning,
-                context=context
-            )
+                result = object.execute(
+                    input=execution_inputs,
+                    execution_id=execution_id,
+                    termination_processing=termination_processing,
+                    termination_learning=termination_learning,
+                    context=context
+                )
 
-            if call_after_time_step:
-                call_after_time_step()
+                if call_after_time_step:
+                    call_after_time_step()
 
-        # object.results.append(result)
-        if isinstance(result, Iterable):
-            result_copy = result.copy()
-        else:
-            result_copy = result
-        object.results.append(result_copy)
+            if results_sink is not None:
+                results_sink.append(result)
+            else:
+                # object.results.append(result)
+                if isinstance(result, Iterable):
+                    result_copy = result.copy()
+                else:
+                    result_copy = result
+                object.results.append(result_copy)
 
-        if call_after_trial:
-            call_after_trial()
+            if call_after_trial:
+                call_after_trial()
 
-        from psyneulink.globals.log import _log_trials_and_runs, ContextFlags
-        _log_trials_and_runs(composition=object,
-                             curr_condition=LogCondition.TRIAL,
-                             context=context)
+            from psyneulink.globals.log import _log_trials_and_runs, ContextFlags
+            _log_trials_and_runs(composition=object,
+                                 curr_condition=LogCondition.TRIAL,
+                                 context=context)
+    finally:
+        if results_sink is not None:
+            results_sink.close()
 
     try:
         object.scheduler_processing.date_last_run_end = datetime.datetime.now()
@@ -804,6 +1188,9 @@ def run(object,
                          curr_condition=LogCondition.RUN,
                          context=context)
 
+    if results_sink is not None:
+        return results_sink.results
+
     return object.results
 
 @tc.typecheck
@@ -827,9 +1214,10 @@ def _target_matches_input_state_variable(target, input_state_variable):
 
 def _adjust_stimulus_dict(obj, stimuli):
 
-    #  STEP 0:  parse any labels into array entries
+    #  STEP 0:  parse any labels into array entries (arrays and streams must be numeric, so are not parsed)
     if any(mech.input_labels_dict for mech in obj.origin_mechanisms):
-        _parse_input_labels(obj, stimuli)
+        _parse_input_labels(obj, {mech: stim_list for mech, stim_list in stimuli.items()
+                                  if not (_is_input_stream(stim_list) or _is_trial_array(stim_list))})
 
     # STEP 1: validate that there is a one-to-one mapping of input entries to origin mechanisms
 
@@ -858,6 +1246,12 @@ def _adjust_stimulus_dict(obj, stimuli):
 
     for mech, stim_list in stimuli.items():
 
+        # Streams are validated and converted one input at a time, as they are produced (see _stream_inputs)
+        #    and do not count toward num_input_sets
+        if _is_input_stream(stim_list):
+            adjusted_stimuli[mech] = _stream_inputs(obj, mech, stim_list)
+            continue
+
         check_spec_type = _input_matches_variable(stim_list, mech.instance_defaults.variable)
         # If a mechanism provided a single input, wrap it in one more list in order to represent trials
         if check_spec_type == "homogeneous" or check_spec_type == "heterogeneous":
@@ -875,21 +1269,28 @@ def _adjust_stimulus_dict(obj, stimuli):
                 raise RunError("Input specification for {} is not valid. The number of inputs (1) provided for {}"
                                "conflicts with at least one other mechanism's input specification.".format(obj.name,
                                                                                                            mech.name))
+        # Numeric array with one input per trial along its first axis:  since all of its inputs have the same shape,
+        #    only the first needs to be validated, and each is converted only when it is used (see _TrialArray)
+        elif _is_trial_array(stim_list):
+            if _input_matches_variable(stim_list[0], mech.instance_defaults.variable) != "homogeneous":
+                raise RunError(_get_stimulus_error_message(mech, stim_list[0]))
+            adjusted_stimuli[mech] = _TrialArray(stim_list, np.atleast_2d)
+
+            # verify that all mechanisms have provided the same number of inputs
+            if num_input_sets == -1:
+                num_input_sets = len(stim_list)
+            elif num_input_sets != len(stim_list):
+                raise RunError("Input specification for {} is not valid. The number of inputs ({}) provided for {}"
+                               "conflicts with at least one other mechanism's input specification."
+                               .format(obj.name, len(stim_list), mech.name))
+
         else:
             adjusted_stimuli[mech] = []
             for stim in stimuli[mech]:
                 check_spec_type = _input_matches_variable(stim, mech.instance_defaults.variable)
                 # loop over each input to verify that it matches variable
                 if check_spec_type == False:
-                    err_msg = "Input stimulus ({}) for {} is incompatible with its variable ({}).".\
-                        format(stim, mech.name, mech.instance_defaults.variable)
-                    # 8/3/17 CW: I admit the error message implementation here is very hacky; but it's at least not a hack
-                    # for "functionality" but rather a hack for user clarity
-                    if "KWTA" in str(type(mech)):
-                        err_msg = err_msg + " For KWTA mechanisms, remember to append an array of zeros (or other values)" \
-                                            " to represent the outside stimulus for the inhibition input state, and " \
-                                            "for systems, put your inputs"
-                    raise RunError(err_msg)
+                    raise RunError(_get_stimulus_error_message(mech, stim))
                 elif check_spec_type == "homogeneous":
                     # np.atleast_2d will catch any single-input states specified without an outer list
                     # e.g. [2.0, 2.0] --> [[2.0, 2.0]]
@@ -905,13 +1306,77 @@ def _adjust_stimulus_dict(obj, stimuli):
                                "conflicts with at least one other mechanism's input specification."
                                .format(obj.name, (stimuli[mech]), mech.name))
 
+    # All inputs are streams, so number of input sets is determined by the streams
+    if num_input_sets == -1:
+        num_input_sets = None
+
     return adjusted_stimuli, num_input_sets
 
+def _get_stimulus_error_message(mech, stim):
+    err_msg = "Input stimulus ({}) for {} is incompatible with its variable ({}).".\
+        format(stim, mech.name, mech.instance_defaults.variable)
+    # 8/3/17 CW: I admit the error message implementation here is very hacky; but it's at least not a hack
+    # for "functionality" but rather a hack for user clarity
+    if "KWTA" in str(type(mech)):
+        err_msg = err_msg + " For KWTA mechanisms, remember to append an array of zeros (or other values)" \
+                            " to represent the outside stimulus for the inhibition input state, and " \
+                            "for systems, put your inputs"
+    return err_msg
+
+def _is_input_stream(spec):
+    """Return True if spec is an iterator or other iterable (other than a list, tuple, string, dict or np.ndarray),
+    that provides the input (or target) for one TRIAL at a time
+    """
+    return isinstance(spec, Iterable) and not isinstance(spec, (list, tuple, str, dict, np.ndarray))
+
+def _is_trial_array(spec):
+    """Return True if spec is a numeric np.ndarray (possibly memory-mapped) with one input (or target) per TRIAL"""
+    return isinstance(spec, np.ndarray) and spec.ndim > 0 and len(spec) > 0 and spec.dtype.kind in 'biuf'
+
+class _TrialArray:
+    """Sequence over the first axis of an np.ndarray that converts each item only when it is accessed
+
+    Used for inputs and targets specified as (possibly memory-mapped) arrays, to avoid a converted copy of all of them
+    """
+    def __init__(self, array, convert):
+        self.array = array
+        self.convert = convert
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        # np.asarray so that items of a memory-mapped array are returned as (views in) standard arrays
+        return self.convert(np.asarray(self.array[index]))
+
+def _stream_inputs(obj, mech, stream):
+    """Validate and convert each input produced by stream for mech"""
+    for stim in stream:
+        check_spec_type = _input_matches_variable(stim, mech.instance_defaults.variable)
+        if check_spec_type == False:
+            raise RunError(_get_stimulus_error_message(mech, stim))
+        elif check_spec_type == "homogeneous":
+            yield np.atleast_2d(stim)
+        else:
+            yield stim
+
+def _stream_targets(mech, stream, input_state_variable):
+    """Validate and convert each target produced by stream for mech"""
+    for target_value in stream:
+        target_value = np.atleast_1d(target_value)
+        if np.shape(target_value) != np.shape(input_state_variable):
+            raise RunError("Target specification ({}) for {} is not valid. The shape of {} is not compatible "
+                           "with the TARGET input state of the corresponding ComparatorMechanism ({})"
+                           .format(target_value, mech.name, target_value,
+                                   mech.output_state.efferents[0].receiver.owner.name))
+        yield target_value
+
 def _adjust_target_dict(component, target_dict):
 
-    #  STEP 0:  parse any labels into array entries
+    #  STEP 0:  parse any labels into array entries (arrays and streams must be numeric, so are not parsed)
     if any(mech.input_labels_dict for mech in component.target_mechanisms):
-        _parse_input_labels(component, target_dict)
+        _parse_input_labels(component, {mech: target_list for mech, target_list in target_dict.items()
+                                        if not (_is_input_stream(target_list) or _is_trial_array(target_list))})
 
     # STEP 1: validate that there is a one-to-one mapping of target entries and target mechanisms
     for target_mechanism in component.target_mechanisms:
@@ -955,6 +1420,22 @@ def _adjust_target_dict(component, target_dict):
                                    "conflicts with at least one other mechanism's target specification."
                                    .format(component.name, mech.name))
 
+            # numeric array with one target per trial along its first axis:  validate only the first,
+            #    and convert each only when it is used
+            elif _is_trial_array(target_list):
+                if np.shape(np.atleast_1d(target_list[0])) != np.shape(input_state_variable):
+                    raise RunError("Target specification ({}) for {} is not valid. The shape of {} is not compatible "
+                                   "with the TARGET input state of the corresponding ComparatorMechanism ({})"
+                                   .format(target_list, mech.name, target_list[0],
+                                           mech.output_state.efferents[0].receiver.owner.name))
+                adjusted_targets[mech] = _TrialArray(target_list, np.atleast_1d)
+                if num_targets == -1:
+                    num_targets = len(target_list)
+                elif num_targets != len(target_list):
+                    raise RunError("Target specification for {} is not valid. The number of targets ({}) provided for {}"
+                                   "conflicts with at least one other mechanism's target specification."
+                                   .format(component.name, len(target_list), mech.name))
+
             # iterate over list and check that each candidate target is compatible with corresponding TARGET input state
             elif isinstance(target_list, (list, np.ndarray)):
                 adjusted_targets[mech] = []
@@ -978,6 +1459,13 @@ def _adjust_target_dict(component, target_dict):
         elif callable(target_list):
             _validate_target_function(target_list, mech.output_state.efferents[0].receiver.owner, mech)
             adjusted_targets[mech] = target_list
+
+        # streams are validated and converted one target at a time, as they are produced
+        elif _is_input_stream(target_list):
+            input_state_variable = mech.output_state.efferents[0].receiver.owner.input_states[TARGET].instance_defaults.variable
+            adjusted_targets[mech] = _stream_targets(mech, target_list, input_state_variable)
+            if all(_is_input_stream(target_dict[m]) for m in target_dict):
+                num_targets = None
     return adjusted_targets, num_targets
 
 
@@ -1091,8 +1579,3 @@ def _get_object_type(object):
         return SYSTEM
     else:
         raise RunError("{} type not supported by Run module".format(object.__class__.__name__))
-
-
-import uuid
-def _get_unique_id():
-    return uuid.uuid4()
@@ -803,6 +803,10 @@ class Log:
             # Get time and log value if logging condition is satisfied or called for programmatically
             if (log_pref and log_pref & condition) or condition & ContextFlags.COMMAND_LINE:
                 time = time or _get_time(self.owner, condition)
+                # arrays are copied, since some (e.g., the matrix of a MappingProjection that is learning) are
+                #    updated in place
+                if isinstance(value, np.ndarray):
+                    value = value.copy()
                 self.entries[self.owner.name] = LogEntry(time, condition_string, value)
 
         if not condition & ContextFlags.COMMAND_LINE:
@@ -331,7 +331,7 @@ class ComponentPreferenceSet(PreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively calls base (super) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpVerbosePref, self._verbose_pref.level)[0]
+        return self.get_pref_setting(kpVerbosePref)
 
     @verbosePref.setter
     def verbosePref(self, setting):
@@ -349,7 +349,7 @@ class ComponentPreferenceSet(PreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively call base (super) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpParamValidationPref, self._param_validation_pref.level)[0]
+        return self.get_pref_setting(kpParamValidationPref)
 
 
     @paramValidationPref.setter
@@ -368,7 +368,7 @@ class ComponentPreferenceSet(PreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively calls super (closer to base) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpReportOutputPref, self._report_output_pref.level)[0]
+        return self.get_pref_setting(kpReportOutputPref)
 
 
     @reportOutputPref.setter
@@ -387,7 +387,7 @@ class ComponentPreferenceSet(PreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively calls base (super) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpLogPref, self._log_pref.level)[0]
+        return self.get_pref_setting(kpLogPref)
 
     # # VERSION THAT USES OWNER'S logPref TO LIST ENTRIES TO BE RECORDED
     # @logPref.setter
@@ -424,8 +424,7 @@ class ComponentPreferenceSet(PreferenceSet):
         :return:
         """
         # return self._runtime_param_modulation_pref
-        return self.get_pref_setting_for_level(kpRuntimeParamModulationPref,
-                                               self._runtime_param_modulation_pref.level)[0]
+        return self.get_pref_setting(kpRuntimeParamModulationPref)
 
 
 
@@ -443,8 +442,7 @@ class ComponentPreferenceSet(PreferenceSet):
         :return:
         """
         # return self._runtime_param_sticky_assignment_pref
-        return self.get_pref_setting_for_level(kpRuntimeParamStickyAssignmentPref,
-                                        self._runtime_param_sticky_assignment_pref.level)[0]
+        return self.get_pref_setting(kpRuntimeParamStickyAssignmentPref)
 
     @runtimeParamStickyAssignmentPref.setter
     def runtimeParamStickyAssignmentPref(self, setting):
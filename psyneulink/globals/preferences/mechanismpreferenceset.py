@@ -153,8 +153,7 @@ class MechanismPreferenceSet(ComponentPreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively calls base (super) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpRuntimeParamModulationPref,
-                                               self._runtime_param_modulation_pref.level)[0]
+        return self.get_pref_setting(kpRuntimeParamModulationPref)
 
 
     @runtimeParamModulationPref.setter
@@ -229,8 +228,7 @@ class MechanismPreferenceSet(ComponentPreferenceSet):
         """
         # If the level of the object is below the Preference level,
         #    recursively calls base (super) classes to get preference at specified level
-        return self.get_pref_setting_for_level(kpRuntimeParamStickyAssignmentPref,
-                                               self._runtime_param_sticky_assignment_pref.level)[0]
+        return self.get_pref_setting(kpRuntimeParamStickyAssignmentPref)
 
 
     @runtimeParamStickyAssignmentPref.setter
@@ -148,6 +148,16 @@ class PreferenceSet(object):
         None
     """
 
+    # Incremented whenever a preference attribute of any PreferenceSet is assigned a new value (see __setattr__);
+    #    used by get_pref_setting to invalidate the settings it has cached, since a setting can depend on
+    #    the PreferenceSets at any level of the class hierarchy
+    _generation = 0
+
+    def __setattr__(self, name, value):
+        if name.endswith('_pref') and self.__dict__.get(name) != value:
+            PreferenceSet._generation += 1
+        super().__setattr__(name, value)
+
     def __init__(self,
                  owner,
                  level=PreferenceLevel.SYSTEM,
@@ -655,6 +665,34 @@ class PreferenceSet(object):
                                                     LogEntry.__module__+"."+LogEntry.__name__,
                                                     global_log_entry_value))
 
+    def get_pref_setting(self, pref_ivar_name):
+        """Return the setting of a preference at the level specified in its PreferenceEntry
+
+        Settings are cached for each owner and preference, and returned from the cache until a preference
+        attribute of any PreferenceSet is assigned (see PreferenceSet._generation);  only then is the class hierarchy
+        searched again (using get_pref_setting_for_level).
+
+        Arguments:
+        - pref_ivar_name (str): name of ivar for preference attribute for which to return the setting;
+
+        Returns:
+        - PreferenceEntry.setting
+        """
+        try:
+            if self._resolved_generation == PreferenceSet._generation:
+                return self._resolved_settings[self.owner, pref_ivar_name]
+            self._resolved_settings = {}
+            self._resolved_generation = PreferenceSet._generation
+        except AttributeError:
+            self._resolved_settings = {}
+            self._resolved_generation = PreferenceSet._generation
+        except KeyError:
+            pass
+
+        setting = self.get_pref_setting_for_level(pref_ivar_name)[0]
+        self._resolved_settings[self.owner, pref_ivar_name] = setting
+        return setting
+
     def get_pref_setting_for_level(self, pref_ivar_name, requested_level=None):
         """Return the setting of a preference for a specified preference level, and any error messages generated
 
@@ -72,10 +72,12 @@ OTHER
 * `make_readonly_property`
 * `get_class_attributes`
 * `insert_list`
+* `set_execution_id_namespace`
 
 """
 
 import inspect
+import itertools
 import logging
 import numbers
 import warnings
@@ -95,7 +97,8 @@ __all__ = [
     'make_readonly_property', 'merge_param_dicts', 'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY',
     'MODULATION_OVERRIDE', 'multi_getattr', 'np_array_less_than_2d',
     'object_has_single_value', 'optional_parameter_spec',
-    'parameter_spec', 'random_matrix', 'ReadOnlyOrderedDict', 'safe_len', 'TEST_CONDTION', 'type_match',
+    'parameter_spec', 'random_matrix', 'ReadOnlyOrderedDict', 'safe_len', 'set_execution_id_namespace', 'TEST_CONDTION',
+    'type_match',
     'underscore_to_camelCase', 'UtilitiesError',
 ]
 
@@ -490,6 +493,11 @@ def iscompatible(candidate, reference=None, **kargs):
                         candidate = np.asarray(candidate)
                     if isinstance(reference, np.matrix):
                         reference = np.asarray(reference)
+                    # numeric arrays of the same shape are compatible item by item, so skip the recursion
+                    if (isinstance(candidate, np.ndarray) and isinstance(reference, np.ndarray)
+                            and candidate.shape == reference.shape
+                            and candidate.dtype.kind in 'biufc' and reference.dtype.kind in 'biufc'):
+                        return True
                     cr = zip(candidate, reference)
                     if all(iscompatible(c, r, **kargs) for c, r in cr):
                         return True
@@ -777,6 +785,17 @@ class ReadOnlyOrderedDict(UserDict):
         return self.data.copy()
 
 from collections import UserList
+# Incremented whenever a Component has been (re)named; used to tell whether lookups by name cached from
+#    ContentAddressableLists (their name indices, and the parameter accessors of Functions) may be out of date
+_component_names_version = 0
+
+
+def _component_renamed():
+    '''Called when the name of a Component is assigned, to invalidate lookups by name in ContentAddressableLists'''
+    global _component_names_version
+    _component_names_version += 1
+
+
 class ContentAddressableList(UserList):
     """
     ContentAddressableList( component_type, key=None, list=None)
@@ -822,6 +841,10 @@ class ContentAddressableList(UserList):
                 accessing by key/name less critical;
             - the number of states in a collection for a given Mechanism is likely to be small so that, even when
                 accessed by key/name, the inefficiencies of searching a list are likely to be inconsequential.
+        Nevertheless, since items are accessed by name in every execution (e.g., a Function's parameters, by
+        get_current_function_param), the index of each name is cached in a dict.  The cache is rebuilt when it is
+        used after the list has been modified (which increments its _version), or any Component has been (re)named
+        (see _component_names_version), since it was built.
 
     Arguments
     ---------
@@ -886,8 +909,15 @@ class ContentAddressableList(UserList):
                 raise UtilitiesError("All of the items in the list arg for {} "
                                      "must be of the type specified in the component_type arg ({})"
                                      .format(self.name, self.component_type.__name__))
+        self._version = 0
+        self._name_index = {}
+        self._name_index_state = None
         UserList.__init__(self, list, **kwargs)
 
+    def _changed(self):
+        '''Called when the list is modified, to invalidate lookups cached from it'''
+        self._version += 1
+
     # def __repr__(self):
     #     return '[\n\t{0}\n]'.format('\n\t'.join(['{0}\t{1}\t{2}'.format(i, self[i].name,
     #                                                                     repr(self[i].value))
@@ -896,6 +926,11 @@ class ContentAddressableList(UserList):
     def __getitem__(self, key):
         if key is None:
             raise KeyError("None is not a legal key for {}".format(self.name))
+        if isinstance(key, str):
+            key_num = self._get_index_for_name(key)
+            if key_num is None:
+                raise TypeError("\'{}\' is not a key in {}".format(key, self.name))
+            return self.data[key_num]
         try:
             return self.data[key]
         except TypeError:
@@ -934,20 +969,30 @@ class ContentAddressableList(UserList):
                 self.data[key_num] = value
             else:
                 self.data.append(value)
+        # (after the assignment, since the name index may have been used to make it)
+        self._changed()
 
     def __contains__(self, item):
+        if isinstance(item, str):
+            return self._get_index_for_name(item) is not None
         if super().__contains__(item):
             return True
         else:
             return any(item == obj.name for obj in self.data)
 
+    def _get_index_for_name(self, name):
+        '''Return the index of the first item in the list with **name**, or None if there is none'''
+        index_state = (self._version, _component_names_version)
+        if self._name_index_state != index_state:
+            self._name_index = {}
+            for i, obj in enumerate(self.data):
+                self._name_index.setdefault(obj.name, i)
+            self._name_index_state = index_state
+        return self._name_index.get(name)
+
     def _get_key_for_item(self, key):
         if isinstance(key, str):
-            obj = next((obj for obj in self.data if obj.name == key), None)
-            if obj is None:
-                return None
-            else:
-                return self.data.index(obj)
+            return self._get_index_for_name(key)
         elif isinstance(key, self.component_type):
             return self.data.index(key)
         else:
@@ -963,10 +1008,49 @@ class ContentAddressableList(UserList):
         except TypeError:
             key_num = self._get_key_for_item(key)
             del self.data[key_num]
+        # (after the deletion, since the name index may have been used to make it)
+        self._changed()
 
     def clear(self):
+        self._changed()
         super().clear()
 
+    def append(self, item):
+        self._changed()
+        super().append(item)
+
+    def insert(self, i, item):
+        self._changed()
+        super().insert(i, item)
+
+    def extend(self, other):
+        self._changed()
+        super().extend(other)
+
+    def remove(self, item):
+        self._changed()
+        super().remove(item)
+
+    def pop(self, i=-1):
+        self._changed()
+        return super().pop(i)
+
+    def sort(self, *args, **kwargs):
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._changed()
+        super().reverse()
+
+    def __iadd__(self, other):
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._changed()
+        return super().__imul__(n)
+
     # def pop(self, key, *args):
     #     raise UtilitiesError("{} is read-only".format(self.name))
     #
@@ -974,6 +1058,7 @@ class ContentAddressableList(UserList):
     #     raise UtilitiesError("{} is read-only".format(self.name))
 
     def __additem__(self, key, value):
+        self._changed()
         if key >= len(self.data):
             self.data.append(value)
         else:
@@ -1128,6 +1213,11 @@ def convert_all_elements_to_np_array(arr, cast_from=None, cast_to=None):
     if not isinstance(arr, collections.Iterable) or isinstance(arr, str):
         return np.array(arr)
 
+    # numeric arrays have no items to convert, so just copy them (as the recursion below would)
+    if cast_from is None and isinstance(arr, np.ndarray) and not isinstance(arr, np.matrix) \
+            and arr.dtype.kind in 'biufc':
+        return arr.copy()
+
     if isinstance(arr, np.matrix):
         if arr.dtype == object:
             return np.matrix([convert_all_elements_to_np_array(arr.item(i), cast_from, cast_to) for i in range(arr.size)])
@@ -1237,3 +1327,35 @@ def prune_unused_args(func, args, kwargs):
             del kwargs_to_pass[kw]
 
     return args_to_pass, kwargs_to_pass
+
+
+# Execution ids are consecutive integers, which are much cheaper to generate (and to compare and hash) than uuids;
+#    the namespace distinguishes the ids generated by different (e.g., parallel) processes
+_EXECUTION_ID_NAMESPACE_SIZE = 2 ** 48
+_execution_id_namespace = 0
+_execution_id_counter = itertools.count(1)
+
+
+def set_execution_id_namespace(namespace):
+    """Set the namespace of the execution ids subsequently generated in this process.
+
+    The execution ids that are assigned to a Composition and its Components when none is specified (e.g., for each
+    `TRIAL` of a `run <Run>`) are consecutive integers, that are unique within a process.  Processes that execute
+    Compositions in parallel, and combine the results, should each be assigned a different namespace (e.g., the rank
+    of an MPI process), which makes the execution ids that they generate unique across processes.
+
+    Arguments
+    ---------
+
+    namespace : int
+        a non-negative integer; the default namespace (that of a process for which none is set) is 0.
+    """
+    global _execution_id_namespace
+    if not isinstance(namespace, numbers.Integral) or isinstance(namespace, bool) or namespace < 0:
+        raise UtilitiesError("namespace for execution ids ({}) must be a non-negative integer".format(namespace))
+    _execution_id_namespace = int(namespace) * _EXECUTION_ID_NAMESPACE_SIZE
+
+
+def _get_unique_id():
+    """Return a new execution id (an int that is unique within the current execution id namespace)"""
+    return _execution_id_namespace + next(_execution_id_counter)
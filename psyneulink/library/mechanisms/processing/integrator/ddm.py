@@ -1068,7 +1068,12 @@ class DDM(ProcessingMechanism_Base):
 
             # Convert ER to decision variable:
             threshold = float(self.function_object.get_current_function_param(THRESHOLD))
-            if random.random() < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
+            if self._random_state is None:
+                # No DDM-specific random_state has been assigned, so use the global generator
+                decision_sample = random.random()
+            else:
+                decision_sample = self.random_state.random_sample()
+            if decision_sample < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
                 return_value[self.DECISION_VARIABLE_INDEX] = np.atleast_1d(-1 * threshold)
             else:
                 return_value[self.DECISION_VARIABLE_INDEX] = threshold
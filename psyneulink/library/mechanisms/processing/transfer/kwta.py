@@ -139,6 +139,10 @@ When a KTWA is executed, it first determines its `variable <KWTA.variable>` as f
 The modified `variable <KWTA.variable>` is then passed to the KWTA's `function <KWTA.function>` to determine its
 `value <KWTA.value>`.
 
+The offsets for a batch of inputs (for example, those for many `TRIAL`\\s, or for several layers with the same
+parameters) can be computed and applied in a single call to the KWTA's `kwta_scale_batch <KWTA.kwta_scale_batch>`
+method.
+
 
 .. _KWTA_Reference:
 
@@ -156,6 +160,7 @@ import numpy as np
 import typecheck as tc
 
 from psyneulink.components.functions.function import Logistic
+from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import INITIALIZING, KWTA, K_VALUE, RATIO, RESULT, THRESHOLD
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.utilities import is_numeric_or_none
@@ -167,6 +172,35 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_KWTA_PARAMS = ('k_value', 'threshold', 'ratio', 'average_based', 'inhibition_only')
+
+
+def _kwta_offset(diffs, k, ratio, average_based, inhibition_only):
+    """Return the offset for each row of diffs (threshold - input, along the last axis) that puts k elements at or
+    above threshold
+
+    The k smallest diffs are selected using np.partition (rather than fully sorting them), so that any number of
+    rows (e.g., a batch of trials or of layers) is handled in a single call.
+    """
+    n = diffs.shape[-1]
+    if average_based:
+        partitioned = np.partition(diffs, k - 1, axis=-1) if 0 < k < n else diffs
+        top_k_mean = np.mean(partitioned[..., 0:k], axis=-1)
+        other_mean = np.mean(partitioned[..., k:n], axis=-1)
+        offset = other_mean * ratio + top_k_mean * (1 - ratio)
+    elif k == 0:
+        offset = np.min(diffs, axis=-1)
+    elif k == n:
+        offset = np.max(diffs, axis=-1)
+    else:
+        partitioned = np.partition(diffs, (k - 1, k), axis=-1)
+        offset = partitioned[..., k] * ratio + partitioned[..., k - 1] * (1 - ratio)
+
+    if inhibition_only:
+        offset = np.minimum(offset, 0)
+    return offset
+
+
 class KWTAError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -551,12 +585,80 @@ class KWTA(RecurrentTransferMechanism):
         self.indexOfInhibitionInputState = len(self.input_states) - 1
 
     def _kwta_scale(self, current_input, context=None):
-        k_value = self.get_current_mechanism_param("k_value")
-        threshold = self.get_current_mechanism_param("threshold")
-        average_based = self.get_current_mechanism_param("average_based")
-        ratio = self.get_current_mechanism_param("ratio")
-        inhibition_only = self.get_current_mechanism_param("inhibition_only")
+        k, threshold, ratio, average_based, inhibition_only = self._get_kwta_params()
+
+        if k > len(current_input[0]) and not average_based:
+            raise KWTAError("k value ({}) is greater than the length of the first input ({}) for KWTA mechanism {}".
+                            format(k, current_input[0], self.name))
+
+        new_input = np.asarray(current_input[0]) + _kwta_offset(threshold - np.asarray(current_input[0], dtype=float),
+                                                                k, ratio, average_based, inhibition_only)
+        if (np.count_nonzero(new_input > threshold) > k) and not average_based:
+            warnings.warn("KWTA scaling was not successful: the result was too high. The original input was {}, "
+                          "and the KWTA-scaled result was {}".format(current_input, new_input))
+        if len(current_input) == 1:
+            return new_input[np.newaxis, :]
+        new_input = list(new_input)
+        for i in range(1, len(current_input)):
+            new_input.append(current_input[i])
+        return np.atleast_2d(new_input)
+
+    def kwta_scale_batch(self, inputs):
+        """Apply the KWTA's scaling to each of a batch of inputs
+
+        Arguments
+        ---------
+
+        inputs : 2d np.array
+            each row is an input for the KWTA's primary InputState (e.g., the input on one `TRIAL`, or to one of a set
+            of layers with the same parameters).
+
+        Returns
+        -------
+
+        the inputs, each offset as it would be by an execution of the KWTA : 2d np.array
+        """
+        k, threshold, ratio, average_based, inhibition_only = self._get_kwta_params()
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+        if k > inputs.shape[-1] and not average_based:
+            raise KWTAError("k value ({}) is greater than the length of the inputs ({}) for KWTA mechanism {}".
+                            format(k, inputs.shape[-1], self.name))
+        offsets = _kwta_offset(threshold - inputs, k, ratio, average_based, inhibition_only)
+        return inputs + offsets[..., np.newaxis]
+
+    def _get_kwta_params(self):
+        """Return k (as an int), threshold, ratio, average_based and inhibition_only
+
+        Once the KWTA is initialized, its ParameterStates are looked up only once, and k is only recomputed from
+        k_value when the value of its ParameterState changes.
+        """
+        if self.context.initialization_status != ContextFlags.INITIALIZED:
+            k_value, threshold, ratio, average_based, inhibition_only = \
+                [self.get_current_mechanism_param(param) for param in _KWTA_PARAMS]
+            return self._get_int_k(k_value), threshold, ratio, average_based, inhibition_only
 
+        try:
+            parameter_states = self._kwta_parameter_states
+        except AttributeError:
+            parameter_states = self._kwta_parameter_states = []
+            for param in _KWTA_PARAMS:
+                try:
+                    parameter_states.append(self._parameter_states[param])
+                except (AttributeError, TypeError):
+                    parameter_states.append(None)
+
+        k_value, threshold, ratio, average_based, inhibition_only = \
+            [getattr(self, param) if state is None else state.value
+             for param, state in zip(_KWTA_PARAMS, parameter_states)]
+
+        cached_k_value, k = getattr(self, '_kwta_k_cache', (None, None))
+        if cached_k_value is None or not np.array_equal(k_value, cached_k_value):
+            k = self._get_int_k(k_value)
+            self._kwta_k_cache = (np.array(k_value, copy=True), k)
+
+        return k, threshold, ratio, average_based, inhibition_only
+
+    def _get_int_k(self, k_value):
         try:
             int_k_value = int(k_value[0])
         except TypeError: # if k_value is a single value rather than a list or array
@@ -570,40 +672,7 @@ class KWTA(RecurrentTransferMechanism):
             k = n - int_k_value
         else:
             k = int_k_value
-        # k = self.int_k
-
-        diffs = threshold - current_input[0]
-
-        sorted_diffs = sorted(diffs)
-
-        if average_based:
-            top_k_mean = np.mean(sorted_diffs[0:k])
-            other_mean = np.mean(sorted_diffs[k:n])
-            final_diff = other_mean * ratio + top_k_mean * (1 - ratio)
-        else:
-            if k == 0:
-                final_diff = sorted_diffs[k]
-            elif k == len(sorted_diffs):
-                final_diff = sorted_diffs[k - 1]
-            elif k > len(sorted_diffs):
-                raise KWTAError("k value ({}) is greater than the length of the first input ({}) for KWTA mechanism {}".
-                                format(k, current_input[0], self.name))
-            else:
-                final_diff = sorted_diffs[k] * ratio + sorted_diffs[k-1] * (1 - ratio)
-
-
-
-        if inhibition_only and final_diff > 0:
-            final_diff = 0
-
-        new_input = np.array(current_input[0] + final_diff)
-        if (sum(new_input > threshold) > k) and not average_based:
-            warnings.warn("KWTA scaling was not successful: the result was too high. The original input was {}, "
-                          "and the KWTA-scaled result was {}".format(current_input, new_input))
-        new_input = list(new_input)
-        for i in range(1, len(current_input)):
-            new_input.append(current_input[i])
-        return np.atleast_2d(new_input)
+        return k
 
     def _validate_params(self, request_set, target_set=None, context=None):
         """Validate shape and size of matrix.
@@ -625,7 +694,7 @@ class KWTA(RecurrentTransferMechanism):
             if not isinstance(k_param, numbers.Real):
                 if not (isinstance(k_param, (np.ndarray, list)) and len(k_param) == 1):
                     raise KWTAError("k-value parameter ({}) for {} must be a single number".format(k_param, self))
-            if (isinstance(ratio_param, (np.ndarray, list)) and len(ratio_param) == 1):
+            if (isinstance(k_param, (np.ndarray, list)) and len(k_param) == 1):
                 k_num = k_param[0]
             else:
                 k_num = k_param
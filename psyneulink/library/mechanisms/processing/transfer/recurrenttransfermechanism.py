@@ -891,20 +891,31 @@ class RecurrentTransferMechanism(TransferMechanism):
 
     @matrix.setter
     def matrix(self, val): # simplified version of standard setter (in Component.py)
+        # val is the (possibly learned) matrix already held by the recurrent_projection's MATRIX ParameterState
+        #    when it is assigned back from the ParameterState's value;  in that case it is not replaced by a copy,
+        #    so that learning can continue to update it in place
+        matrix_is_current = False
         if hasattr(self, "recurrent_projection"):
-            self.recurrent_projection.parameter_states["matrix"].function_object.previous_value = val
+            matrix_function = self.recurrent_projection.parameter_states["matrix"].function_object
+            matrix_is_current = val is matrix_function.previous_value
+            if not matrix_is_current:
+                matrix_function.previous_value = val
         if hasattr(self, '_parameter_states')\
                 and 'auto' in self._parameter_states and 'hetero' in self._parameter_states:
             if hasattr(self, 'size'):
                 val = get_matrix(val, self.size[0], self.size[0])
             temp_matrix = val.copy()
-            self.auto = np.diag(temp_matrix).copy()
-            np.fill_diagonal(temp_matrix, 0)
-            self.hetero = temp_matrix
+            self._matrix_is_current = matrix_is_current
+            try:
+                self.auto = np.diag(temp_matrix).copy()
+                np.fill_diagonal(temp_matrix, 0)
+                self.hetero = temp_matrix
+            finally:
+                self._matrix_is_current = False
         else:
             name = 'matrix'
             backing_field = '_matrix'
-            if self.paramValidationPref and hasattr(self, PARAMS_CURRENT):
+            if self.paramValidationPref and hasattr(self, PARAMS_CURRENT) and not matrix_is_current:
                 self._assign_params(request_set={name: val}, context=ContextFlags.PROPERTY)
             else:
                 setattr(self, backing_field, val)
@@ -928,7 +939,8 @@ class RecurrentTransferMechanism(TransferMechanism):
         else:
             setattr(self, "_auto", val)
 
-        if hasattr(self, "recurrent_projection") and 'hetero' in self._parameter_states:
+        if (hasattr(self, "recurrent_projection") and 'hetero' in self._parameter_states
+                and not getattr(self, '_matrix_is_current', False)):
             self.recurrent_projection.parameter_states["matrix"].function_object.previous_value = self.matrix
 
         # Update user_params dict with new value
@@ -946,7 +958,8 @@ class RecurrentTransferMechanism(TransferMechanism):
         else:
             setattr(self, "_hetero", val)
 
-        if hasattr(self, "recurrent_projection") and 'auto' in self._parameter_states:
+        if (hasattr(self, "recurrent_projection") and 'auto' in self._parameter_states
+                and not getattr(self, '_matrix_is_current', False)):
             self.recurrent_projection.parameter_states["matrix"].function_object.previous_value = self.matrix
 
         # Update user_params dict with new value
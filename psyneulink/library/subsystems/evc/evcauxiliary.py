@@ -13,10 +13,13 @@ Auxiliary functions for `EVCControlMechanism`.
 
 """
 
+import itertools
+
 import numpy as np
 import typecheck as tc
 
 from psyneulink.components.functions.function import Function_Base
+from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignalCosts
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.defaults import MPI_IMPLEMENTATION, defaultControlAllocation
 from psyneulink.globals.keywords import COMBINE_OUTCOME_AND_COST_FUNCTION, COST_FUNCTION, EVC_SIMULATION, EXECUTING, FUNCTION_OUTPUT_TYPE_CONVERSION, INITIALIZING, PARAMETER_STATE_PARAMS, SAVE_ALL_VALUES_AND_POLICIES, VALUE_FUNCTION, kwPreferenceSetName, kwProgressBarChar
@@ -24,9 +27,11 @@ from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, k
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 
 __all__ = [
-    'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION', 'CONTROLLER', 'ControlSignalGridSearch', 'EVCAuxiliaryError',
-    'EVCAuxiliaryFunction', 'kwEVCAuxFunction', 'kwEVCAuxFunctionType', 'kwValueFunction', 'OUTCOME', 'PY_MULTIPROCESSING',
-    'ValueFunction',
+    'CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION', 'CONTROL_SIGNAL_GOLDEN_SECTION_SEARCH_FUNCTION',
+    'CONTROL_SIGNAL_GRID_REFINEMENT_FUNCTION', 'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION', 'CONTROLLER',
+    'ControlSignalCoordinateAscent', 'ControlSignalGoldenSectionSearch', 'ControlSignalGridRefinement',
+    'ControlSignalGridSearch', 'ControlSignalSearchFunction', 'EVCAuxiliaryError', 'EVCAuxiliaryFunction',
+    'EVCLandscapes', 'kwEVCAuxFunction', 'kwEVCAuxFunctionType', 'kwValueFunction', 'OUTCOME', 'PY_MULTIPROCESSING', 'ValueFunction',
 ]
 
 PY_MULTIPROCESSING = False
@@ -42,6 +47,9 @@ kwEVCAuxFunction = "EVC AUXILIARY FUNCTION"
 kwEVCAuxFunctionType = "EVC AUXILIARY FUNCTION TYPE"
 kwValueFunction = "EVC VALUE FUNCTION"
 CONTROL_SIGNAL_GRID_SEARCH_FUNCTION = "EVC CONTROL SIGNAL GRID SEARCH FUNCTION"
+CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION = "EVC CONTROL SIGNAL COORDINATE ASCENT FUNCTION"
+CONTROL_SIGNAL_GOLDEN_SECTION_SEARCH_FUNCTION = "EVC CONTROL SIGNAL GOLDEN SECTION SEARCH FUNCTION"
+CONTROL_SIGNAL_GRID_REFINEMENT_FUNCTION = "EVC CONTROL SIGNAL GRID REFINEMENT FUNCTION"
 CONTROLLER = 'controller'
 OUTCOME = 'outcome'
 
@@ -242,13 +250,50 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
     * Save the values:
         if the `save_all_values_and_policies` attribute is `True`, save allocation policy in the EVCControlMechanism's
-        `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute; otherwise, retain only
-        maximum EVC value.
+        `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute;  if its
+        `save_top_values_and_policies` attribute is specified, save only that number of policies with the greatest
+        EVC;  otherwise, retain only maximum EVC value.  If its `save_EVC_landscapes` attribute is `True`, also add
+        every policy and its value to its `EVC_landscapes`.
 
     The ControlSignalGridSearch function returns the `allocation_policy` that yielded the maximum EVC.
     Its operation can be modified by customizing or replacing any or all of the functions referred to above
     (also see `EVCControlMechanism_Functions`).
 
+    If **max_outcome** is specified, it is used as the best possible outcome of every simulation, to skip the
+    simulation of allocation policies that cannot yield the maximum EVC.  This requires the `cost <ControlSignal.cost>`
+    of each ControlSignal to depend only on its allocation (i.e., that none of them has an `ADJUSTMENT_COST
+    <ControlSignalCosts.ADJUSTMENT_COST>` or `DURATION_COST <ControlSignalCosts.DURATION_COST>`);  if a
+    ControlSignal's cost depends on anything else, every allocation policy is evaluated.  The best-case EVC of each
+    policy is computed by calling the `value_function <EVCControlMechanism.value_function>` with **max_outcome** and the
+    costs of the policy, without simulating the `system <EVCControlMechanism.system>`.  The policies are then
+    evaluated in order of decreasing best-case EVC, and once the best-case EVC of a policy is less than the greatest
+    EVC of those already evaluated, the rest of the policies are skipped (or *pruned*).  This returns the same policy
+    as evaluating all of them;  the EVC values of the pruned policies are `nan` in the EVCControlMechanism's
+    `EVC_values` attribute.
+
+    Arguments
+    ---------
+
+    max_outcome : number or np.array : default None
+        specifies the outcome of a simulation (i.e., the `value <InputState.value>` of the EVCControlMechanism's
+        `input_states <Mechanism_Base.input_states>`) that yields the greatest EVC for any given costs;  for the default
+        `value_function <EVCControlMechanism.value_function>`, this is the greatest possible value of the
+        `objective_mechanism <EVCControlMechanism.objective_mechanism>`'s `output_state <ObjectiveMechanism.output_state>`.
+        A number is used for every element of the outcome.
+
+    Attributes
+    ----------
+
+    max_outcome : number, np.array or None
+        the best possible outcome of a simulation, used to skip the simulation of policies that cannot yield the
+        maximum EVC.
+
+    num_simulations : int
+        the number of allocation policies evaluated in the last search.
+
+    num_pruned : int
+        the number of allocation policies skipped in the last search (see **max_outcome**).
+
     """
 
     componentName = CONTROL_SIGNAL_GRID_SEARCH_FUNCTION
@@ -257,11 +302,27 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                  default_variable=None,
                  params=None,
                  function=None,
-                 owner=None):
+                 owner=None,
+                 max_outcome=None):
+        self.max_outcome = max_outcome
         function = function or self.function
         super().__init__(function=function,
                          owner=owner,
                          context=ContextFlags.CONSTRUCTOR)
+        self.num_simulations = 0
+        self.num_pruned = 0
+
+    def _get_EVC_bounds(self, controller, policy_costs, context=None):
+        """Return the EVC of each allocation policy, given its ControlSignal costs (**policy_costs**), if the outcome
+        of its simulation were `max_outcome <ControlSignalGridSearch.max_outcome>`
+        """
+        value_function = controller.paramsCurrent[VALUE_FUNCTION]
+        max_outcome = np.full_like(np.array(controller.input_values, dtype=float), self.max_outcome)
+        return np.array([float(value_function.function(controller=controller,
+                                                       outcome=max_outcome,
+                                                       costs=costs.reshape(-1, 1),
+                                                       context=context)[0])
+                         for costs in policy_costs])
 
     def function(
         self,
@@ -373,55 +434,89 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
             EVC_max_policy = np.empty_like(controller.control_signal_search_space[0])
             EVC_max_state_values = np.empty_like(controller.input_values)
             max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-            # FIX:  INITIALIZE TO FULL LENGTH AND ASSIGN DEFAULT VALUES (MORE EFFICIENT):
-            EVC_values = np.array([])
-            EVC_policies = np.array([[]])
+            # The EVC of each of the allocation policies evaluated by this process, in the order they are evaluated
+            EVC_policies = controller.control_signal_search_space[start:end,:]
+            EVC_values = np.empty(len(EVC_policies))
 
             # # TEST PRINT:
             # print("\nEVC SIMULATION\n")
 
-            for allocation_vector in controller.control_signal_search_space[start:end,:]:
-            # for iter in range(rank, len(controller.control_signal_search_space), size):
-            #     allocation_vector = controller.control_signal_search_space[iter,:]:
-
-                if controller.prefs.reportOutputPref:
-                    increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
-                    if increment_progress_bar:
-                        print(kwProgressBarChar, end='', flush=True)
-                sample +=1
-
-                # Calculate EVC for specified allocation policy
-                result_tuple = _compute_EVC(args=(controller, allocation_vector,
-                                                  runtime_params,
-                                                  context))
-                EVC, outcome, cost = result_tuple
-
-                EVC_max = max(EVC, EVC_max)
-                # max_result([t1, t2], key=lambda x: x1)
-
-                # Add to list of EVC values and allocation policies if save option is set
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    # FIX:  ASSIGN BY INDEX (MORE EFFICIENT)
-                    EVC_values = np.append(EVC_values, np.atleast_1d(EVC), axis=0)
-                    # Save policy associated with EVC for each process, as order of chunks
-                    #     might not correspond to order of policies in control_signal_search_space
-                    if len(EVC_policies[0])==0:
-                        EVC_policies = np.atleast_2d(allocation_vector)
+            # If the cost of every ControlSignal depends only on its allocation, compute the costs for all of the
+            #    allocation policies at once, rather than each time the ControlSignals are updated in a simulation
+            policy_costs = None
+            if not any(control_signal.cost_options &
+                       (ControlSignalCosts.ADJUSTMENT_COST | ControlSignalCosts.DURATION_COST)
+                       for control_signal in controller.control_signals):
+                policy_costs = controller.compute_control_signal_costs(
+                        controller.control_signal_search_space[start:end,:])
+                for control_signal in controller.control_signals:
+                    control_signal._defer_costs = True
+
+            # If the outcome has an upper bound and the costs are known in advance, evaluate the policies in order of
+            #    decreasing best-case EVC, and skip those that cannot have an EVC greater than EVC_max
+            EVC_bounds = None
+            policy_order = range(len(EVC_policies))
+            self.num_pruned = 0
+            if self.max_outcome is not None and policy_costs is not None:
+                EVC_bounds = self._get_EVC_bounds(controller, policy_costs, context)
+                policy_order = np.argsort(-EVC_bounds, kind='mergesort')
+
+            EVC_max_index = -1
+            try:
+                for position, policy_index in enumerate(policy_order):
+                # for iter in range(rank, len(controller.control_signal_search_space), size):
+                #     allocation_vector = controller.control_signal_search_space[iter,:]:
+                    allocation_vector = EVC_policies[policy_index]
+
+                    if EVC_bounds is not None and EVC_bounds[policy_index] <= EVC_max:
+                        if EVC_bounds[policy_index] < EVC_max:
+                            # The rest of the policies have lower bounds, so none of them can exceed EVC_max either
+                            EVC_values[policy_order[position:]] = np.nan
+                            self.num_pruned += len(policy_order) - position
+                            break
+                        if policy_index < EVC_max_index:
+                            # A policy with EVC equal to EVC_max would not replace a later one (see below)
+                            EVC_values[policy_index] = np.nan
+                            self.num_pruned += 1
+                            continue
+
+                    if controller.prefs.reportOutputPref:
+                        increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
+                        if increment_progress_bar:
+                            print(kwProgressBarChar, end='', flush=True)
+                    sample +=1
+
+                    # Calculate EVC for specified allocation policy
+                    if policy_costs is None:
+                        result_tuple = _compute_EVC(args=(controller, allocation_vector,
+                                                          runtime_params,
+                                                          context))
                     else:
-                        EVC_policies = np.append(EVC_policies, np.atleast_2d(allocation_vector), axis=0)
-
-                # If EVC is greater than the previous value:
-                # - store the current set of monitored state value in EVC_max_state_values
-                # - store the current set of control_signals in EVC_max_policy
-                # if EVC_max > EVC:
-                # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
-                if EVC == EVC_max:
-                    # Keep track of state values and allocation policy associated with EVC max
-                    # EVC_max_state_values = controller.input_value.copy()
-                    # EVC_max_policy = allocation_vector.copy()
-                    EVC_max_state_values = controller.input_values
-                    EVC_max_policy = allocation_vector
-                    max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
+                        result_tuple = _compute_EVC(args=(controller, allocation_vector,
+                                                          runtime_params,
+                                                          context,
+                                                          policy_costs[policy_index]))
+                    EVC, outcome, cost = result_tuple
+
+                    EVC_values[policy_index] = EVC
+
+                    # If EVC is greater than the previous value (or equal to it, for a policy that is later in
+                    #    control_signal_search_space, so that the choice among equal EVCs doesn't depend on policy_order):
+                    # - store the current set of monitored state value in EVC_max_state_values
+                    # - store the current set of control_signals in EVC_max_policy
+                    # if EVC_max > EVC:
+                    # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
+                    if EVC > EVC_max or (EVC == EVC_max and policy_index > EVC_max_index):
+                        EVC_max = EVC
+                        EVC_max_index = policy_index
+                        # Keep track of state values and allocation policy associated with EVC max
+                        # Copy the state values, as the next simulation reassigns them
+                        EVC_max_state_values = [np.array(value) for value in controller.input_values]
+                        EVC_max_policy = allocation_vector
+                        max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
+            finally:
+                for control_signal in controller.control_signals:
+                    control_signal._defer_costs = False
 
             #endregion
 
@@ -436,17 +531,20 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                 controller.EVC_max = max_of_max_tuples[0]
                 controller.EVC_max_state_values = max_of_max_tuples[1]
                 controller.EVC_max_policy = max_of_max_tuples[2]
-
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = np.concatenate(Comm.allgather(EVC_values), axis=0)
-                    controller.EVC_policies = np.concatenate(Comm.allgather(EVC_policies), axis=0)
+                self.num_simulations = sum(Comm.allgather(sample))
+                self.num_pruned = sum(Comm.allgather(self.num_pruned))
+
+                # Save policy associated with EVC for each process, as order of chunks
+                #     might not correspond to order of policies in control_signal_search_space
+                _save_EVC_values_and_policies(controller,
+                                              np.concatenate(Comm.allgather(EVC_values), axis=0),
+                                              np.concatenate(Comm.allgather(EVC_policies), axis=0))
             else:
                 controller.EVC_max = EVC_max
                 controller.EVC_max_state_values = EVC_max_state_values
                 controller.EVC_max_policy = EVC_max_policy
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = EVC_values
-                    controller.EVC_policies = EVC_policies
+                self.num_simulations = sample
+                _save_EVC_values_and_policies(controller, EVC_values, EVC_policies)
             # # TEST PRINT:
             # import re
             # print("\nFINAL:\n\tmax tuple:\n\t\tEVC_max: {}\n\t\tEVC_max_state_values: {}\n\t\tEVC_max_policy: {}".
@@ -466,38 +564,504 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
         # -----------------------------------------------------------------
 
-        #region ASSIGN CONTROL SIGNAL VALUES
+        return _assign_EVC_max_policy(controller)
+
+
+class ControlSignalSearchFunction(EVCAuxiliaryFunction):
+    """Base class for functions that search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>`
+    without evaluating every one in the EVCControlMechanism's `control_signal_search_space`.
+
+    The number of allocation policies evaluated by a `ControlSignalGridSearch` is the product of the number of
+    `allocation_samples <ControlSignal.allocation_samples>` of each of the EVCControlMechanism's ControlSignals, and so
+    grows exponentially with the number of ControlSignals.  Subclasses of ControlSignalSearchFunction instead choose
+    the allocation policies to evaluate based on the EVC of the ones already evaluated.  They use the `allocation_samples
+    <ControlSignal.allocation_samples>` of each ControlSignal either as the set of allocations it can be assigned
+    (`ControlSignalCoordinateAscent`) or only to determine the range of allocations it can be assigned (from the
+    smallest to the largest of its samples;  `ControlSignalGoldenSectionSearch` and `ControlSignalGridRefinement`),
+    and so the EVCControlMechanism's `control_signal_search_space` is not constructed (it is assigned `None`).
 
-        # Assign allocations to control_signals for optimal allocation policy:
-        EVC_maxStateValue = iter(controller.EVC_max_state_values)
+    Each allocation policy is evaluated in the same way as by `ControlSignalGridSearch` (using `_compute_EVC`), and only
+    once in each search.  The policy with the maximum EVC is returned, and assigned to the EVCControlMechanism's
+    `EVC_max_policy` attribute;  the policies evaluated and their EVC are saved in its `EVC_policies` and `EVC_values`
+    attributes, respectively, in the order they were evaluated, as specified by its `save_all_values_and_policies` and
+    `save_top_values_and_policies` attributes, and in its `EVC_landscapes` if `save_EVC_landscapes` is `True`.
 
-        # Assign max values for optimal allocation policy to controller.input_states (for reference only)
-        for i in range(len(controller.input_states)):
-            controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+    Attributes
+    ----------
 
+    num_simulations : int
+        the number of allocation policies evaluated (i.e., simulations of the EVCControlMechanism's `system
+        <EVCControlMechanism.system>` run) in the last search.
+
+    """
+
+    # The search does not use the EVCControlMechanism's control_signal_search_space, so it need not be constructed
+    uses_control_signal_search_space = False
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None):
+        function = function or self.function
+        super().__init__(function=function,
+                         owner=owner,
+                         context=ContextFlags.CONSTRUCTOR)
+        self.num_simulations = 0
+
+    def function(
+        self,
+        controller=None,
+        variable=None,
+        runtime_params=None,
+        params=None,
+        context=None,
+    ):
+        """Search for the `allocation_policy` that maximizes EVC, and return it (see `ControlSignalSearchFunction`).
+        """
+
+        if (self.context.initialization_status == ContextFlags.INITIALIZING or
+                self.owner.context.initialization_status == ContextFlags.INITIALIZING):
+            return defaultControlAllocation
 
-        # Report EVC max info
+        if controller is None:
+            raise EVCAuxiliaryError("Call to {}() missing controller argument".format(self.__class__.__name__))
+
+        controller.EVC_max = None
+        controller.EVC_values = []
+        controller.EVC_policies = []
+
+        # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
+        controller.context.execution_phase = ContextFlags.SIMULATION
+        controller.context.string = "{0} EXECUTING {1} of {2}".format(controller.name,
+                                                                      EVC_SIMULATION,
+                                                                      controller.system.name)
         if controller.prefs.reportOutputPref:
-            print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
-            print ("ControlProjection allocation(s) for maximum EVC:")
-            for i in range(len(controller.control_signals)):
-                print("\t{0}: {1}".format(controller.control_signals[i].name,
-                                        controller.EVC_max_policy[i]))
-            print()
+            print("\n{0} evaluating EVC for {1} (one dot for each sample): ".
+                  format(controller.name, controller.system.name))
+
+        save_values_and_policies = (controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]
+                                    or controller.save_top_values_and_policies
+                                    or controller.save_EVC_landscapes)
+        EVCs = {}
+        EVC_values = []
+        EVC_policies = []
+        max_tuple = [float('-Infinity'), None, None, None]
+
+        def evaluate(allocation_vector):
+            # Return the EVC of allocation_vector, simulating the system only if it has not yet been evaluated
+            key = tuple(allocation_vector)
+            try:
+                return EVCs[key]
+            except KeyError:
+                pass
+
+            if controller.prefs.reportOutputPref:
+                print(kwProgressBarChar, end='', flush=True)
+
+            EVC, outcome, cost = _compute_EVC(args=(controller, allocation_vector, runtime_params, context))
+            EVCs[key] = float(EVC)
+
+            if save_values_and_policies:
+                EVC_values.append(EVCs[key])
+                EVC_policies.append(np.array(allocation_vector))
+
+            if EVCs[key] > max_tuple[0]:
+                max_tuple[:] = [EVCs[key], EVC, [np.array(value) for value in controller.input_values],
+                                np.array(allocation_vector)]
+
+            return EVCs[key]
+
+        self._search(controller, evaluate)
+
+        self.num_simulations = len(EVCs)
+        controller.EVC_max = max_tuple[1]
+        controller.EVC_max_state_values = max_tuple[2]
+        controller.EVC_max_policy = max_tuple[3]
+        if save_values_and_policies:
+            _save_EVC_values_and_policies(controller, np.array(EVC_values), np.array(EVC_policies))
+
+        if controller.prefs.reportOutputPref:
+            print("\nEVC simulation completed")
+
+        return _assign_EVC_max_policy(controller)
+
+    def _search(self, controller, evaluate):
+        """Call **evaluate** with each allocation policy (a 1d np.array with one allocation for each of
+        **controller**'s ControlSignals) to be evaluated;  it returns the EVC of that policy.
+        """
+        raise EVCAuxiliaryError("PROGRAM ERROR: {} must implement a _search method".format(self.__class__.__name__))
+
+    @staticmethod
+    def _get_allocation_samples(controller):
+        """Return a sorted 1d np.array with the allocation_samples of each of **controller**'s ControlSignals"""
+        return [np.unique(np.asarray(control_signal.allocation_samples, dtype=float))
+                for control_signal in controller.control_signals]
 
-        #endregionj
+    @staticmethod
+    def _get_current_allocations(controller):
+        """Return a 1d np.array with the current allocation of each of **controller**'s ControlSignals"""
+        return np.array([np.ravel(control_signal.variable)[0] for control_signal in controller.control_signals],
+                        dtype=float)
 
-        # # TEST PRINT:
-        # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
 
-        #region ASSIGN AND RETURN allocation_policy
-        # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
-        #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
-        #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
-        allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
-        controller.value = allocation_policy
-        return allocation_policy
-        #endregion
+class ControlSignalCoordinateAscent(ControlSignalSearchFunction):
+    """
+    ControlSignalCoordinateAscent(  \
+        max_iterations=10)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` by changing the `allocation
+    <ControlSignal.allocation>` of one ControlSignal at a time.
+
+    The search starts from the `allocation_samples <ControlSignal.allocation_samples>` of each ControlSignal closest to
+    its current `allocation <ControlSignal.allocation>` (i.e., the one assigned in the previous `TRIAL`).  It then
+    iterates over the ControlSignals, evaluating each of the `allocation_samples <ControlSignal.allocation_samples>`
+    of the ControlSignal with the allocations of all of the others held constant, and keeping the one with the greatest
+    EVC.  This is repeated until an iteration over all of the ControlSignals does not change the policy, or
+    **max_iterations** have been completed.  Each iteration evaluates at most the sum (rather than the product) of the
+    number of `allocation_samples <ControlSignal.allocation_samples>` of the ControlSignals.  The policy returned
+    maximizes the EVC with respect to the allocation of each ControlSignal, which is the maximum over all allocation
+    policies if the effects of the ControlSignals on the EVC are independent of one another, but need not be otherwise.
+    See `ControlSignalSearchFunction` for additional details.
+
+    Arguments
+    ---------
+
+    max_iterations : int : default 10
+        the maximum number of iterations over the ControlSignals.
+
+    Attributes
+    ----------
+
+    max_iterations : int
+        the maximum number of iterations over the ControlSignals.
+
+    num_simulations : int
+        the number of allocation policies evaluated in the last search.
+
+    """
+
+    componentName = CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 max_iterations=10):
+        if not isinstance(max_iterations, int) or max_iterations < 1:
+            raise EVCAuxiliaryError("max_iterations argument ({}) for {} must be an integer greater than 0".
+                                    format(max_iterations, self.__class__.__name__))
+        self.max_iterations = max_iterations
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner)
+
+    def _search(self, controller, evaluate):
+        allocation_samples = self._get_allocation_samples(controller)
+        policy = np.array([samples[np.argmin(np.abs(samples - allocation))]
+                           for samples, allocation in zip(allocation_samples,
+                                                          self._get_current_allocations(controller))])
+        EVC = evaluate(policy)
+
+        for iteration in range(self.max_iterations):
+            changed = False
+            for i, samples in enumerate(allocation_samples):
+                for sample in samples:
+                    if sample == policy[i]:
+                        continue
+                    candidate = policy.copy()
+                    candidate[i] = sample
+                    candidate_EVC = evaluate(candidate)
+                    if candidate_EVC > EVC:
+                        policy, EVC = candidate, candidate_EVC
+                        changed = True
+            if not changed:
+                break
+
+
+class ControlSignalGoldenSectionSearch(ControlSignalSearchFunction):
+    """
+    ControlSignalGoldenSectionSearch(  \
+        max_iterations=10,             \
+        tolerance=0.01)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` over the continuous range of
+    `allocation <ControlSignal.allocation>` of each ControlSignal, changing the allocation of one ControlSignal at a
+    time.
+
+    The range of allocations for each ControlSignal is from the smallest to the largest of its `allocation_samples
+    <ControlSignal.allocation_samples>`.  The search starts from the current `allocation <ControlSignal.allocation>` of
+    each ControlSignal (i.e., the one assigned in the previous `TRIAL`, limited to its range).  It then iterates over
+    the ControlSignals, using a `golden-section search <https://en.wikipedia.org/wiki/Golden-section_search>`_ to find
+    the allocation of the ControlSignal with the greatest EVC with the allocations of all of the others held constant,
+    until the interval containing it is less than **tolerance** times the ControlSignal's range.  This is repeated
+    until an iteration over all of the ControlSignals changes the allocation of each by less than that amount, or
+    **max_iterations** have been completed.  The golden-section search assumes that the EVC has a single maximum
+    over the range of each ControlSignal (with the others held constant); otherwise, it may find one that is not the
+    greatest.  See `ControlSignalSearchFunction` for additional details.
+
+    Arguments
+    ---------
+
+    max_iterations : int : default 10
+        the maximum number of iterations over the ControlSignals.
+
+    tolerance : float : default 0.01
+        the size, relative to the range of a ControlSignal's allocations, of the interval at which each golden-section
+        search is terminated.
+
+    Attributes
+    ----------
+
+    max_iterations : int
+        the maximum number of iterations over the ControlSignals.
+
+    tolerance : float
+        the size, relative to the range of a ControlSignal's allocations, of the interval at which each golden-section
+        search is terminated.
+
+    num_simulations : int
+        the number of allocation policies evaluated in the last search.
+
+    """
+
+    componentName = CONTROL_SIGNAL_GOLDEN_SECTION_SEARCH_FUNCTION
+
+    # The ratio of the interval searched in each step of a golden-section search to the one in the previous step
+    _INVERSE_GOLDEN_RATIO = (np.sqrt(5) - 1) / 2
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 max_iterations=10,
+                 tolerance=0.01):
+        if not isinstance(max_iterations, int) or max_iterations < 1:
+            raise EVCAuxiliaryError("max_iterations argument ({}) for {} must be an integer greater than 0".
+                                    format(max_iterations, self.__class__.__name__))
+        if not 0 < tolerance < 1:
+            raise EVCAuxiliaryError("tolerance argument ({}) for {} must be a number between 0 and 1".
+                                    format(tolerance, self.__class__.__name__))
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner)
+
+    def _search(self, controller, evaluate):
+        allocation_samples = self._get_allocation_samples(controller)
+        lows = np.array([samples[0] for samples in allocation_samples])
+        highs = np.array([samples[-1] for samples in allocation_samples])
+        tolerances = self.tolerance * (highs - lows)
+        policy = np.clip(self._get_current_allocations(controller), lows, highs)
+        EVC = evaluate(policy)
+
+        for iteration in range(self.max_iterations):
+            previous_policy = policy
+            for i in range(len(policy)):
+                if highs[i] > lows[i]:
+                    policy, EVC = self._line_search(evaluate, policy, EVC, i, lows[i], highs[i], tolerances[i])
+            if np.all(np.abs(policy - previous_policy) < tolerances):
+                break
+
+    def _line_search(self, evaluate, policy, EVC, i, low, high, tolerance):
+        """Return the policy and EVC with the greatest EVC found by a golden-section search over the allocation of the
+        **i**\\ th ControlSignal between **low** and **high**, or **policy** and **EVC** if none is greater.
+        """
+
+        def evaluate_allocation(allocation):
+            candidate = policy.copy()
+            candidate[i] = allocation
+            return evaluate(candidate), candidate
+
+        range_low, range_high = low, high
+        c = high - self._INVERSE_GOLDEN_RATIO * (high - low)
+        d = low + self._INVERSE_GOLDEN_RATIO * (high - low)
+        c_EVC, c_policy = evaluate_allocation(c)
+        d_EVC, d_policy = evaluate_allocation(d)
+        while high - low > tolerance:
+            if c_EVC > d_EVC:
+                high, d, d_EVC, d_policy = d, c, c_EVC, c_policy
+                c = high - self._INVERSE_GOLDEN_RATIO * (high - low)
+                c_EVC, c_policy = evaluate_allocation(c)
+            else:
+                low, c, c_EVC, c_policy = c, d, d_EVC, d_policy
+                d = low + self._INVERSE_GOLDEN_RATIO * (high - low)
+                d_EVC, d_policy = evaluate_allocation(d)
+
+        candidates = [(EVC, policy), (c_EVC, c_policy), (d_EVC, d_policy)]
+        # The interior points never reach the ends of the range, so evaluate the end the search converged on, if any
+        for end in (low, high):
+            if end in (range_low, range_high):
+                candidates.append(evaluate_allocation(end))
+        return max(candidates, key=lambda candidate: candidate[0])[::-1]
+
+
+class ControlSignalGridRefinement(ControlSignalSearchFunction):
+    """
+    ControlSignalGridRefinement(  \
+        num_samples=3,            \
+        num_refinements=3)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` by evaluating successively
+    finer grids of allocation policies, each centered on the policy with the greatest EVC in the previous one.
+
+    The first grid spans the range of allocations for each ControlSignal, from the smallest to the largest of its
+    `allocation_samples <ControlSignal.allocation_samples>`, with **num_samples** evenly spaced allocations for each.
+    Each subsequent grid spans the allocations closer to the policy with the greatest EVC so far than to any other in
+    the previous grid (i.e., half of the spacing of the previous grid on either side of it, limited to the range of
+    each ControlSignal), again with **num_samples** allocations for each ControlSignal, so that the spacing of the grid
+    is reduced by a factor of (**num_samples** - 1) at each of the **num_refinements** refinements.  Each grid has
+    **num_samples** to the power of the number of ControlSignals allocation policies, so this is most useful when the
+    number of `allocation_samples <ControlSignal.allocation_samples>` required for a `ControlSignalGridSearch` to
+    achieve the same precision is large.  See `ControlSignalSearchFunction` for additional details.
+
+    Arguments
+    ---------
+
+    num_samples : int : default 3
+        the number of allocations of each ControlSignal in each grid.
+
+    num_refinements : int : default 3
+        the number of grids evaluated after the first.
+
+    Attributes
+    ----------
+
+    num_samples : int
+        the number of allocations of each ControlSignal in each grid.
+
+    num_refinements : int
+        the number of grids evaluated after the first.
+
+    num_simulations : int
+        the number of allocation policies evaluated in the last search.
+
+    """
+
+    componentName = CONTROL_SIGNAL_GRID_REFINEMENT_FUNCTION
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 num_samples=3,
+                 num_refinements=3):
+        if not isinstance(num_samples, int) or num_samples < 2:
+            raise EVCAuxiliaryError("num_samples argument ({}) for {} must be an integer greater than 1".
+                                    format(num_samples, self.__class__.__name__))
+        if not isinstance(num_refinements, int) or num_refinements < 0:
+            raise EVCAuxiliaryError("num_refinements argument ({}) for {} must be a non-negative integer".
+                                    format(num_refinements, self.__class__.__name__))
+        self.num_samples = num_samples
+        self.num_refinements = num_refinements
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner)
+
+    def _search(self, controller, evaluate):
+        allocation_samples = self._get_allocation_samples(controller)
+        range_lows = np.array([samples[0] for samples in allocation_samples])
+        range_highs = np.array([samples[-1] for samples in allocation_samples])
+        lows, highs = range_lows, range_highs
+
+        for refinement in range(self.num_refinements + 1):
+            grid = [np.linspace(low, high, self.num_samples) for low, high in zip(lows, highs)]
+            best_EVC = float('-Infinity')
+            best_policy = None
+            for policy in itertools.product(*grid):
+                EVC = evaluate(np.array(policy))
+                if EVC > best_EVC:
+                    best_EVC, best_policy = EVC, np.array(policy)
+
+            half_spacing = (highs - lows) / (self.num_samples - 1) / 2
+            lows = np.maximum(range_lows, best_policy - half_spacing)
+            highs = np.minimum(range_highs, best_policy + half_spacing)
+
+
+class EVCLandscapes:
+    """The EVC of each `allocation_policy` evaluated by an `EVCControlMechanism` in each `TRIAL`.
+
+    An EVCLandscapes object is assigned to the `EVC_landscapes <EVCControlMechanism.EVC_landscapes>` attribute of an
+    EVCControlMechanism if its **save_EVC_landscapes** argument is `True`; each time the EVCControlMechanism's `function
+    <EVCControlMechanism.function>` evaluates a set of allocation policies, the policies and their EVCs are added to it.
+    Indexing it with the number of a search returns a tuple with a 1d np.array of the EVC values and a 2d np.array of
+    the allocation policies in that search.  When the policies are the same as in the previous search (for example, in
+    a `ControlSignalGridSearch`), the same array is used for both, so that storing them adds only the EVC values.
+
+    The landscapes can be saved in a single compressed `.npz` file using the `save <EVCLandscapes.save>` method, and
+    loaded using the `load <EVCLandscapes.load>` method.
+
+    Attributes
+    ----------
+
+    values : 1d np.array
+        the EVC values of all of the searches, concatenated in the order the searches were carried out.
+
+    policies : 2d np.array
+        the allocation policies of all of the searches, in the same order as `values <EVCLandscapes.values>`.
+
+    offsets : 1d np.array
+        the index in `values <EVCLandscapes.values>` and `policies <EVCLandscapes.policies>` of the first item of each
+        search, followed by the total number of items.
+
+    """
+
+    def __init__(self):
+        self._values = []
+        self._policies = []
+
+    def append(self, EVC_values, EVC_policies):
+        """Add the EVC values (1d array) and allocation policies (2d array) evaluated in a search"""
+        EVC_policies = np.asarray(EVC_policies, dtype=float)
+        if self._policies and np.array_equal(EVC_policies, self._policies[-1]):
+            EVC_policies = self._policies[-1]
+        else:
+            EVC_policies = EVC_policies.copy()
+        self._values.append(np.array(EVC_values, dtype=float))
+        self._policies.append(EVC_policies)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, search):
+        return self._values[search], self._policies[search]
+
+    @property
+    def values(self):
+        if not self._values:
+            return np.empty(0)
+        return np.concatenate(self._values)
+
+    @property
+    def policies(self):
+        if not self._policies:
+            return np.empty((0, 0))
+        return np.concatenate(self._policies)
+
+    @property
+    def offsets(self):
+        return np.cumsum([0] + [len(values) for values in self._values])
+
+    def save(self, file):
+        """Save the landscapes in **file** (a file name or file object), in the numpy `.npz` format"""
+        np.savez_compressed(file, values=self.values, policies=self.policies, offsets=self.offsets)
+
+    @classmethod
+    def load(cls, file):
+        """Return an EVCLandscapes object with the landscapes saved in **file** by `save <EVCLandscapes.save>`"""
+        landscapes = cls()
+        with np.load(file) as data:
+            values, policies, offsets = data['values'], data['policies'], data['offsets']
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            landscapes.append(values[start:end], policies[start:end])
+        return landscapes
 
 
 def _compute_EVC(args):
@@ -510,13 +1074,15 @@ def _compute_EVC(args):
         allocation_vector (1D np.array): allocation policy for which to compute EVC
         runtime_params (dict): runtime params passed to ctlr.update
         context (value): context passed to ctlr.update
+        costs (1D np.array): optional cost of each ControlSignal for the allocation policy (if they were computed
+            in advance); otherwise, the costs computed by the ControlSignals during the simulation are used
 
     Returns (float, float, float):
         (EVC_current, outcome, aggregated_costs)
 
     """
 
-    ctlr, allocation_vector, runtime_params, context = args
+    ctlr, allocation_vector, runtime_params, context = args[:4]
     # # TEST PRINT:
     # print("Allocation vector: {}\nPredicted input: {}".
     #       format(allocation_vector, [mech.outputState.value for mech in ctlr.predicted_input]),
@@ -527,6 +1093,10 @@ def _compute_EVC(args):
                         runtime_params=runtime_params,
                         context=context)
 
+    # Use the costs for the policy if they were computed in advance (see ControlSignalGridSearch)
+    if len(args) > 4:
+        ctlr.control_signal_costs = np.array(args[4]).reshape(-1, 1)
+
     EVC_current = ctlr.paramsCurrent[VALUE_FUNCTION].function(controller=ctlr,
                                                               outcome=outcome,
                                                               costs=ctlr.control_signal_costs,
@@ -538,3 +1108,48 @@ def _compute_EVC(args):
 
     else:
         return (EVC_current)
+
+
+def _assign_EVC_max_policy(controller):
+    """Assign the values of **controller**'s input_states for the allocation policy in its `EVC_max_policy` attribute,
+    and return that policy as its `allocation_policy`.
+    """
+
+    # Assign max values for optimal allocation policy to controller.input_states (for reference only)
+    EVC_maxStateValue = iter(controller.EVC_max_state_values)
+    for i in range(len(controller.input_states)):
+        controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+
+    # Report EVC max info
+    if controller.prefs.reportOutputPref:
+        print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
+        print ("ControlProjection allocation(s) for maximum EVC:")
+        for i in range(len(controller.control_signals)):
+            print("\t{0}: {1}".format(controller.control_signals[i].name,
+                                    controller.EVC_max_policy[i]))
+        print()
+
+    # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
+    #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
+    #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
+    allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
+    controller.value = allocation_policy
+    return allocation_policy
+
+
+def _save_EVC_values_and_policies(controller, EVC_values, EVC_policies):
+    """Assign **controller**'s `EVC_values` and `EVC_policies` attributes from the EVC of every allocation policy
+    evaluated (**EVC_values**) and the policies (**EVC_policies**), as specified by its save_all_values_and_policies
+    and save_top_values_and_policies attributes, and add them to its EVC_landscapes if save_EVC_landscapes is True
+    """
+    if controller.save_EVC_landscapes:
+        controller.EVC_landscapes.append(EVC_values, EVC_policies)
+
+    if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+        controller.EVC_values = EVC_values
+        controller.EVC_policies = np.array(EVC_policies)
+    elif controller.save_top_values_and_policies:
+        # Keep the policies with the greatest EVC, in order of decreasing EVC (and of evaluation for equal EVCs)
+        top = np.argsort(-EVC_values, kind='mergesort')[:controller.save_top_values_and_policies]
+        controller.EVC_values = EVC_values[top]
+        controller.EVC_policies = EVC_policies[top]
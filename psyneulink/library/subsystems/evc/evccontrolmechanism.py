@@ -217,6 +217,17 @@ are determined by its `allocation_samples` attribute.  For each `allocation_poli
       the costs from the outcome to generate the EVC;  this too can be configured (see
       `combine_outcome_and_cost_function <EVCControlMechanism.combine_outcome_and_cost_function>`).
 
+The number of allocation_policies evaluated by `ControlSignalGridSearch` is the product of the number of
+`allocation_samples <ControlSignal.allocation_samples>` of each ControlSignal, and so grows exponentially with the
+number of ControlSignals.  The `ControlSignalSearchFunctions <ControlSignalSearchFunction>` --
+`ControlSignalCoordinateAscent`, `ControlSignalGoldenSectionSearch` and `ControlSignalGridRefinement` -- can be assigned
+as the EVCControlMechanism's `function <EVCControlMechanism.function>` instead;  they evaluate each allocation_policy in
+the same way, but choose the ones to evaluate based on the EVC of those already evaluated, and report the number they
+evaluated in their `num_simulations <ControlSignalSearchFunction.num_simulations>` attribute.  Alternatively, if the
+best possible outcome is known, it can be specified in the **max_outcome** argument of `ControlSignalGridSearch`,
+which then skips the allocation_policies whose costs are too great for them to yield the maximum EVC, and still
+returns the same `allocation_policy <EVCControlMechanism.allocation_policy>`.
+
 In addition to modifying the default functions (as noted above), any or all of them can be replaced with a custom
 function to modify how the `allocation_policy <EVCControlMechanism.allocation_policy>` is determined, so long as the custom
 function accepts arguments and returns values that are compatible with any other functions that call that function (see
@@ -286,6 +297,24 @@ detailed `above <EVC_Default_Configuration>`):
 This procedure can be modified by specifying a custom function for any or all of the `functions
 <EVCControlMechanism_Functions>` referred to above.
 
+.. _EVCControlMechanism_Simulation_Cache:
+
+If the **simulation_cache_size** argument of the EVCControlMechanism's constructor is greater than 0, the outcome of
+each simulation (the `value <InputState.value>` of each of its `input_states <Mechanism_Base.input_states>`) is saved,
+and used in place of simulating the `system <EVCControlMechanism.system>` again for the same `allocation_policy` in a
+later `TRIAL` in which the `predicted_input <EVCControlMechanism.predicted_input>`, the (unmodulated) values of the
+parameters of the `system <EVCControlMechanism.system>`'s Mechanisms and their afferent Projections, and the values
+that its recurrent and feedback Projections carry over from the previous `TRIAL` are the same (for example, in a
+blocked design with repeated stimuli).  The outcomes of at most **simulation_cache_size** simulations are
+saved;  when that number is exceeded, the least recently used one is discarded.  The `cost <ControlSignal.cost>` of each
+ControlSignal is always computed.  Outcomes are saved only when the `system <EVCControlMechanism.system>` is
+deterministic: that is, it does not use `learning <System.learning>`, and none of its Mechanisms uses a
+`DistributionFunction`, a stateful `Integrator` Function, or a function as its **noise** parameter.  The numbers of
+simulations for which a saved outcome was and was not available are recorded in the `simulation_cache_hits
+<EVCControlMechanism.simulation_cache_hits>` and `simulation_cache_misses <EVCControlMechanism.simulation_cache_misses>`
+attributes, and the saved outcomes can be discarded using the `clear_simulation_cache
+<EVCControlMechanism.clear_simulation_cache>` method.
+
 
 .. _EVCControlMechanism_Examples:
 
@@ -324,11 +353,13 @@ Class Reference
 
 """
 
+from collections import OrderedDict
+
 import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import function_type
-from psyneulink.components.functions.function import ModulationParam, _is_modulation_param
+from psyneulink.components.functions.function import DistributionFunction, Integrator, ModulationParam, _is_modulation_param
 from psyneulink.components.mechanisms.adaptive.control.controlmechanism import ControlMechanism
 from psyneulink.components.mechanisms.mechanism import MechanismList
 from psyneulink.components.mechanisms.processing import integratormechanism
@@ -342,7 +373,7 @@ from psyneulink.globals.keywords import CONTROL, CONTROLLER, COST_FUNCTION, EVC_
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import ContentAddressableList
-from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch, ValueFunction
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch, EVCLandscapes, ValueFunction
 
 __all__ = [
     'EVCControlMechanism', 'EVCError',
@@ -368,6 +399,9 @@ class EVCControlMechanism(ControlMechanism):
     cost_function=LinearCombination(operation=SUM),                    \
     combine_outcome_and_cost_function=LinearCombination(operation=SUM) \
     save_all_values_and_policies:bool=:keyword:`False`,                \
+    save_top_values_and_policies=0,                                    \
+    save_EVC_landscapes=False,                                         \
+    simulation_cache_size=0,                                           \
     control_signals=None,                                              \
     params=None,                                                       \
     name=None,                                                         \
@@ -465,6 +499,18 @@ class EVCControlMechanism(ControlMechanism):
     save_all_values_and_policies : bool : default False
         specifes whether to save every `allocation_policy` tested in `EVC_policies` and their values in `EVC_values`.
 
+    save_top_values_and_policies : int : default 0
+        specifies the number of `allocation_policies <allocation_policy>` with the greatest `EVC
+        <EVCControlMechanism_EVC>` to save in `EVC_policies` and their values in `EVC_values`, if
+        **save_all_values_and_policies** is `False`.
+
+    save_EVC_landscapes : bool : default False
+        specifies whether to save every `allocation_policy` tested and its value in every `TRIAL`, in `EVC_landscapes`.
+
+    simulation_cache_size : int : default 0
+        specifies the maximum number of simulation outcomes to save for reuse in later `TRIAL`\\s;  0 disables the
+        reuse of outcomes (see `EVCControlMechanism_Simulation_Cache`).
+
     control_signals : ControlSignal specification or List[ControlSignal specification, ...]
         specifies the parameters to be controlled by the EVCControlMechanism
         (see `ControlSignal_Specification` for details of specification).
@@ -621,7 +667,9 @@ class EVCControlMechanism(ControlMechanism):
     control_signal_search_space : 2d np.array
         an array each item of which is an `allocation_policy`.  By default, it is assigned the set of all possible
         allocation policies, using np.meshgrid to construct all permutations of `ControlSignal` values from the set
-        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.
+        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.  It is
+        `None` if the `function <EVCControlMechanism.function>` is a `ControlSignalSearchFunction`, which does not use
+        it.
 
     EVC_max : 1d np.array with single value
         the maximum `EVC <EVCControlMechanism_EVC>` value over all allocation policies in `control_signal_search_space`.
@@ -639,13 +687,38 @@ class EVCControlMechanism(ControlMechanism):
         If it is specified, each `allocation_policy` tested in the `control_signal_search_space` is saved in
         `EVC_policies`, and their values are saved in `EVC_values`.
 
+    save_top_values_and_policies : int : default 0
+        if `save_all_values_and_policies` is `False`, the number of `allocation_policies <allocation_policy>` with the
+        greatest `EVC <EVCControlMechanism_EVC>` that are saved in `EVC_policies` (in order of decreasing EVC), and
+        whose values are saved in `EVC_values`.
+
+    save_EVC_landscapes : bool : default False
+        specifies whether every `allocation_policy` tested and its value in every `TRIAL` are saved in
+        `EVC_landscapes`.
+
+    EVC_landscapes : EVCLandscapes or None
+        if `save_EVC_landscapes` is `True`, an `EVCLandscapes` object with every `allocation_policy` tested and its
+        `EVC <EVCControlMechanism_EVC>` value, for each `TRIAL` (in the order they were executed).
+
     EVC_policies : 2d np.array
-        array with every `allocation_policy` tested in `control_signal_search_space`.  The `EVC <EVCControlMechanism_EVC>`
-        value of each is stored in `EVC_values`.
+        array with every `allocation_policy` tested in `control_signal_search_space` (or, if `save_top_values_and_policies`
+        is specified, the ones with the greatest EVC).  The `EVC <EVCControlMechanism_EVC>` value of each is stored in
+        `EVC_values`.
 
     EVC_values :  1d np.array
         array of `EVC <EVCControlMechanism_EVC>` values, each of which corresponds to an `allocation_policy` in `EVC_policies`;
 
+    simulation_cache_size : int
+        the maximum number of simulation outcomes saved for reuse in later `TRIAL`\\s (see
+        `EVCControlMechanism_Simulation_Cache`).
+
+    simulation_cache_hits : int
+        the number of calls to `run_simulation` for which a saved outcome was used.
+
+    simulation_cache_misses : int
+        the number of calls to `run_simulation` that simulated the `system <EVCControlMechanism.system>` when outcomes
+        could be saved.
+
     allocation_policy : 2d np.array : defaultControlAllocation
         determines the value assigned as the `variable <ControlSignal.variable>` for each `ControlSignal` and its
         associated `ControlProjection`.  Each item of the array must be a 1d array (usually containing a scalar)
@@ -702,6 +775,9 @@ class EVCControlMechanism(ControlMechanism):
                  cost_function=LinearCombination(operation=SUM),
                  combine_outcome_and_cost_function=LinearCombination(operation=SUM),
                  save_all_values_and_policies:bool=False,
+                 save_top_values_and_policies:int=0,
+                 save_EVC_landscapes:bool=False,
+                 simulation_cache_size:int=0,
                  params=None,
                  name=None,
                  prefs:is_pref_set=None):
@@ -720,6 +796,22 @@ class EVCControlMechanism(ControlMechanism):
                                                   save_all_values_and_policies=save_all_values_and_policies,
                                                   params=params)
 
+        if save_top_values_and_policies < 0:
+            raise EVCError("save_top_values_and_policies argument ({}) for {} must be a non-negative integer".
+                           format(save_top_values_and_policies, self.__class__.__name__))
+        self.save_top_values_and_policies = save_top_values_and_policies
+        self.save_EVC_landscapes = save_EVC_landscapes
+        self.EVC_landscapes = EVCLandscapes() if save_EVC_landscapes else None
+
+        if simulation_cache_size < 0:
+            raise EVCError("simulation_cache_size argument ({}) for {} must be a non-negative integer".
+                           format(simulation_cache_size, self.__class__.__name__))
+        self.simulation_cache_size = simulation_cache_size
+        self.simulation_cache_hits = 0
+        self.simulation_cache_misses = 0
+        self._simulation_cache = OrderedDict()
+        self._simulation_cache_key = None
+
         super(EVCControlMechanism, self).__init__(# default_variable=default_variable,
                                            # size=size,
                                            system=system,
@@ -888,25 +980,19 @@ class EVCControlMechanism(ControlMechanism):
 
         if context != ContextFlags.PROPERTY:
             self._update_predicted_input()
+
+        # Outcomes of simulations can be reused only for the current predicted_input and parameter values
+        self._simulation_cache_key = self._get_simulation_cache_key()
         # self.system._cache_state()
 
         # CONSTRUCT SEARCH SPACE
 
-        control_signal_sample_lists = []
-        control_signals = self.control_signals
-
-        # Get allocation_samples for all ControlSignals
-        num_control_signals = len(control_signals)
-
-        for control_signal in self.control_signals:
-            control_signal_sample_lists.append(control_signal.allocation_samples)
+        # Functions that choose the policies to evaluate as they search (see ControlSignalSearchFunction) don't use it
+        if not getattr(self.function_object, 'uses_control_signal_search_space', True):
+            self.control_signal_search_space = None
 
-        # Construct control_signal_search_space:  set of all permutations of ControlProjection allocations
-        #                                     (one sample from the allocationSample of each ControlProjection)
-        # Reference for implementation below:
-        # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
-        self.control_signal_search_space = \
-            np.array(np.meshgrid(*control_signal_sample_lists)).T.reshape(-1,num_control_signals)
+        else:
+            self.control_signal_search_space = self._construct_control_signal_search_space()
 
         # EXECUTE SEARCH
 
@@ -988,6 +1074,24 @@ class EVCControlMechanism(ControlMechanism):
             self.value[i] = np.atleast_1d(allocation_vector[i])
         self._update_output_states(runtime_params=runtime_params, context=context)
 
+        # Use the saved outcome of a simulation under the same conditions, if there is one
+        #    (see EVCControlMechanism_Simulation_Cache)
+        cache_key = None
+        if self._simulation_cache_key is not None:
+            cache_key = (self._simulation_cache_key, _get_fingerprint(allocation_vector))
+            try:
+                outcome = self._simulation_cache[cache_key]
+            except KeyError:
+                self.simulation_cache_misses += 1
+            else:
+                self.simulation_cache_hits += 1
+                self._simulation_cache.move_to_end(cache_key)
+                for input_state, value in zip(self.input_states, outcome):
+                    input_state.value = np.array(value)
+                for i in range(len(self.control_signals)):
+                    self.control_signal_costs[i] = self.control_signals[i].cost
+                return np.array(self.input_values)
+
         self.system.context.execution_phase = ContextFlags.SIMULATION
         self.system.run(inputs=inputs, context=context)
         self.system.context.execution_phase = ContextFlags.IDLE
@@ -997,11 +1101,126 @@ class EVCControlMechanism(ControlMechanism):
         # self.objective_mechanism.execute(context=EVC_SIMULATION)
         monitored_states = self._update_input_states(runtime_params=runtime_params, context=context)
 
+        if cache_key is not None:
+            self._simulation_cache[cache_key] = [np.array(value) for value in self.input_values]
+            if len(self._simulation_cache) > self.simulation_cache_size:
+                self._simulation_cache.popitem(last=False)
+
         for i in range(len(self.control_signals)):
             self.control_signal_costs[i] = self.control_signals[i].cost
 
         return monitored_states
 
+    def clear_simulation_cache(self):
+        """Discard the saved outcomes of simulations (see `EVCControlMechanism_Simulation_Cache`)."""
+        self._simulation_cache.clear()
+
+    def _get_simulation_cache_key(self):
+        """Return a key for the predicted_input, the parameter values of the system's Mechanisms and their afferent
+        Projections, and the values carried into a simulation by its recurrent and feedback Projections, or None if
+        outcomes of simulations are not to be saved
+        """
+        if not self.simulation_cache_size or self.system is None or not self._simulation_is_deterministic():
+            return None
+
+        execution_graph = self.system.execution_graph
+
+        # Use the values of the parameters before they are modulated (e.g., by the ControlSignals)
+        parameter_states = []
+        # The values of the senders of recurrent and feedback Projections (i.e., those on which their receiver does
+        #    not depend in the execution_graph) are the ones from the previous trial when a simulation begins
+        carried_over_values = []
+        for mechanism in self.system.mechanisms:
+            parameter_states.extend(mechanism._parameter_states or [])
+            for input_state in mechanism.input_states:
+                for projection in input_state.path_afferents:
+                    parameter_states.extend(projection._parameter_states or [])
+                    sender_mech = projection.sender.owner
+                    if (mechanism in execution_graph and sender_mech in execution_graph
+                            and sender_mech not in execution_graph[mechanism]):
+                        carried_over_values.append(projection.sender.value)
+
+        return (tuple(_get_fingerprint(self.predicted_input[origin_mech])
+                      for origin_mech in self.system.origin_mechanisms),
+                tuple(_get_fingerprint(parameter_state._get_base_value()) for parameter_state in parameter_states),
+                tuple(_get_fingerprint(value) for value in carried_over_values))
+
+    def _simulation_is_deterministic(self):
+        """Return True if each simulation of the system with the same input and parameter values has the same outcome
+        """
+        if self.system.learning:
+            return False
+        for mechanism in self.system.mechanisms:
+            if getattr(mechanism, 'integrator_mode', False):
+                return False
+            for function in (mechanism.function_object, getattr(mechanism, 'integrator_function', None)):
+                if isinstance(function, (DistributionFunction, Integrator)):
+                    return False
+            for noise in (getattr(mechanism, 'noise', None), getattr(mechanism.function_object, 'noise', None)):
+                if any(callable(item) or isinstance(item, Function) for item in np.ravel(np.array(noise, dtype=object))):
+                    return False
+        return True
+
+    def _construct_control_signal_search_space(self):
+        """Return the set of all permutations of ControlSignal allocations
+        (one sample from the allocation_samples of each ControlSignal)
+        """
+        control_signal_sample_lists = []
+        control_signals = self.control_signals
+
+        # Get allocation_samples for all ControlSignals
+        num_control_signals = len(control_signals)
+
+        for control_signal in self.control_signals:
+            control_signal_sample_lists.append(control_signal.allocation_samples)
+
+        # Reference for implementation below:
+        # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
+        return np.array(np.meshgrid(*control_signal_sample_lists)).T.reshape(-1,num_control_signals)
+
+    def compute_control_signal_costs(self, allocation_policies=None):
+        """
+        Compute the `cost <ControlSignal.cost>` of each `ControlSignal` for each of a set of allocation policies.
+
+        The costs of each ControlSignal are computed (using its `compute_costs <ControlSignal.compute_costs>` method)
+        in a single call for the `intensity <ControlSignal.intensity>` that its `function <ControlSignal.function>`
+        computes from each of the distinct allocations it is assigned in **allocation_policies**; the
+        ControlSignals' attributes are not changed.
+
+        Arguments
+        ----------
+
+        allocation_policies : 2d np.array : default control_signal_search_space
+            the allocation policies for which to compute the costs, each of which has one allocation value for each of
+            the EVCControlMechanism's ControlSignals (listed in `control_signals`);  if the EVCControlMechanism has
+            not yet executed, the default is every combination of the ControlSignals' `allocation_samples
+            <ControlSignal.allocation_samples>`.
+
+        Returns
+        -------
+
+        costs : 2d np.array
+            an array with one row for each item of **allocation_policies**, that contains the `cost
+            <ControlSignal.cost>` of each ControlSignal for that policy.
+
+        """
+
+        if allocation_policies is None:
+            # control_signal_search_space is assigned when the EVCControlMechanism executes
+            allocation_policies = getattr(self, 'control_signal_search_space', None)
+            if allocation_policies is None:
+                allocation_policies = self._construct_control_signal_search_space()
+        allocation_policies = np.atleast_2d(allocation_policies)
+
+        costs = np.empty((len(allocation_policies), len(self.control_signals)))
+        for i, control_signal in enumerate(self.control_signals):
+            # Compute the cost of each distinct allocation only once, and then assign it to every policy that uses it
+            allocations, policy_indices = np.unique(allocation_policies[:, i], return_inverse=True)
+            # Costs are computed for the intensity that the ControlSignal's function computes from each allocation
+            intensities = [control_signal.function(np.atleast_1d(allocation)) for allocation in allocations]
+            costs[:, i] = control_signal.compute_costs(intensities)[policy_indices]
+        return costs
+
     # The following implementation of function attributes as properties insures that even if user sets the value of a
     #    function directly (i.e., without using assign_params), it will still be wrapped as a UserDefinedFunction.
     # This is done to insure they can be called by value_function in the same way as the defaults
@@ -1053,3 +1272,11 @@ class EVCControlMechanism(ControlMechanism):
             self._combine_outcome_and_cost_function = udf
         else:
             self._combine_outcome_and_cost_function = value
+
+
+def _get_fingerprint(value):
+    """Return a hashable representation of a numeric value, that may be a ragged nested list of arrays"""
+    try:
+        return np.asarray(value, dtype=float).tobytes()
+    except (TypeError, ValueError):
+        return tuple(_get_fingerprint(item) for item in value)
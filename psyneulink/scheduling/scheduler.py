@@ -302,10 +302,11 @@ Class Reference
 import copy
 import datetime
 import logging
-import uuid
 
 from toposort import toposort
 
+from psyneulink.globals.context import _get_execution_id
+from psyneulink.globals.utilities import _get_unique_id
 from psyneulink.scheduling.condition import AllHaveRun, Always, Condition, ConditionSet, Never
 from psyneulink.scheduling.time import Clock, TimeScale
 
@@ -394,7 +395,7 @@ class Scheduler(object):
         '''
         self.condition_set = condition_set if condition_set is not None else ConditionSet()
 
-        self.default_execution_id = uuid.uuid4()
+        self.default_execution_id = _get_unique_id()
         # stores the in order list of self.run's yielded outputs
         self.execution_list = {self.default_execution_id: []}
         self.clocks = {self.default_execution_id: Clock()}
@@ -457,11 +458,11 @@ class Scheduler(object):
             Attributes
             ----------
 
-                execution_id : uuid.uuid4
+                execution_id : int
                     the execution_id to initialize counts for
                     default : self.default_execution_id
 
-                base_execution_id : uuid.uuid4
+                base_execution_id : int
                     if specified, the counts for execution_id will be copied from the counts of base_execution_id
                     default : None
         '''
@@ -475,7 +476,7 @@ class Scheduler(object):
 
             if base_execution_id is not None:
                 if base_execution_id not in self.counts_total:
-                    raise SchedulerError('UUID {0} not in {1}.counts_total'.format(base_execution_id, self))
+                    raise SchedulerError('execution_id {0} not in {1}.counts_total'.format(base_execution_id, self))
 
                 self.counts_total[execution_id] = {
                     ts: {n: self.counts_total[base_execution_id][ts][n] for n in self.nodes} for ts in TimeScale
@@ -495,7 +496,7 @@ class Scheduler(object):
 
             if base_execution_id is not None:
                 if base_execution_id not in self.counts_useable:
-                    raise SchedulerError('UUID {0} not in {1}.counts_useable'.format(base_execution_id, self))
+                    raise SchedulerError('execution_id {0} not in {1}.counts_useable'.format(base_execution_id, self))
 
                 self.counts_useable[execution_id] = {
                     node: {n: self.counts_useable[base_execution_id][node][n] for n in self.nodes} for node in self.nodes
@@ -508,7 +509,7 @@ class Scheduler(object):
         if execution_id not in self.execution_list:
             if base_execution_id is not None:
                 if base_execution_id not in self.execution_list:
-                    raise SchedulerError('UUID {0} not in {1}.execution_list'.format(base_execution_id, self))
+                    raise SchedulerError('execution_id {0} not in {1}.execution_list'.format(base_execution_id, self))
 
                 self.execution_list[execution_id] = list(self.execution_list[base_execution_id])
             else:
@@ -519,7 +520,7 @@ class Scheduler(object):
         if execution_id not in self.clocks:
             if base_execution_id is not None:
                 if base_execution_id not in self.clocks:
-                    raise SchedulerError('UUID {0} not in {1}.clocks'.format(base_execution_id, self))
+                    raise SchedulerError('execution_id {0} not in {1}.clocks'.format(base_execution_id, self))
 
                 self.clocks[execution_id] = copy.deepcopy(self.clocks[base_execution_id])
             else:
@@ -545,6 +546,21 @@ class Scheduler(object):
             node: {n: 0 for n in self.nodes} for node in self.nodes
         }
 
+    def _add_settle_steps(self, node, num_steps, execution_id=None):
+        '''
+        Counts the steps taken by **node** in a single execution in `settle_mode <TransferMechanism.settle_mode>`
+        (see `Transfer_Settling`) as executions of it, in addition to the one for which it was scheduled
+        '''
+        if execution_id is None:
+            execution_id = _get_execution_id()
+            if execution_id is None or execution_id not in self.counts_total:
+                execution_id = self.default_execution_id
+
+        for ts in TimeScale:
+            self.counts_total[execution_id][ts][node] += num_steps - 1
+        for n in self.counts_useable[execution_id]:
+            self.counts_useable[execution_id][node][n] += num_steps - 1
+
     def update_termination_conditions(self, termination_conds):
         self.termination_conds = dict(self.default_termination_conds)
         if termination_conds is not None:
@@ -613,7 +629,13 @@ class Scheduler(object):
         self.update_termination_conditions(self._parse_termination_conditions(termination_conds))
 
         if execution_id is None:
-            execution_id = self.default_execution_id
+            # Use the execution of the current execution_context block, if any (see Context_Execution_Values);
+            #    like the values of Components, its counts and Clock start from those of the default execution
+            execution_id = _get_execution_id()
+            if execution_id is None:
+                execution_id = self.default_execution_id
+            elif base_execution_id is None:
+                base_execution_id = self.default_execution_id
 
         self._init_counts(execution_id, base_execution_id)
         self._reset_counts_useable(execution_id)
@@ -706,4 +728,7 @@ class Scheduler(object):
 
     @property
     def clock(self):
-        return self.clocks[self.default_execution_id]
+        try:
+            return self.clocks[_get_execution_id()]
+        except KeyError:
+            return self.clocks[self.default_execution_id]
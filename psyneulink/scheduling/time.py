@@ -21,12 +21,14 @@ or :class:`Scheduler.clock.simple_time <SimpleTime>`
 
 """
 
+import array
+import bisect
 import enum
 import functools
 import types
 
 __all__ = [
-    'Clock', 'TimeScale', 'Time', 'SimpleTime', 'TimeHistoryTree', 'TimeScaleError'
+    'Clock', 'TimeScale', 'Time', 'SimpleTime', 'TimeHistory', 'TimeHistoryTree', 'TimeScaleError'
 ]
 
 
@@ -110,11 +112,13 @@ class Clock:
 
     Attributes
     ----------
-        history : `TimeHistoryTree`
-            a root `TimeHistoryTree` associated with this Clock
+        history : `TimeHistory`
+            a `TimeHistory` associated with this Clock
     '''
     def __init__(self):
-        self.history = TimeHistoryTree()
+        # passes are recorded so that time stamps taken by Components when they execute can be resolved
+        #    (see Component.current_execution_time)
+        self.history = TimeHistory(max_depth=TimeScale.PASS)
         self._simple_time = SimpleTime()
 
     def __repr__(self):
@@ -126,9 +130,24 @@ class Clock:
         '''
         self.history.increment_time(time_scale)
 
+    @property
+    def _time_index(self):
+        '''
+        the number of times this Clock has been incremented
+        '''
+        return self.history.num_increments
+
+    def _get_time_by_index(self, index):
+        '''
+        Returns
+        -------
+            (run, trial, pass, time_step) of this Clock after its **index**\\ th increment : tuple
+        '''
+        return self.history.get_time_by_increment(index)
+
     def get_total_times_relative(self, query_time_scale, base_time_scale, base_index=None):
         '''
-        Convenience simplified wrapper for `TimeHistoryTree.get_total_times_relative`
+        Convenience simplified wrapper for `TimeHistory.get_total_times_relative`
 
         Arguments
         ---------
@@ -278,10 +297,199 @@ class SimpleTime(types.SimpleNamespace):
         return 'Time(run: {0}, trial: {1}, time_step: {2})'.format(self.run, self.trial, self.time_step)
 
 
+class TimeHistory:
+    '''
+    Stores a history of time that has occurred at various :class:`TimeScale`\\ s, typically used in conjunction
+    with a `Clock`. Answers the same queries as a `TimeHistoryTree` rooted at `TimeScale.LIFE`, but rather than
+    creating a node for each unit of time, it records, at the start of each unit of each :class:`TimeScale` down
+    to **max_depth**, the total number of units of each finer :class:`TimeScale` that had occurred up to that point.
+    The number of units that occurred within any one of them is the difference between two of these totals, so
+    `get_total_times_relative` does not depend on the length of the history, and each unit of time is recorded
+    as a few integers.
+
+    Attributes
+    ----------
+        time_scale : :class:`TimeScale` : `TimeScale.LIFE`
+            the TimeScale over which this history is kept
+
+        max_depth : :class:`TimeScale` : `TimeScale.TRIAL`
+            the finest grain TimeScale over which the number of units of finer TimeScales can be queried
+            (see `TimeHistoryTree.max_depth`)
+
+        current_time : `Time`
+            a `Time` object that represents the current time
+
+        total_times : dict{:class:`TimeScale`: int}
+            stores the total number of units of :class:`TimeScale`\\ s that have occurred over **time_scale**
+
+        num_increments : int
+            the total number of times `increment_time` has been called
+    '''
+    def __init__(self, max_depth=TimeScale.TRIAL):
+        self.current_time = Time()
+        self.time_scale = TimeScale.LIFE
+        self.max_depth = max_depth
+        self.total_times = {ts: 0 for ts in TimeScale if ts < self.time_scale}
+        self.num_increments = 0
+
+        # TimeScales whose units are recorded, from coarsest to finest
+        self._recorded_time_scales = sorted((ts for ts in TimeScale if max_depth <= ts < self.time_scale),
+                                            reverse=True)
+        # for each recorded TimeScale, for each finer TimeScale, its total at the start of each recorded unit
+        self._start_totals = {
+            ts: {query_ts: array.array('q') for query_ts in TimeScale if query_ts < ts}
+            for ts in self._recorded_time_scales
+        }
+        # for each recorded TimeScale, the index of the first unit of the next finer recorded TimeScale
+        #    within each of its units
+        self._first_child_units = {ts: array.array('q') for ts in self._recorded_time_scales}
+        # for each recorded TimeScale, num_increments at the start of each of its units
+        self._start_increments = {ts: array.array('q') for ts in self._recorded_time_scales}
+        self._num_units = {ts: 0 for ts in self._recorded_time_scales}
+
+        # the first unit of every recorded TimeScale starts with the history
+        self._start_units(self.time_scale)
+
+    def _start_units(self, time_scale):
+        '''
+        Records the start of a new unit of each recorded :class:`TimeScale` as fine as or finer than **time_scale**
+        '''
+        for ts in self._recorded_time_scales:
+            if ts > time_scale:
+                continue
+            for query_ts, start_totals in self._start_totals[ts].items():
+                start_totals.append(self.total_times[query_ts])
+            if ts > self.max_depth:
+                self._first_child_units[ts].append(self._num_units[TimeScale.get_child(ts)])
+            self._start_increments[ts].append(self.num_increments)
+            self._num_units[ts] += 1
+
+    def increment_time(self, time_scale):
+        '''
+        Increases **current_time** by one **time_scale**
+
+        Arguments
+        ---------
+            time_scale : :class:`TimeScale`
+                the unit of time to increment
+        '''
+        self.total_times[time_scale] += 1
+        self.num_increments += 1
+        self.current_time._increment_by_time_scale(time_scale)
+        self._start_units(time_scale)
+
+    def get_time_by_increment(self, index):
+        '''
+        Arguments
+        ---------
+            index : int
+                a value of **num_increments**
+
+        Returns
+        -------
+            (run, trial, pass, time_step) of **current_time** when **num_increments** was **index** : tuple
+        '''
+        if self.max_depth > TimeScale.PASS:
+            raise TimeScaleError(
+                'TimeHistory {0}: {1} is finer than its max_depth ({2})'.format(self, TimeScale.PASS, self.max_depth)
+            )
+        if not 0 <= index <= self.num_increments:
+            raise TimeScaleError('TimeHistory {0}: increment {1} has not occurred'.format(self, index))
+
+        # the unit of each recorded TimeScale in progress at the index'th increment is the last one started by then
+        units = {
+            ts: bisect.bisect_right(self._start_increments[ts], index) - 1
+            for ts in (TimeScale.RUN, TimeScale.TRIAL, TimeScale.PASS)
+        }
+        # only TIME_STEPs are incremented within a PASS
+        return (
+            units[TimeScale.RUN],
+            units[TimeScale.TRIAL] - self._first_child_units[TimeScale.RUN][units[TimeScale.RUN]],
+            units[TimeScale.PASS] - self._first_child_units[TimeScale.TRIAL][units[TimeScale.TRIAL]],
+            index - self._start_increments[TimeScale.PASS][units[TimeScale.PASS]]
+        )
+
+    def get_total_times_relative(
+        self,
+        query_time_scale,
+        base_indices=None
+    ):
+        '''
+        Arguments
+        ---------
+            query_time_scale : :class:`TimeScale`
+                the :class:`TimeScale` of units to be returned
+
+            base_indices : dict{:class:`TimeScale`: int}
+                a dictionary specifying what scope of time query_time_scale \
+                is over (see `TimeHistoryTree.get_total_times_relative`)
+
+        Returns
+        -------
+            the number of units of query_time_scale that have occurred within \
+            the scope of time specified by base_indices : int
+        '''
+        if query_time_scale >= self.time_scale:
+            raise TimeScaleError(
+                'query_time_scale (given: {0}) must be of finer grain than {1}.time_scale ({2})'.format(
+                    query_time_scale, self, self.time_scale
+                )
+            )
+
+        if base_indices is None:
+            base_indices = {}
+
+        # base_time_scale is the finest grain TimeScale that is specified, but more coarse than query_time_scale
+        base_time_scale = TimeScale.LIFE
+        for ts in base_indices:
+            if base_indices[ts] is not None and query_time_scale < ts < base_time_scale:
+                base_time_scale = ts
+
+        if base_time_scale == TimeScale.LIFE:
+            return self.total_times[query_time_scale]
+
+        if base_time_scale < self.max_depth:
+            raise TimeScaleError(
+                'TimeHistory {0}: {1} is finer than its max_depth ({2})'.format(self, base_time_scale, self.max_depth)
+            )
+
+        # find the (overall) index of the specified unit of base_time_scale, by indexing into each coarser unit in
+        #    turn; a TimeScale that is not specified defaults to its latest unit
+        first_unit = 0
+        num_units = self._num_units[TimeScale.RUN]
+        for ts in self._recorded_time_scales:
+            index = base_indices.get(ts)
+            if index is None:
+                index = num_units - 1
+            elif not 0 <= index < num_units:
+                raise TimeScaleError(
+                    'TimeHistory {0}: {1} {2} does not exist in {3} {4}'.format(
+                        self, ts, index, TimeScale.get_parent(ts), first_unit
+                    )
+                )
+            unit = first_unit + index
+            if ts == base_time_scale:
+                break
+
+            first_child_units = self._first_child_units[ts]
+            first_unit = first_child_units[unit]
+            try:
+                num_units = first_child_units[unit + 1] - first_unit
+            except IndexError:
+                num_units = self._num_units[TimeScale.get_child(ts)] - first_unit
+
+        start_totals = self._start_totals[base_time_scale][query_time_scale]
+        try:
+            end_total = start_totals[unit + 1]
+        except IndexError:
+            end_total = self.total_times[query_time_scale]
+        return end_total - start_totals[unit]
+
+
 class TimeHistoryTree:
     '''
     A tree object that stores a history of time that has occurred at various
-    :class:`TimeScale`\\ s, typically used in conjunction with a `Clock`
+    :class:`TimeScale`\\ s. A `Clock` uses the more compact `TimeHistory`, which answers the same queries.
 
     Attributes
     ----------
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignalCosts
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
+
+
+class TestBranchAndBound:
+
+    def _run_grid_search(self, reward):
+        # Return the controller of a System run with an exhaustive grid search, and the greatest outcome of its
+        #    simulations (the default value_function subtracts the sum of the costs from the outcome)
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch, save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [reward]})
+        controller = s.controller
+        costs = controller.compute_control_signal_costs(controller.control_signal_search_space)
+        return controller, np.max(controller.EVC_values.astype(float) + np.sum(costs, axis=1))
+
+    @pytest.mark.parametrize('reward', [20, 0.1])
+    @pytest.mark.parametrize('slack', [0, 0.5, 100])
+    def test_same_policy_as_grid_search(self, reward, slack):
+        expected, max_outcome = self._run_grid_search(reward)
+
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch(max_outcome=max_outcome + slack),
+                                save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [reward]})
+
+        controller = s.controller
+        np.testing.assert_array_equal(controller.EVC_max_policy, expected.EVC_max_policy)
+        assert float(controller.EVC_max) == float(expected.EVC_max)
+        # the EVC values of the pruned policies are nan;  the others are the same as without pruning
+        values = controller.EVC_values.astype(float)
+        evaluated = ~np.isnan(values)
+        np.testing.assert_array_equal(values[evaluated], expected.EVC_values.astype(float)[evaluated])
+
+        function = controller.function_object
+        assert function.num_simulations == np.count_nonzero(evaluated)
+        assert function.num_simulations + function.num_pruned == len(controller.control_signal_search_space)
+        if slack == 0:
+            assert function.num_pruned > 0
+
+    def test_no_pruning_without_max_outcome(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch, save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        assert s.controller.function_object.num_pruned == 0
+        assert not np.any(np.isnan(s.controller.EVC_values.astype(float)))
+
+    def test_no_pruning_with_adjustment_costs(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch(max_outcome=0), save_all_values_and_policies=True))
+        for control_signal in s.controller.control_signals:
+            control_signal.enable_costs([ControlSignalCosts.ADJUSTMENT_COST])
+        s.run(inputs={Input: [0.5], Reward: [20]})
+
+        function = s.controller.function_object
+        assert function.num_pruned == 0
+        assert function.num_simulations == len(s.controller.control_signal_search_space)
+
+    @pytest.mark.benchmark(group="EVC branch and bound")
+    @pytest.mark.parametrize('prune', [False, True])
+    def test_branch_and_bound_benchmark(self, benchmark, prune):
+        max_outcome = self._run_grid_search(20)[1] if prune else None
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch(max_outcome=max_outcome),
+                                save_all_values_and_policies=True))
+        benchmark(s.run, inputs={Input: [0.5], Reward: [20]})
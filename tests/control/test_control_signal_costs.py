@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+
+from psyneulink.components.functions.function import Linear, LinearCombination
+from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignalCosts
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
+
+
+class TestControlSignalCosts:
+
+    @staticmethod
+    def _assign_cost_function(control_signal, cost_function_name, cost_function):
+        # assign directly, as reassigning a cost function with parameter validation re-instantiates all of them
+        control_signal.paramValidationPref = False
+        setattr(control_signal, cost_function_name, cost_function)
+
+    @staticmethod
+    def _costs_one_at_a_time(control_signal, intensities):
+        costs = []
+        for intensity in intensities:
+            control_signal.value = intensity
+            control_signal._compute_costs()
+            costs.append(float(control_signal.cost))
+        return np.array(costs)
+
+    def test_compute_costs_matches_compute_costs_for_each_intensity(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        control_signal = s.controller.control_signals[0]
+        intensities = np.array([0.1, 0.5, 1.0, 2.5])
+
+        costs = control_signal.compute_costs(intensities)
+
+        assert control_signal.cost != costs[-1]
+        np.testing.assert_allclose(costs, self._costs_one_at_a_time(control_signal, intensities))
+
+    def test_compute_costs_with_adjustment_cost(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        control_signal = s.controller.control_signals[0]
+        control_signal.enable_costs([ControlSignalCosts.ADJUSTMENT_COST])
+        control_signal.value = 0.5
+        control_signal._compute_costs()
+        intensities = np.array([0.1, 0.5, 1.0])
+
+        costs = control_signal.compute_costs(intensities)
+
+        expected = []
+        for intensity in intensities:
+            control_signal.last_intensity = 0.5
+            expected.extend(self._costs_one_at_a_time(control_signal, [intensity]))
+        np.testing.assert_allclose(costs, expected)
+
+    def test_compute_costs_with_linear_combination(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        control_signal = s.controller.control_signals[0]
+        control_signal.enable_costs([ControlSignalCosts.ADJUSTMENT_COST])
+        self._assign_cost_function(control_signal, 'cost_combination_function',
+                                   LinearCombination(weights=[[1], [-1], [1]]).function)
+        control_signal.last_intensity = 0.25
+        intensities = np.array([0.1, 0.5, 1.0])
+
+        costs = control_signal.compute_costs(intensities)
+
+        np.testing.assert_allclose(costs, np.maximum(0.0, np.exp(intensities) - (intensities - 0.25)))
+
+    def test_compute_costs_with_custom_function(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        control_signal = s.controller.control_signals[0]
+        calls = []
+
+        def intensity_cost_function(intensity):
+            calls.append(intensity)
+            return intensity ** 2
+
+        self._assign_cost_function(control_signal, 'intensity_cost_function', intensity_cost_function)
+        intensities = np.array([0.1, 0.5, 1.0])
+
+        costs = control_signal.compute_costs(intensities)
+
+        assert len(calls) == len(intensities)
+        np.testing.assert_allclose(costs, intensities ** 2)
+
+    def test_compute_control_signal_costs(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        controller = s.controller
+        search_space = controller.control_signal_search_space
+
+        costs = controller.compute_control_signal_costs()
+
+        assert costs.shape == (len(search_space), len(controller.control_signals))
+        for i, control_signal in enumerate(controller.control_signals):
+            np.testing.assert_allclose(costs[:, i], self._costs_one_at_a_time(control_signal, search_space[:, i]))
+
+    def test_EVC_unchanged_by_precomputed_costs(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        # An adjustment cost of 0 does not change the costs, but requires them to be computed in each simulation
+        Input, Reward, Decision, reference = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        for control_signal in reference.controller.control_signals:
+            control_signal.enable_costs([ControlSignalCosts.ADJUSTMENT_COST])
+            self._assign_cost_function(control_signal, 'adjustment_cost_function', Linear(slope=0).function)
+        reference.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        np.testing.assert_allclose(s.controller.EVC_values.astype(float), reference.controller.EVC_values.astype(float))
+        np.testing.assert_allclose(s.controller.EVC_policies, reference.controller.EVC_policies)
+        np.testing.assert_allclose(s.controller.EVC_max_policy, reference.controller.EVC_max_policy)
+        assert not any(control_signal._defer_costs for control_signal in s.controller.control_signals)
+
+    def test_compute_control_signal_costs_before_execution(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system()
+        controller = s.controller
+
+        costs = controller.compute_control_signal_costs()
+
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        np.testing.assert_allclose(costs, controller.compute_control_signal_costs())
+
+    def test_costs_computed_for_control_signal_intensity(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        for control_signal in s.controller.control_signals:
+            control_signal.function_object.slope = 3
+        s.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        # costs computed in each simulation, from the ControlSignal's value (as in the test above)
+        Input, Reward, Decision, reference = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        for control_signal in reference.controller.control_signals:
+            control_signal.function_object.slope = 3
+            control_signal.enable_costs([ControlSignalCosts.ADJUSTMENT_COST])
+            self._assign_cost_function(control_signal, 'adjustment_cost_function', Linear(slope=0).function)
+        reference.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        np.testing.assert_allclose(s.controller.EVC_values.astype(float), reference.controller.EVC_values.astype(float))
+        intensities = 3 * s.controller.control_signal_search_space
+        for i, control_signal in enumerate(s.controller.control_signals):
+            np.testing.assert_allclose(s.controller.compute_control_signal_costs()[:, i],
+                                       self._costs_one_at_a_time(control_signal, intensities[:, i]))
+
+    @pytest.mark.benchmark(group="ControlSignal costs")
+    @pytest.mark.parametrize('vectorized', [True, False])
+    def test_control_signal_costs_benchmark(self, benchmark, vectorized):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        controller = s.controller
+        if vectorized:
+            benchmark(controller.compute_control_signal_costs)
+        else:
+            benchmark(lambda: [self._costs_one_at_a_time(control_signal, controller.control_signal_search_space[:, i])
+                               for i, control_signal in enumerate(controller.control_signals)])
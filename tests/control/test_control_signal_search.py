@@ -0,0 +1,105 @@
+import types
+
+import numpy as np
+import pytest
+
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalCoordinateAscent, \
+    ControlSignalGoldenSectionSearch, ControlSignalGridRefinement, ControlSignalGridSearch, EVCAuxiliaryError
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
+
+SEARCH_FUNCTIONS = [ControlSignalCoordinateAscent, ControlSignalGoldenSectionSearch, ControlSignalGridRefinement]
+
+
+class TestControlSignalSearch:
+
+    @staticmethod
+    def _search(function, allocation_samples, EVC_function):
+        # Run function's search for a controller with one ControlSignal for each item of allocation_samples, and
+        #    return the best policy it evaluated and the number of policies evaluated
+        controller = types.SimpleNamespace(control_signals=[
+            types.SimpleNamespace(allocation_samples=samples, variable=np.array([samples[0]]))
+            for samples in allocation_samples
+        ])
+        evaluated = {}
+
+        def evaluate(allocation_vector):
+            return evaluated.setdefault(tuple(allocation_vector), EVC_function(np.array(allocation_vector)))
+
+        function._search(controller, evaluate)
+        return np.array(max(evaluated, key=evaluated.get)), len(evaluated)
+
+    @pytest.mark.parametrize('function', SEARCH_FUNCTIONS)
+    def test_same_policy_as_grid_search(self, function):
+        Input, Reward, Decision, grid_search_system = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch, save_all_values_and_policies=True))
+        grid_search_system.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=function, save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+
+        controller = s.controller
+        assert controller.control_signal_search_space is None
+        np.testing.assert_allclose(controller.EVC_max_policy, grid_search_system.controller.EVC_max_policy)
+        assert float(controller.EVC_max) == pytest.approx(float(grid_search_system.controller.EVC_max))
+        assert controller.function_object.num_simulations == len(controller.EVC_values)
+        assert controller.function_object.num_simulations == len(controller.EVC_policies)
+        assert np.max(controller.EVC_values.astype(float)) == float(controller.EVC_max)
+
+    def test_grid_search_num_simulations(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=ControlSignalGridSearch, save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        assert s.controller.function_object.num_simulations == len(s.controller.control_signal_search_space)
+
+    def test_coordinate_ascent(self):
+        allocation_samples = [np.arange(0.1, 1.01, 0.1)] * 4
+        optimum = np.array([0.3, 0.5, 0.7, 0.9])
+
+        policy, num_simulations = self._search(ControlSignalCoordinateAscent(), allocation_samples,
+                                               lambda policy: -np.sum((policy - optimum) ** 2))
+
+        np.testing.assert_allclose(policy, optimum)
+        assert num_simulations < 100
+
+    def test_golden_section_search(self):
+        allocation_samples = [[0.1, 1.0]] * 4
+        optimum = np.array([0.25, 0.45, 0.65, 0.85])
+
+        policy, num_simulations = self._search(ControlSignalGoldenSectionSearch(tolerance=0.001), allocation_samples,
+                                               lambda policy: -np.sum((policy - optimum) ** 2))
+
+        np.testing.assert_allclose(policy, optimum, atol=0.001)
+        assert num_simulations < 200
+
+    def test_golden_section_search_at_end_of_range(self):
+        policy, num_simulations = self._search(ControlSignalGoldenSectionSearch(), [[0.1, 1.0], [0.1, 1.0]],
+                                               lambda policy: np.sum(policy))
+        np.testing.assert_allclose(policy, [1.0, 1.0])
+
+    def test_grid_refinement(self):
+        allocation_samples = [[0.1, 1.0]] * 3
+        optimum = np.array([0.25, 0.45, 0.65])
+
+        policy, num_simulations = self._search(ControlSignalGridRefinement(num_refinements=8), allocation_samples,
+                                               lambda policy: -np.sum((policy - optimum) ** 2))
+
+        np.testing.assert_allclose(policy, optimum, atol=0.01)
+        assert num_simulations <= 27 * 9
+
+    @pytest.mark.parametrize('function, kwargs, message', [
+        (ControlSignalCoordinateAscent, {'max_iterations': 0}, 'max_iterations'),
+        (ControlSignalGoldenSectionSearch, {'tolerance': 1.5}, 'tolerance'),
+        (ControlSignalGridRefinement, {'num_samples': 1}, 'num_samples'),
+        (ControlSignalGridRefinement, {'num_refinements': -1}, 'num_refinements'),
+    ])
+    def test_invalid_arguments(self, function, kwargs, message):
+        with pytest.raises(EVCAuxiliaryError) as error_text:
+            function(**kwargs)
+        assert message in str(error_text.value)
+
+    @pytest.mark.benchmark(group="ControlSignal search")
+    @pytest.mark.parametrize('function', [ControlSignalGridSearch] + SEARCH_FUNCTIONS)
+    def test_control_signal_search_benchmark(self, benchmark, function):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(EVCControlMechanism(function=function))
+        benchmark(s.run, inputs={Input: [0.5], Reward: [20]})
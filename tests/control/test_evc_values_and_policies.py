@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalCoordinateAscent, ControlSignalGridSearch, \
+    EVCLandscapes
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism, EVCError
+
+
+class TestEVCValuesAndPolicies:
+
+    @staticmethod
+    def _run(s, Input, Reward, inputs):
+        results = []
+        s.run(inputs={Input: inputs, Reward: [20] * len(inputs)},
+              call_after_trial=lambda: results.append((np.array(s.controller.EVC_values, dtype=float),
+                                                       np.array(s.controller.EVC_policies))))
+        return results
+
+    def test_save_all_values_and_policies(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        s.run(inputs={Input: [0.5], Reward: [20]})
+
+        controller = s.controller
+        np.testing.assert_array_equal(controller.EVC_policies, controller.control_signal_search_space)
+        assert len(controller.EVC_values) == len(controller.control_signal_search_space)
+        assert np.max(controller.EVC_values) == float(controller.EVC_max)
+        np.testing.assert_array_equal(controller.EVC_policies[np.argmax(controller.EVC_values)],
+                                      controller.EVC_max_policy)
+
+    def test_nothing_saved_by_default(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(EVCControlMechanism())
+        s.run(inputs={Input: [0.5], Reward: [20]})
+        assert len(s.controller.EVC_values) == 0
+        assert len(s.controller.EVC_policies) == 0
+        assert s.controller.EVC_landscapes is None
+
+    @pytest.mark.parametrize('function', [ControlSignalGridSearch, ControlSignalCoordinateAscent])
+    def test_save_top_values_and_policies(self, function):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=function, save_all_values_and_policies=True))
+        (all_values, all_policies), = self._run(s, Input, Reward, [0.5])
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(function=function, save_top_values_and_policies=3))
+        (values, policies), = self._run(s, Input, Reward, [0.5])
+
+        order = np.argsort(-all_values, kind='mergesort')[:3]
+        np.testing.assert_allclose(values, all_values[order])
+        np.testing.assert_array_equal(policies, all_policies[order])
+        assert values[0] == float(s.controller.EVC_max)
+
+    def test_save_EVC_landscapes(self, tmpdir):
+        inputs = [0.5, 0.123, 0.3]
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(
+            EVCControlMechanism(save_all_values_and_policies=True))
+        expected = self._run(s, Input, Reward, inputs)
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(EVCControlMechanism(save_EVC_landscapes=True))
+        self._run(s, Input, Reward, inputs)
+
+        landscapes = s.controller.EVC_landscapes
+        assert len(landscapes) == len(inputs)
+        for trial, (expected_values, expected_policies) in enumerate(expected):
+            values, policies = landscapes[trial]
+            np.testing.assert_allclose(values, expected_values)
+            np.testing.assert_array_equal(policies, expected_policies)
+        # the grid search evaluates the same policies in each trial, so they are stored only once
+        assert landscapes[0][1] is landscapes[2][1]
+        np.testing.assert_array_equal(landscapes.offsets, np.arange(len(inputs) + 1) * len(expected[0][0]))
+
+        file = str(tmpdir.join('landscapes.npz'))
+        landscapes.save(file)
+        loaded = EVCLandscapes.load(file)
+        np.testing.assert_allclose(loaded.values, landscapes.values)
+        np.testing.assert_array_equal(loaded.policies, landscapes.policies)
+        np.testing.assert_array_equal(loaded.offsets, landscapes.offsets)
+
+    def test_invalid_save_top_values_and_policies(self):
+        with pytest.raises(EVCError) as error_text:
+            EVCControlMechanism(save_top_values_and_policies=-1)
+        assert "must be a non-negative integer" in str(error_text.value)
+
+    @pytest.mark.benchmark(group="EVC values and policies")
+    @pytest.mark.parametrize('save', ['none', 'all', 'top', 'landscapes'])
+    def test_evc_values_and_policies_benchmark(self, benchmark, save):
+        controller_args = {'all': {'save_all_values_and_policies': True},
+                           'top': {'save_top_values_and_policies': 3},
+                           'landscapes': {'save_EVC_landscapes': True}}.get(save, {})
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(EVCControlMechanism(**controller_args))
+        benchmark(s.run, inputs={Input: [0.5], Reward: [20]})
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from psyneulink.components.functions.function import AdaptiveIntegrator, BogaczEtAl, DRIFT_RATE, NormalDist, THRESHOLD
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.system import System
+from psyneulink.globals.keywords import FUNCTION, IDENTITY_MATRIX
+from psyneulink.library.mechanisms.processing.integrator.ddm import DDM, PROBABILITY_UPPER_THRESHOLD, RESPONSE_TIME
+from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferMechanism
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism, EVCError
+
+
+class TestSimulationCache:
+
+    @staticmethod
+    def _controller(simulation_cache_size):
+        # the predicted input for each trial is the input of the previous trial
+        return EVCControlMechanism(simulation_cache_size=simulation_cache_size,
+                                   save_all_values_and_policies=True,
+                                   prediction_mechanism_params={FUNCTION: AdaptiveIntegrator(rate=1.0)})
+
+    @staticmethod
+    def _run(s, Input, Reward, inputs):
+        EVC_values = []
+        s.run(inputs={Input: inputs, Reward: [20] * len(inputs)},
+              call_after_trial=lambda: EVC_values.append(np.array(s.controller.EVC_values, dtype=float)))
+        return EVC_values
+
+    def test_same_EVC_values_as_without_cache(self):
+        inputs = [0.5, 0.5, 0.123, 0.5, 0.5]
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(0))
+        expected = self._run(s, Input, Reward, inputs)
+
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(100))
+        EVC_values = self._run(s, Input, Reward, inputs)
+
+        for expected_values, values in zip(expected, EVC_values):
+            np.testing.assert_allclose(values, expected_values)
+        num_policies = len(s.controller.control_signal_search_space)
+        # the predicted input is the same as in an earlier trial in the second, fourth and fifth trials
+        assert s.controller.simulation_cache_hits == 3 * num_policies
+        assert s.controller.simulation_cache_misses == 2 * num_policies
+
+    def test_parameter_change_is_not_a_hit(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(100))
+        self._run(s, Input, Reward, [0.5])
+        Decision.function_object.t0 = 0.3
+
+        EVC_values = self._run(s, Input, Reward, [0.5])
+
+        assert s.controller.simulation_cache_hits == 0
+        Input, Reward, Decision, reference = pytest.helpers.make_evc_system(self._controller(0))
+        self._run(reference, Input, Reward, [0.5])
+        Decision.function_object.t0 = 0.3
+        expected = self._run(reference, Input, Reward, [0.5])
+        np.testing.assert_allclose(EVC_values, expected)
+
+    def test_least_recently_used_outcomes_discarded(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(4))
+        self._run(s, Input, Reward, [0.5, 0.5])
+
+        assert len(s.controller._simulation_cache) == 4
+        assert s.controller.simulation_cache_hits == 0
+
+    def test_clear_simulation_cache(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(100))
+        self._run(s, Input, Reward, [0.5, 0.5])
+        s.controller.clear_simulation_cache()
+        misses = s.controller.simulation_cache_misses
+
+        self._run(s, Input, Reward, [0.5])
+
+        assert s.controller.simulation_cache_misses == misses + len(s.controller.control_signal_search_space)
+
+    def test_no_cache_for_random_noise(self):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(100),
+                                                                      reward_noise=NormalDist().function)
+        self._run(s, Input, Reward, [0.5, 0.5, 0.5])
+
+        assert s.controller.simulation_cache_hits == 0
+        assert s.controller.simulation_cache_misses == 0
+        assert len(s.controller._simulation_cache) == 0
+
+    @pytest.mark.parametrize('auto, num_hit_trials', [(0.9, 0), (0.0, 3)])
+    def test_recurrent_projection_value_in_key(self, auto, num_hit_trials):
+        Input = TransferMechanism()
+        Reward = TransferMechanism()
+        Hidden = RecurrentTransferMechanism(auto=auto)
+        Decision = DDM(
+            function=BogaczEtAl(drift_rate=1.0, threshold=1.0, noise=0.5, starting_point=0, t0=0.45),
+            output_states=[RESPONSE_TIME, PROBABILITY_UPPER_THRESHOLD]
+        )
+        s = System(
+            processes=[Process(pathway=[Input, Hidden, IDENTITY_MATRIX, Decision]), Process(pathway=[Reward])],
+            controller=self._controller(100),
+            enable_controller=True,
+            monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)],
+            control_signals=[(DRIFT_RATE, Decision), (THRESHOLD, Decision)]
+        )
+
+        EVC_values = self._run(s, Input, Reward, [0.5] * 4)
+
+        # the value of Hidden carried over by its recurrent projection into the simulations changes in each trial,
+        #    unless auto is 0, in which case it is the same from the second trial on
+        num_policies = len(s.controller.control_signal_search_space)
+        assert s.controller.simulation_cache_hits == num_hit_trials * num_policies
+        if auto:
+            for values in EVC_values[1:]:
+                assert not np.allclose(values, EVC_values[0])
+
+    def test_invalid_simulation_cache_size(self):
+        with pytest.raises(EVCError) as error_text:
+            EVCControlMechanism(simulation_cache_size=-1)
+        assert "must be a non-negative integer" in str(error_text.value)
+
+    @pytest.mark.benchmark(group="EVC simulation cache")
+    @pytest.mark.parametrize('simulation_cache_size', [0, 100])
+    def test_simulation_cache_benchmark(self, benchmark, simulation_cache_size):
+        Input, Reward, Decision, s = pytest.helpers.make_evc_system(self._controller(simulation_cache_size))
+        benchmark(s.run, inputs={Input: [0.5] * 4, Reward: [20] * 4})
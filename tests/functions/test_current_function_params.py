@@ -0,0 +1,105 @@
+import copy
+
+import numpy as np
+import pytest
+
+from psyneulink.components.functions.function import FunctionError, Linear
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.states.parameterstate import ParameterState
+from psyneulink.components.system import System
+from psyneulink.globals.utilities import ContentAddressableList
+
+
+class TestCurrentFunctionParams:
+
+    def test_value_of_owner_parameter_state(self):
+        T = TransferMechanism(function=Linear(slope=2.0, intercept=1.0))
+        f = T.function_object
+        assert f.get_current_function_param('slope') == 2.0
+
+        T._parameter_states['slope'].value = 5.0
+
+        assert f.get_current_function_param('slope') == 5.0
+
+    def test_attribute_without_owner(self):
+        f = Linear(slope=3.0)
+        assert f.get_current_function_param('slope') == 3.0
+
+        f.slope = 4.0
+
+        assert f.get_current_function_param('slope') == 4.0
+
+    def test_get_current_function_params(self):
+        T = TransferMechanism(function=Linear(slope=2.0, intercept=1.0))
+        slope, intercept = T.function_object.get_current_function_params('slope', 'intercept')
+        assert slope == 2.0
+        assert intercept == 1.0
+
+    def test_new_owner(self):
+        T1 = TransferMechanism(function=Linear(slope=2.0))
+        T2 = TransferMechanism(function=Linear(slope=7.0))
+        f = T2.function_object
+        assert f.get_current_function_param('slope') == 7.0
+
+        f.owner = T1
+
+        assert f.get_current_function_param('slope') == 2.0
+
+    def test_reset_by_parameter_states_change(self):
+        T = TransferMechanism(function=Linear(slope=2.0))
+        f = T.function_object
+        f.get_current_function_param('slope')
+        assert 'slope' in f._current_param_states
+
+        # other ContentAddressableLists are irrelevant
+        ContentAddressableList(component_type=ParameterState).append(T._parameter_states['slope'])
+        f.get_current_function_param('intercept')
+        assert 'slope' in f._current_param_states
+
+        slope_state = T._parameter_states['slope']
+        del T._parameter_states['slope']
+        f.get_current_function_param('intercept')
+        assert 'slope' not in f._current_param_states
+        assert f.get_current_function_param('slope') == 2.0
+
+        T._parameter_states.append(slope_state)
+        slope_state.value = 5.0
+        assert f.get_current_function_param('slope') == 5.0
+
+    def test_parameter_states_resolved_once_across_trials(self):
+        T = TransferMechanism(function=Linear(slope=2.0, intercept=1.0))
+        T.set_log_conditions('value')
+        s = System(processes=[Process(pathway=[T])])
+        s.run(inputs={T: [1.0]})
+        current_param_states = T.function_object._current_param_states
+        assert 'slope' in current_param_states
+
+        s.run(inputs={T: [1.0, 2.0, 3.0]})
+
+        assert T.function_object._current_param_states is current_param_states
+        np.testing.assert_allclose(T.log.nparray_dictionary()['value'][-1], [[7.0]])
+
+    def test_deepcopy_does_not_copy_parameter_states(self):
+        T = TransferMechanism(function=Linear(slope=2.0))
+        f = T.function_object
+        f.get_current_function_param('slope')
+
+        f_copy = copy.deepcopy(f)
+
+        assert f_copy.owner is T
+        assert len(f_copy._current_param_states) == 0
+        assert f_copy.get_current_function_param('slope') == 2.0
+
+    def test_variable_is_not_a_function_param(self):
+        f = Linear()
+        with pytest.raises(FunctionError) as error_text:
+            f.get_current_function_param('variable')
+        assert "'variable' is not a function parameter" in str(error_text.value)
+
+    @pytest.mark.benchmark(group="Current function params")
+    def test_get_current_function_param_benchmark(self, benchmark):
+        T = TransferMechanism(function=Linear(slope=2.0, intercept=1.0))
+        f = T.function_object
+        result = benchmark(f.get_current_function_params, 'slope', 'intercept')
+        np.testing.assert_allclose(result, [[2.0], [1.0]])
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 import numpy as np
 
@@ -57,4 +59,125 @@ class TestUserDefFunc:
         val1 = myMech.execute(input=[1, 2, 3])
         val2 = U.execute(variable=[[1, 2, 3]])
         assert np.allclose(val1, val2)
-        assert np.allclose(val1, L.function([1, 2, 3]) + 2)
\ No newline at end of file
+        assert np.allclose(val1, L.function([1, 2, 3]) + 2)
+
+class TestUserDefFuncDispatch:
+
+    def test_udf_called_once_when_it_raises_type_error(self):
+        calls = []
+
+        def myFunction(variable):
+            calls.append(variable)
+            if len(calls) > 1:
+                raise TypeError('raised by myFunction')
+            return variable
+
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]])
+        with pytest.raises(TypeError) as error_text:
+            U.function(variable=[[1, 2]])
+        assert 'raised by myFunction' in str(error_text.value)
+        assert len(calls) == 2
+
+    def test_udf_variable_passed_positionally(self):
+        U = UserDefinedFunction(custom_function=lambda x, gain=2: x * gain, default_variable=[[0, 0]])
+        assert np.allclose(U.function(variable=np.array([[1, 2]])), [[2, 4]])
+
+    def test_udf_keyword_only_variable(self):
+        def myFunction(*, input=None, gain=3):
+            return input * gain
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]])
+        assert np.allclose(U.function(variable=np.array([[1, 2]])), [[3, 6]])
+
+    def test_udf_params_and_context_passed_only_if_in_signature(self):
+        received = {}
+
+        def with_context(variable, context=None):
+            received['context'] = context
+            return variable
+
+        def with_kwargs(variable, **kwargs):
+            received.update(kwargs)
+            return variable
+
+        U = UserDefinedFunction(custom_function=with_context, default_variable=[[0]])
+        U.function(variable=[[1]], params=None, context='my context')
+        assert received['context'] == 'my context'
+
+        U = UserDefinedFunction(custom_function=with_kwargs, default_variable=[[0]])
+        U.function(variable=[[1]], params={'a': 1}, context='my context', extra=2)
+        assert received['params'] == {'a': 1}
+        assert received['extra'] == 2
+
+    def test_udf_runtime_param(self):
+        def myFunction(variable, gain=1.0):
+            return variable * gain
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]])
+        assert np.allclose(U.function(variable=np.array([[1, 2]]), params={'gain': 5.0}), [[5, 10]])
+        assert np.allclose(U.function(variable=np.array([[1, 2]])), [[1, 2]])
+
+    def test_udf_jit(self):
+        def myFunction(variable, gain=2.0, bias=1.0):
+            return variable * gain + bias
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0.0, 0.0]], jit=True)
+        myMech = ProcessingMechanism(function=U, default_variable=[[0.0, 0.0]])
+        assert np.allclose(myMech.execute([[1.0, 2.0]]), [[3.0, 5.0]])
+
+    def test_udf_signature_resolved_at_construction(self, monkeypatch):
+        import inspect
+
+        def myFunction(variable, gain=2.0):
+            return variable * gain
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]])
+        monkeypatch.setattr(inspect, 'signature', None)
+        assert np.allclose(U.function(variable=np.array([[1, 2]])), [[2, 4]])
+
+    def test_udf_reassigned_custom_function(self):
+        U = UserDefinedFunction(custom_function=lambda x, gain=2.0: x * gain, default_variable=[[0, 0]])
+        U.custom_function = lambda x, gain=2.0: x + gain
+        assert np.allclose(U.function(variable=np.array([[1, 2]])), [[3, 4]])
+
+    def test_udf_jit_without_numba(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'numba', None)
+        calls = []
+
+        def myFunction(variable, gain=2.0):
+            calls.append(variable)
+            return variable * gain
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0.0, 0.0]], jit=True)
+        assert np.allclose(U.function(variable=np.array([[1.0, 2.0]])), [[2.0, 4.0]])
+        # the Python function itself is called
+        assert np.allclose(calls[-1], [[1.0, 2.0]])
+
+    def test_udf_jit_compiles_with_numba(self, monkeypatch):
+        numba = pytest.importorskip('numba')
+        compiled = []
+
+        def njit(fct):
+            compiled.append(fct)
+            return numba.njit(fct)
+        monkeypatch.setattr(numba, 'njit', njit)
+
+        def myFunction(variable, gain=2.0, bias=1.0):
+            return variable * gain + bias
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0.0, 0.0]], jit=True)
+        assert compiled == [myFunction]
+        assert np.allclose(U.function(variable=np.array([[1.0, 2.0]])), [[3.0, 5.0]])
+
+    def test_udf_jit_falls_back_to_python(self):
+        pytest.importorskip('numba')
+
+        def myFunction(variable, params, context):
+            # numba can't compile functions of dicts and arbitrary objects
+            return variable * 2
+
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0.0, 0.0]], jit=True)
+        assert np.allclose(U.function(variable=np.array([[1.0, 2.0]])), [[2.0, 4.0]])
+
+    @pytest.mark.benchmark(group="UserDefinedFunction")
+    @pytest.mark.parametrize('jit', [False, True])
+    def test_udf_benchmark(self, benchmark, jit):
+        def myFunction(variable, gain=2.0, bias=1.0):
+            return variable * gain + bias
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0.0, 0.0]], jit=jit)
+        val = benchmark(U.function, variable=np.array([[1.0, 2.0]]))
+        assert np.allclose(val, [[3.0, 5.0]])
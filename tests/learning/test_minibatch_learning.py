@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from psyneulink.components.functions.function import BackPropagation, Logistic
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.system import System, SystemError
+from psyneulink.globals.keywords import LEARNING
+
+
+W1 = (np.arange(12).reshape((3, 4)) + 1) / 12
+W2 = (np.arange(8).reshape((4, 2)) - 4) / 8
+
+
+def logistic(x):
+    return 1 / (1 + np.exp(-x))
+
+
+class TestMinibatchLearning:
+
+    def _learned_matrices(self, p):
+        return p.pathway[1].mod_matrix, p.pathway[3].mod_matrix
+
+    @staticmethod
+    def _batch_weight_changes(X, T, W1, W2):
+        # backpropagation for a minibatch, with the weights held fixed over the minibatch
+        H = logistic(np.dot(X, W1))
+        Y = logistic(np.dot(H, W2))
+        delta_2 = (T - Y) * Y * (1 - Y)
+        delta_1 = np.dot(delta_2, W2.T) * H * (1 - H)
+        return np.dot(X.T, delta_1), np.dot(H.T, delta_2)
+
+    def test_minibatch_matches_summed_backprop(self):
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        X = np.array([[0.1, 0.5, 0.9], [1.0, 0.0, 0.2], [0.3, 0.3, 0.3], [0.8, 0.6, 0.4]])
+        T = np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5], [1.0, 1.0]])
+
+        s.run(inputs={I: X}, targets={O: T}, learning_batch_size=4)
+
+        dW1, dW2 = self._batch_weight_changes(X, T, W1, W2)
+        learned_W1, learned_W2 = self._learned_matrices(p)
+        np.testing.assert_allclose(learned_W1, W1 + dW1)
+        np.testing.assert_allclose(learned_W2, W2 + dW2)
+
+    def test_minibatch_of_one_trial_matches_per_trial_learning(self):
+        X = [[0.1, 0.5, 0.9]]
+        T = [[1.0, 0.0]]
+
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        s.run(inputs={I: X}, targets={O: T})
+        per_trial = [np.array(m) for m in self._learned_matrices(p)]
+
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        s.run(inputs={I: X}, targets={O: T}, learning_batch_size=2)
+        minibatch = self._learned_matrices(p)
+
+        for expected, actual in zip(per_trial, minibatch):
+            np.testing.assert_allclose(actual, expected)
+
+    def test_incomplete_minibatch_applied_at_end_of_run(self):
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        X = np.array([[0.1, 0.5, 0.9], [1.0, 0.0, 0.2], [0.3, 0.3, 0.3]])
+        T = np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+
+        s.run(inputs={I: X}, targets={O: T}, learning_batch_size=2)
+
+        dW1, dW2 = self._batch_weight_changes(X[:2], T[:2], W1, W2)
+        batch_W1, batch_W2 = W1 + dW1, W2 + dW2
+        dW1, dW2 = self._batch_weight_changes(X[2:], T[2:], batch_W1, batch_W2)
+        learned_W1, learned_W2 = self._learned_matrices(p)
+        np.testing.assert_allclose(learned_W1, batch_W1 + dW1)
+        np.testing.assert_allclose(learned_W2, batch_W2 + dW2)
+
+    def test_batch_function_matches_sum_of_function(self):
+        activation_input = np.array([[0.1, 0.5, 0.9], [1.0, 0.0, 0.2]])
+        activation_output = np.array([[0.2, 0.7], [0.6, 0.4]])
+        error_signal = np.array([[0.3, -0.1, 0.5], [-0.2, 0.4, 0.1]])
+        error_matrix = np.array([[0.5, -0.5, 0.25], [1.0, 0.0, -1.0]])
+        B = BackPropagation(default_variable=[[0, 0, 0], [0, 0], [0, 0, 0]], learning_rate=0.5)
+
+        weight_change, error = B.batch_function(activation_input, activation_output, error_signal, error_matrix)
+
+        trial_results = [B.function([activation_input[i], activation_output[i], error_signal[i]],
+                                    error_matrix=error_matrix)
+                         for i in range(2)]
+        np.testing.assert_allclose(weight_change, trial_results[0][0] + trial_results[1][0])
+        np.testing.assert_allclose(error, [trial_results[0][1], trial_results[1][1]])
+
+    @pytest.mark.parametrize('learning_batch_size', [0, 2.5])
+    def test_invalid_learning_batch_size(self, learning_batch_size):
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        with pytest.raises(SystemError) as error_text:
+            s.run(inputs={I: [[0.1, 0.5, 0.9]]}, targets={O: [[1.0, 0.0]]}, learning_batch_size=learning_batch_size)
+        assert "must be an integer greater than 0" in str(error_text.value)
+
+    @pytest.mark.benchmark(group="Minibatch learning")
+    @pytest.mark.parametrize('learning_batch_size', [None, 10])
+    def test_minibatch_learning_benchmark(self, benchmark, learning_batch_size):
+        I = TransferMechanism(size=3)
+        H = TransferMechanism(size=4, function=Logistic)
+        O = TransferMechanism(size=2, function=Logistic)
+        p = Process(pathway=[I, W1, H, W2, O], learning=LEARNING)
+        s = System(processes=[p])
+        X = np.random.rand(10, 3)
+        T = np.random.rand(10, 2)
+        benchmark(s.run, inputs={I: X}, targets={O: T}, learning_batch_size=learning_batch_size)
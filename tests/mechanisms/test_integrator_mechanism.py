@@ -1263,3 +1263,91 @@ class TestAGTUtilityIntegrator:
     #     #                                              1.6793901854329185, 1.7583410650743645, 1.7981128658110572,
     #     #                                              1.7817328532815251])
     #     #
+
+
+class TestAdaptiveStepIntegration:
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_FHN_RK45_single_execution_matches_fixed_steps(self):
+        I = IntegratorMechanism(function=FHNIntegrator(integration_method="RK45",
+                                                       time_step_size=10.0,
+                                                       tolerance=1e-8))
+        I.execute(1.0)
+
+        # reference: classical fourth order Runge-Kutta with fixed steps, using the default FHN parameters
+        def derivative(value):
+            v, w = value
+            return np.array([-v**3 / 3 + v - w + 1.0, (v + 0.7 - 0.8 * w) / 12.5])
+
+        value = np.zeros(2)
+        dt = 0.001
+        for i in range(10000):
+            k1 = derivative(value)
+            k2 = derivative(value + dt / 2 * k1)
+            k3 = derivative(value + dt / 2 * k2)
+            k4 = derivative(value + dt * k3)
+            value = value + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        assert np.allclose(I.value[0], value[0], atol=1e-6)
+        assert np.allclose(I.value[1], value[1], atol=1e-6)
+        assert np.allclose(I.value[2], 10.0)
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_FHN_RK45_independent_of_time_step_size(self):
+        single = FHNIntegrator(integration_method="RK45", time_step_size=5.0, tolerance=1e-9)
+        repeated = FHNIntegrator(integration_method="RK45", time_step_size=0.5, tolerance=1e-9)
+        single.function(0.5)
+        for i in range(10):
+            repeated.function(0.5)
+
+        assert np.allclose(single.previous_v, repeated.previous_v, atol=1e-6)
+        assert np.allclose(single.previous_w, repeated.previous_w, atol=1e-6)
+        assert np.allclose(single.previous_time, repeated.previous_time)
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_FHN_invalid_tolerance(self):
+        with pytest.raises(FunctionError) as error_text:
+            FHNIntegrator(integration_method="RK45", tolerance=0.0)
+        assert "tolerance parameter" in str(error_text.value)
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_OU_RK45_matches_analytic_solution(self):
+        I = IntegratorMechanism(function=OrnsteinUhlenbeckIntegrator(integration_method="RK45",
+                                                                     initializer=1.0,
+                                                                     rate=1.0,
+                                                                     decay=-0.5,
+                                                                     time_step_size=4.0,
+                                                                     tolerance=1e-9))
+        val = I.execute(2.0)
+
+        # x(t) = rate*variable/decay + (x0 - rate*variable/decay) * exp(decay*t)
+        assert np.allclose(val, -4.0 + 5.0 * np.exp(-2.0))
+        assert np.allclose(I.function_object.previous_time, 4.0)
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_OU_RK45_noise_has_exact_variance(self):
+        O = OrnsteinUhlenbeckIntegrator(integration_method="RK45",
+                                        initializer=1.0,
+                                        rate=1.0,
+                                        decay=-0.5,
+                                        noise=0.3,
+                                        time_step_size=4.0,
+                                        tolerance=1e-9)
+        O.random_state = np.random.RandomState(0)
+        val = O.function(2.0)
+
+        # the variance of the noise accumulated over t is noise * (1 - exp(2*decay*t)) / (-2*decay)
+        sample = np.random.RandomState(0).normal()
+        assert np.allclose(val, -4.0 + 5.0 * np.exp(-2.0) + np.sqrt(0.3 * (1 - np.exp(-4.0))) * sample)
+
+    @pytest.mark.mechanism
+    @pytest.mark.integrator_mechanism
+    def test_OU_invalid_integration_method(self):
+        with pytest.raises(FunctionError) as error_text:
+            OrnsteinUhlenbeckIntegrator(integration_method="RK4")
+        assert "Invalid integration method" in str(error_text.value)
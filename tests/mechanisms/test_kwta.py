@@ -534,4 +534,45 @@ class TestKWTAAverageBased:
 #                  clip=[-2.0, 2.0],
 #                  integrator_mode=False)
 #         assert np.allclose(K.execute([[-5.0, -1.0, 5.0], [5.0, -5.0, 1.0], [1.0, 5.0, 5.0]]),
-#                            [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
\ No newline at end of file
+#                            [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
+
+class TestKWTABatch:
+
+    @staticmethod
+    def _sorted_scale(input, k, threshold, ratio, average_based, inhibition_only):
+        sorted_diffs = sorted(threshold - np.asarray(input))
+        if average_based:
+            final_diff = np.mean(sorted_diffs[k:]) * ratio + np.mean(sorted_diffs[:k]) * (1 - ratio)
+        else:
+            final_diff = sorted_diffs[k] * ratio + sorted_diffs[k - 1] * (1 - ratio)
+        if inhibition_only and final_diff > 0:
+            final_diff = 0
+        return np.asarray(input) + final_diff
+
+    @pytest.mark.parametrize('average_based', [False, True])
+    @pytest.mark.parametrize('inhibition_only', [False, True])
+    def test_kwta_scale_batch_matches_sorting(self, average_based, inhibition_only):
+        K = KWTA(size=200, k_value=37, threshold=0.2, ratio=0.3,
+                 average_based=average_based, inhibition_only=inhibition_only)
+        inputs = np.random.RandomState(0).normal(size=(5, 200))
+
+        scaled = K.kwta_scale_batch(inputs)
+
+        expected = [self._sorted_scale(row, 37, 0.2, 0.3, average_based, inhibition_only) for row in inputs]
+        assert np.allclose(scaled, expected)
+        assert np.allclose(scaled[2], K._kwta_scale(inputs[2:3])[0])
+
+    def test_kwta_k_value_change_recomputes_k(self):
+        K = KWTA(size=4, k_value=1, threshold=0, function=Linear, inhibition_only=False, auto=0, hetero=0)
+        assert np.allclose(K.execute([1, 2, 3, 4]), [[-2.5, -1.5, -0.5, 0.5]])
+
+        K.k_value = 3
+        # the ParameterState for k_value is updated on the next execution
+        K.execute([1, 2, 3, 4])
+        assert np.allclose(K.kwta_scale_batch([[1, 2, 3, 4]]), [[-0.5, 0.5, 1.5, 2.5]])
+
+    def test_kwta_scale_batch_k_too_large(self):
+        K = KWTA(size=4, k_value=3)
+        with pytest.raises(KWTAError) as error_text:
+            K.kwta_scale_batch([[1, 2]])
+        assert "is greater than the length of the inputs" in str(error_text.value)
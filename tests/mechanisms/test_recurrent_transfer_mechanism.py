@@ -1,16 +1,19 @@
 import numpy as np
 import pytest
 
-from psyneulink.components.functions.function import ConstantIntegrator, Exponential, ExponentialDist, FunctionError, Linear, Logistic, NormalDist, Reduce, Reinforcement, get_matrix
+from psyneulink.components.functions.function import ConstantIntegrator, Exponential, ExponentialDist, FunctionError, Hebbian, Linear, LinearCombination, Logistic, NormalDist, Reduce, Reinforcement, get_matrix
 from psyneulink.components.mechanisms.mechanism import MechanismError
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferError, TransferMechanism
 from psyneulink.components.process import Process
 from psyneulink.components.system import System
-from psyneulink.globals.keywords import MATRIX_KEYWORD_VALUES, RANDOM_CONNECTIVITY_MATRIX
+from psyneulink.globals.keywords import FUNCTION, MATRIX_KEYWORD_VALUES, NAME, PRODUCT, RANDOM_CONNECTIVITY_MATRIX, SUM
 from psyneulink.globals.preferences.componentpreferenceset import REPORT_OUTPUT_PREF, VERBOSE_PREF
 from psyneulink.globals.utilities import UtilitiesError
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferError, RecurrentTransferMechanism
 from psyneulink.library.projections.pathway.autoassociativeprojection import AutoAssociativeProjection
+from psyneulink.scheduling.condition import AfterNCalls, Always, AtPass
+from psyneulink.scheduling.scheduler import Scheduler
+from psyneulink.scheduling.time import TimeScale
 
 
 class TestMatrixSpec:
@@ -956,4 +959,163 @@ class TestClip:
         R = RecurrentTransferMechanism(default_variable=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
                               clip=[-2.0, 2.0])
         assert np.allclose(R.execute([[-5.0, -1.0, 5.0], [5.0, -5.0, 1.0], [1.0, 5.0, 5.0]]),
-                           [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
\ No newline at end of file
+                           [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
+
+
+class TestRecurrentTransferMechanismSettling:
+
+    @pytest.mark.parametrize('operation', [SUM, PRODUCT])
+    def test_settle_matches_passes(self, operation):
+        T1 = TransferMechanism(size=3)
+        R1 = RecurrentTransferMechanism(size=3,
+                                        function=Logistic,
+                                        integrator_mode=True,
+                                        smoothing_factor=0.2,
+                                        auto=0.0,
+                                        hetero=-0.5,
+                                        input_states=[{NAME: 'input', FUNCTION: LinearCombination(operation=operation)}])
+        p1 = Process(pathway=[T1, R1])
+        s1 = System(processes=[p1])
+        sched1 = Scheduler(system=s1)
+        sched1.add_condition(T1, AtPass(0))
+        sched1.add_condition(R1, Always())
+        s1.scheduler_processing = sched1
+        s1.run(inputs={T1: [[1.0, 2.0, 3.0]]}, termination_processing={TimeScale.TRIAL: AfterNCalls(R1, 30)})
+
+        T2 = TransferMechanism(size=3)
+        R2 = RecurrentTransferMechanism(size=3,
+                                        function=Logistic,
+                                        integrator_mode=True,
+                                        smoothing_factor=0.2,
+                                        auto=0.0,
+                                        hetero=-0.5,
+                                        input_states=[{NAME: 'input', FUNCTION: LinearCombination(operation=operation)}])
+        R2.configure_settling(max_steps=30, convergence_criterion=None)
+        p2 = Process(pathway=[T2, R2])
+        s2 = System(processes=[p2])
+        sched2 = Scheduler(system=s2)
+        sched2.add_condition(T2, AtPass(0))
+        sched2.add_condition(R2, Always())
+        s2.scheduler_processing = sched2
+        s2.run(inputs={T2: [[1.0, 2.0, 3.0]]}, termination_processing={TimeScale.TRIAL: AfterNCalls(R2, 30)})
+
+        assert np.allclose(R1.value, R2.value)
+        assert np.allclose(R1.input_state.value, R2.input_state.value)
+        assert np.allclose(R1.recurrent_projection.value, R2.recurrent_projection.value)
+        assert R2.num_settle_steps == 30
+        # the Scheduler counts the steps as executions of R2, so the trial ends after the first pass
+        assert len(sched1.execution_list[sched1.default_execution_id]) == 31
+        assert len(sched2.execution_list[sched2.default_execution_id]) == 2
+
+    def test_settle_convergence_criterion(self):
+        T = TransferMechanism(size=3)
+        R = RecurrentTransferMechanism(size=3,
+                                       function=Logistic,
+                                       integrator_mode=True,
+                                       smoothing_factor=0.2,
+                                       auto=0.0,
+                                       hetero=-0.5)
+        R.configure_settling(max_steps=1000, convergence_criterion=1e-6)
+        p = Process(pathway=[T, R])
+        s = System(processes=[p])
+        s.run(inputs={T: [[1.0, 2.0, 3.0]]})
+        settled = R.value.copy()
+
+        assert 1 < R.num_settle_steps < 1000
+        # at convergence, a further step leaves the result (nearly) unchanged
+        s.run(inputs={T: [[1.0, 2.0, 3.0]]})
+        assert np.allclose(R.value, settled, atol=1e-5)
+        assert R.num_settle_steps <= 2
+
+    def test_settle_threshold(self):
+        R = RecurrentTransferMechanism(size=2, integrator_mode=True, smoothing_factor=0.1, auto=0.0, hetero=0.0)
+        R.configure_settling(max_steps=100, convergence_criterion=None, threshold=0.5)
+        R.execute([1.0, 1.0])
+
+        # with constant input 1, value after n steps is 1 - 0.9**n, first reaching 0.5 at n = 7
+        assert R.num_settle_steps == 7
+        assert np.allclose(R.value, 1 - 0.9 ** 7)
+
+    def test_settle_threshold_absolute_value(self):
+        R = RecurrentTransferMechanism(size=2, integrator_mode=True, smoothing_factor=0.1, auto=0.0, hetero=0.0)
+        R.configure_settling(max_steps=100, convergence_criterion=None, threshold=0.5)
+        R.execute([-1.0, -1.0])
+
+        assert R.num_settle_steps == 7
+        assert np.allclose(R.value, -(1 - 0.9 ** 7))
+
+    def test_configure_settling_invalid_max_steps(self):
+        R = RecurrentTransferMechanism(size=2)
+        with pytest.raises(TransferError) as error_text:
+            R.configure_settling(max_steps=0)
+        assert "must be an integer greater than 0" in str(error_text.value)
+
+
+class TestHebbianLearning:
+
+    @staticmethod
+    def _reference_hebbian(variable, learning_rate):
+        # weight change matrix as computed using a column vector and an identity mask
+        variable = np.array(variable, dtype=float)
+        if np.ndim(learning_rate) == 1:
+            variable = variable * learning_rate
+        col = np.array(np.matrix(variable).T)
+        weight_change_matrix = variable * col * (1 - np.identity(len(variable)))
+        if np.ndim(learning_rate) in {0, 2}:
+            weight_change_matrix = weight_change_matrix * learning_rate
+        return weight_change_matrix
+
+    @pytest.mark.parametrize('learning_rate', [0.5, [0.1, 0.2, 0.3, 0.4], np.full((4, 4), 0.25)],
+                             ids=['scalar', '1d', '2d'])
+    def test_hebbian_matches_reference(self, learning_rate):
+        variable = [1.0, 2.0, -1.0, 0.5]
+        H = Hebbian(default_variable=[0.0] * 4, learning_rate=learning_rate)
+        np.testing.assert_allclose(H.function(variable), self._reference_hebbian(variable, learning_rate))
+
+    def test_hebbian_integer_variable(self):
+        H = Hebbian(default_variable=[0, 0, 0], learning_rate=0.5)
+        np.testing.assert_allclose(H.function([1, 2, 3]), self._reference_hebbian([1, 2, 3], 0.5))
+
+    def test_hebbian_returns_new_matrix_on_each_call(self):
+        H = Hebbian(default_variable=[0.0] * 3, learning_rate=0.5)
+        first = H.function([1.0, 2.0, 3.0])
+        second = H.function([-1.0, 0.0, 1.0])
+        assert first is not second
+        np.testing.assert_allclose(first, self._reference_hebbian([1.0, 2.0, 3.0], 0.5))
+        np.testing.assert_allclose(second, self._reference_hebbian([-1.0, 0.0, 1.0], 0.5))
+
+    def test_learning_updates_matrix_in_place(self):
+        matrix = np.full((3, 3), 0.1)
+        R = RecurrentTransferMechanism(size=3, function=Linear, matrix=matrix, enable_learning=True)
+        p = Process(pathway=[R])
+        p.execute([1, 1, 0])
+        p.execute([1, 1, 0])
+        learned = R.recurrent_projection.mod_matrix
+        learned_copy = learned.copy()
+        p.execute([1, 1, 0])
+
+        assert R.recurrent_projection.mod_matrix is learned
+        assert not np.allclose(learned, learned_copy)
+        # the matrix used to specify the Mechanism is not modified
+        np.testing.assert_allclose(matrix, np.full((3, 3), 0.1))
+
+    def test_matrix_unchanged_when_learning_disabled(self):
+        R = RecurrentTransferMechanism(size=3, function=Linear, matrix=np.full((3, 3), 0.1), enable_learning=True)
+        p = Process(pathway=[R])
+        R.learning_enabled = False
+        p.execute([1, 1, 0])
+        p.execute([1, 1, 0])
+        np.testing.assert_allclose(R.recurrent_projection.mod_matrix, np.full((3, 3), 0.1))
+
+        R.learning_enabled = True
+        p.execute([1, 1, 0])
+        assert not np.allclose(R.recurrent_projection.mod_matrix, np.full((3, 3), 0.1))
+
+    @pytest.mark.benchmark(group="RecurrentTransferMechanism learning")
+    def test_recurrent_mech_learning_benchmark(self, benchmark):
+        size = 1000
+        R = RecurrentTransferMechanism(size=size, function=Logistic, enable_learning=True)
+        p = Process(pathway=[R])
+        s = System(processes=[p])
+        inputs = {R: [np.random.rand(size)]}
+        benchmark(s.run, inputs=inputs, num_trials=2)
@@ -165,6 +165,56 @@ class TestTransferMechanismNoise:
         for i in range(len(val[0])):
             assert val[0][i] ==  expected[i]
 
+    @pytest.mark.mechanism
+    @pytest.mark.transfer_mechanism
+    def test_transfer_mech_array_var_mixed_callable_noise(self):
+
+        dist = NormalDist()
+        T = TransferMechanism(
+            name='T',
+            default_variable=[0, 0, 0, 0],
+            function=Linear(),
+            noise=[dist, lambda: 10.0, dist, 1.0],
+            smoothing_factor=1.0,
+            integrator_mode=True
+        )
+        val = T.execute([0, 0, 0, 0])
+        # the samples from dist are drawn in element order
+        assert np.allclose(np.array(val, dtype=float), [[-0.977277879876411, 10.0, 0.9500884175255894, 1.0]])
+
+    @pytest.mark.mechanism
+    @pytest.mark.transfer_mechanism
+    def test_transfer_mech_array_var_interleaved_distribution_noise(self):
+        N = NormalDist()
+        U = UniformDist()
+        T = TransferMechanism(
+            name='T',
+            default_variable=[0, 0, 0, 0, 0, 0],
+            function=Linear(),
+            noise=[U, N, U, N, N, U],
+            smoothing_factor=1.0,
+            integrator_mode=True
+        )
+        np.random.seed(0)
+        expected = [U.function(), N.function(), U.function(), N.function(), N.function(), U.function()]
+        np.random.seed(0)
+        val = T.execute([0, 0, 0, 0, 0, 0])
+        # consecutive elements with the same distribution are drawn in one call, but all in element order
+        assert np.allclose(np.array(val, dtype=float), [expected])
+
+    @pytest.mark.mechanism
+    @pytest.mark.transfer_mechanism
+    @pytest.mark.parametrize("dist", [NormalDist, UniformDist, ExponentialDist, GammaDist, WaldDist],
+                             ids=lambda x: x.__name__)
+    def test_distribution_function_size(self, dist):
+        D = dist()
+        np.random.seed(0)
+        sequential = [D.function() for i in range(6)]
+        np.random.seed(0)
+        batch = D.function(size=(2, 3))
+        assert batch.shape == (2, 3)
+        assert np.allclose(batch.flatten(), sequential)
+
     @pytest.mark.mechanism
     @pytest.mark.transfer_mechanism
     @pytest.mark.benchmark(group="TransferMechanism Linear noise2")
@@ -1262,3 +1312,48 @@ class TestClip:
         assert np.allclose(T.execute([[-5.0, -1.0, 5.0], [5.0, -5.0, 1.0], [1.0, 5.0, 5.0]]),
                            [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
 
+
+
+class TestSteadyStateExecute:
+
+    def test_steady_state_execute_built_by_system(self):
+        A = TransferMechanism(name='A', default_variable=[0, 0], function=Logistic(),
+                              integrator_mode=True, smoothing_factor=0.5)
+        B = TransferMechanism(name='B', default_variable=[0, 0], function=Linear(slope=2.0))
+        S = System(processes=[Process(pathway=[A, B])])
+        assert A._steady_state_execute is not None
+        assert B._steady_state_execute is not None
+
+        C = TransferMechanism()
+        assert C._steady_state_execute is None
+
+    def test_steady_state_execute_matches_full_execute(self):
+        A = TransferMechanism(name='A', default_variable=[0, 0], function=Logistic(),
+                              integrator_mode=True, smoothing_factor=0.5)
+        B = TransferMechanism(name='B', default_variable=[0, 0], function=Linear(slope=2.0))
+        S = System(processes=[Process(pathway=[A, B])])
+        A_full = TransferMechanism(name='A', default_variable=[0, 0], function=Logistic(),
+                                   integrator_mode=True, smoothing_factor=0.5)
+        B_full = TransferMechanism(name='B', default_variable=[0, 0], function=Linear(slope=2.0))
+        S_full = System(processes=[Process(pathway=[A_full, B_full])])
+        A_full._steady_state_execute = None
+        B_full._steady_state_execute = None
+
+        inputs = [[1.0, 2.0], [0.5, -1.0], [3.0, 0.0]]
+        results = S.run(inputs={A: inputs})
+        results_full = S_full.run(inputs={A_full: inputs})
+
+        assert np.allclose(results, results_full)
+        assert np.allclose(A.value, A_full.value)
+        assert np.allclose(B.output_state.value, B_full.output_state.value)
+        assert B.execution_count == B_full.execution_count
+
+    @pytest.mark.benchmark(group="TransferMechanism")
+    def test_steady_state_execute_in_system(self, benchmark):
+        # smoothing_factor=1.0 so that the result does not depend on the number of benchmark rounds
+        A = TransferMechanism(name='A', default_variable=[0, 0], function=Logistic(),
+                              integrator_mode=True, smoothing_factor=1.0)
+        B = TransferMechanism(name='B', default_variable=[0, 0], function=Linear(slope=2.0))
+        S = System(processes=[Process(pathway=[A, B])])
+        val = benchmark(S.run, inputs={A: [[1.0, 2.0]]})
+        assert np.allclose(val[-1], [[1.46211716, 1.76159416]])
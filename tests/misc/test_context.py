@@ -0,0 +1,234 @@
+import threading
+
+import numpy as np
+import pytest
+
+from psyneulink.components.functions.function import AGTUtilityIntegrator, AdaptiveIntegrator, \
+    DriftDiffusionIntegrator, FHNIntegrator, Linear, OrnsteinUhlenbeckIntegrator
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.system import System
+from psyneulink.globals.context import Context, ContextFlags, _ExecutionAttribute, delete_execution, execution_context
+
+
+class TestExecutionContext:
+
+    def test_changes_are_discarded(self):
+        T = TransferMechanism()
+        T.context.execution_phase = ContextFlags.PROCESSING
+        T.context.string = 'outside'
+
+        with execution_context():
+            assert T.context.execution_phase == ContextFlags.PROCESSING
+            assert T.context.string == 'outside'
+            T.context.execution_phase = ContextFlags.CONTROL
+            T.context.source = ContextFlags.COMMAND_LINE
+            T.context.execution_id = 3
+            T.context.string = 'inside'
+            assert T.context.execution_phase == ContextFlags.CONTROL
+            assert T.context.flags & ContextFlags.COMMAND_LINE
+            assert T.context.execution_id == 3
+            assert T.context.string == 'inside'
+
+        assert T.context.execution_phase == ContextFlags.PROCESSING
+        assert not T.context.flags & ContextFlags.COMMAND_LINE
+        assert T.context.execution_id is None
+        assert T.context.string == 'outside'
+
+    def test_initialization_status_is_shared(self):
+        T = TransferMechanism()
+        with execution_context():
+            T.context.execution_phase = ContextFlags.CONTROL
+            T.context.initialization_status = ContextFlags.REINITIALIZED
+            assert T.context.initialization_status == ContextFlags.REINITIALIZED
+        assert T.context.initialization_status == ContextFlags.REINITIALIZED
+        assert T.context.execution_phase != ContextFlags.CONTROL
+
+    def test_nested_blocks(self):
+        T = TransferMechanism()
+        with execution_context():
+            T.context.execution_phase = ContextFlags.LEARNING
+            with execution_context():
+                assert T.context.execution_phase == ContextFlags.LEARNING
+                T.context.execution_phase = ContextFlags.CONTROL
+            assert T.context.execution_phase == ContextFlags.LEARNING
+
+    def test_context_created_in_block(self):
+        with execution_context():
+            context = Context(execution_phase=ContextFlags.CONTROL, string='created')
+        assert context.execution_phase == ContextFlags.CONTROL
+        assert context.string == 'created'
+
+    def test_threads_have_private_execution_state(self):
+        T = TransferMechanism()
+        phases = [ContextFlags.PROCESSING, ContextFlags.LEARNING, ContextFlags.CONTROL, ContextFlags.SIMULATION]
+        barrier = threading.Barrier(len(phases))
+        results = {}
+
+        def execute(phase):
+            with execution_context():
+                T.context.execution_phase = phase
+                barrier.wait()
+                results[phase] = T.context.execution_phase
+
+        threads = [threading.Thread(target=execute, args=(phase,)) for phase in phases]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {phase: phase for phase in phases}
+        assert T.context.execution_phase == ContextFlags.IDLE & ContextFlags.EXECUTION_PHASE_MASK
+
+    def test_system_run_in_block(self):
+        results = []
+        for in_block in (False, True):
+            T1 = TransferMechanism(function=Linear(slope=2.0))
+            T2 = TransferMechanism()
+            s = System(processes=[Process(pathway=[T1, T2])])
+            flags = T2.context.flags
+            if in_block:
+                with execution_context():
+                    results.append(s.run(inputs={T1: [1.0, 2.0]}))
+                assert T2.context.flags == flags
+                assert T2.context.composition is None
+            else:
+                results.append(s.run(inputs={T1: [1.0, 2.0]}))
+        np.testing.assert_allclose(results[1], results[0])
+
+    @pytest.mark.benchmark(group="Context")
+    @pytest.mark.parametrize('in_block', [False, True])
+    def test_context_flags_benchmark(self, benchmark, in_block):
+        T = TransferMechanism()
+
+        def update_context():
+            T.context.execution_phase = ContextFlags.PROCESSING
+            T.context.execution_phase = ContextFlags.IDLE
+            return T.context.flags
+
+        if in_block:
+            with execution_context():
+                benchmark(update_context)
+        else:
+            benchmark(update_context)
+
+
+class TestExecutionValues:
+
+    def test_interleaved_executions(self):
+        inputs = {'a': [1.0, 2.0, 3.0], 'b': [10.0, -5.0, 0.5]}
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+
+        for trial in range(3):
+            for execution_id, execution_inputs in inputs.items():
+                with execution_context(execution_id=execution_id):
+                    s.run(inputs={T1: [execution_inputs[trial]]})
+
+        for execution_id, execution_inputs in inputs.items():
+            # Each sequence of inputs run by its own System, outside of any execution
+            T1_separate = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+            T2_separate = TransferMechanism(function=Linear(slope=2.0))
+            s_separate = System(processes=[Process(pathway=[T1_separate, T2_separate])])
+            s_separate.run(inputs={T1_separate: execution_inputs})
+            expected = T2_separate.value
+            with execution_context(execution_id=execution_id):
+                np.testing.assert_allclose(T2.value, expected)
+        # The values shared outside of any execution have not been assigned
+        assert T2.value is None
+        for execution_id in inputs:
+            delete_execution(execution_id)
+
+    def test_execution_forks_shared_values(self):
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+        s.run(inputs={T1: [4.0]})
+
+        with execution_context(execution_id='fork'):
+            np.testing.assert_allclose(T1.value, [[2.0]])
+            s.run(inputs={T1: [4.0]})
+            np.testing.assert_allclose(T1.value, [[3.0]])
+
+        np.testing.assert_allclose(T1.value, [[2.0]])
+        s.run(inputs={T1: [0.0]})
+        np.testing.assert_allclose(T1.value, [[1.0]])
+        with execution_context(execution_id='fork'):
+            np.testing.assert_allclose(T1.value, [[3.0]])
+        delete_execution('fork')
+
+    def test_stateful_attributes(self):
+        f = AdaptiveIntegrator(rate=0.5)
+        f.execute(1.0)
+        with execution_context(execution_id=1):
+            f.execute(3.0)
+            assert f.previous_value == 1.75
+        assert f.previous_value == 0.5
+        with execution_context(execution_id=1):
+            assert f.previous_value == 1.75
+        delete_execution(1)
+
+    @pytest.mark.parametrize('function_type', [AdaptiveIntegrator, DriftDiffusionIntegrator,
+                                               OrnsteinUhlenbeckIntegrator, FHNIntegrator, AGTUtilityIntegrator])
+    def test_stateful_attributes_stored_per_execution(self, function_type):
+        for name in function_type.stateful_attributes:
+            assert isinstance(getattr(function_type, name), _ExecutionAttribute)
+
+    def test_delete_execution(self):
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+        with execution_context(execution_id='deleted'):
+            s.run(inputs={T1: [1.0]})
+        delete_execution('deleted')
+        with execution_context(execution_id='deleted'):
+            assert T1.value is None
+
+    def test_nested_block_uses_outer_execution(self):
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+        with execution_context(execution_id='outer'):
+            with execution_context():
+                s.run(inputs={T1: [2.0]})
+            np.testing.assert_allclose(T2.value, [[2.0]])
+        assert T2.value is None
+        delete_execution('outer')
+
+    def test_concurrent_executions(self):
+        inputs = {execution_id: [float(execution_id)] * 10 + [execution_id / 2] * 10 for execution_id in range(6)}
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+
+        def run(execution_id):
+            with execution_context(execution_id=execution_id):
+                s.run(inputs={T1: inputs[execution_id]})
+
+        threads = [threading.Thread(target=run, args=(execution_id,)) for execution_id in inputs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for execution_id, execution_inputs in inputs.items():
+            # Each sequence of inputs run by its own System, outside of any execution
+            T1_separate = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+            T2_separate = TransferMechanism(function=Linear(slope=2.0))
+            s_separate = System(processes=[Process(pathway=[T1_separate, T2_separate])])
+            s_separate.run(inputs={T1_separate: execution_inputs})
+            expected = T2_separate.value
+            with execution_context(execution_id=execution_id):
+                np.testing.assert_allclose(T2.value, expected)
+            delete_execution(execution_id)
+
+    @pytest.mark.benchmark(group="Execution values")
+    @pytest.mark.parametrize('execution_id', [None, 'benchmark'])
+    def test_execution_values_benchmark(self, benchmark, execution_id):
+        T1 = TransferMechanism(integrator_mode=True, smoothing_factor=0.5)
+        T2 = TransferMechanism(function=Linear(slope=2.0))
+        s = System(processes=[Process(pathway=[T1, T2])])
+        with execution_context(execution_id=execution_id):
+            benchmark(s.run, inputs={T1: [1.0] * 10})
+        delete_execution(execution_id)
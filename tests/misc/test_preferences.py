@@ -0,0 +1,38 @@
+import psyneulink as pnl
+
+from psyneulink.components.mechanisms.mechanism import Mechanism_Base
+from psyneulink.globals.log import LogCondition
+from psyneulink.globals.preferences.preferenceset import PreferenceSet
+
+
+class TestResolvedPreferences:
+
+    def test_class_level_assignment_invalidates_resolved_setting(self):
+        T = pnl.TransferMechanism()
+        # logPref of a Mechanism defaults to the CATEGORY level (Mechanism_Base.classPreferences)
+        assert T.prefs.logPref == Mechanism_Base.classPreferences.logPref
+
+        initial_setting = Mechanism_Base.classPreferences.logPref
+        new_setting = LogCondition.EXECUTION if initial_setting != LogCondition.EXECUTION else LogCondition.OFF
+        try:
+            Mechanism_Base.classPreferences.logPref = new_setting
+            assert T.prefs.logPref == new_setting
+        finally:
+            Mechanism_Base.classPreferences.logPref = initial_setting
+        assert T.prefs.logPref == initial_setting
+
+    def test_instance_assignment_invalidates_resolved_setting(self):
+        T = pnl.TransferMechanism()
+        assert T.prefs.verbosePref is False
+        T.prefs.verbosePref = pnl.PreferenceEntry(True, pnl.PreferenceLevel.INSTANCE)
+        assert T.prefs.verbosePref is True
+
+    def test_execution_does_not_invalidate_resolved_settings(self):
+        T1 = pnl.TransferMechanism()
+        T2 = pnl.TransferMechanism()
+        S = pnl.System(processes=[pnl.Process(pathway=[T1, T2])])
+        S.run(inputs={T1: [[1.0]]})
+
+        generation = PreferenceSet._generation
+        S.run(inputs={T1: [[1.0], [2.0]]})
+        assert PreferenceSet._generation == generation
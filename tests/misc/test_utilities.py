@@ -1,8 +1,12 @@
 import collections
 import numpy as np
 import pytest
+import uuid
 
-from psyneulink.globals.utilities import convert_all_elements_to_np_array
+import psyneulink.globals.utilities as utilities
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.globals.utilities import ContentAddressableList, UtilitiesError, _get_unique_id, \
+    convert_all_elements_to_np_array, set_execution_id_namespace
 
 
 @pytest.mark.parametrize(
@@ -33,3 +37,132 @@ def test_convert_all_elements_to_np_array(arr, expected):
                 check_equality_recursive(arr[i], expected[i])
 
     check_equality_recursive(converted, expected)
+
+
+class TestExecutionIds:
+
+    def test_unique_increasing_ints(self):
+        ids = [_get_unique_id() for i in range(100)]
+        assert all(isinstance(execution_id, int) for execution_id in ids)
+        assert ids == sorted(set(ids))
+
+    def test_namespace(self):
+        namespace = utilities._execution_id_namespace
+        try:
+            set_execution_id_namespace(0)
+            default_id = _get_unique_id()
+            set_execution_id_namespace(3)
+            worker_id = _get_unique_id()
+        finally:
+            utilities._execution_id_namespace = namespace
+
+        assert worker_id // utilities._EXECUTION_ID_NAMESPACE_SIZE == 3
+        assert default_id // utilities._EXECUTION_ID_NAMESPACE_SIZE == 0
+
+    @pytest.mark.parametrize('namespace', [-1, 1.5, '1', True])
+    def test_invalid_namespace(self, namespace):
+        with pytest.raises(UtilitiesError) as error_text:
+            set_execution_id_namespace(namespace)
+        assert "must be a non-negative integer" in str(error_text.value)
+
+    @pytest.mark.benchmark(group="Execution ids")
+    @pytest.mark.parametrize('get_id', [_get_unique_id, uuid.uuid4], ids=['int', 'uuid4'])
+    def test_execution_id_benchmark(self, benchmark, get_id):
+        benchmark(get_id)
+
+
+class TestContentAddressableList:
+
+    # Mechanism names are made unique by the registry, so items are looked up by the names they were assigned
+    def _make_list(self, num_items):
+        return ContentAddressableList(component_type=TransferMechanism,
+                                      list=[TransferMechanism() for i in range(num_items)])
+
+    def test_get_by_name(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        assert cal[B.name] is B
+        assert C.name in cal
+        assert 'nonexistent' not in cal
+        with pytest.raises(TypeError):
+            cal['nonexistent']
+
+    def test_get_by_name_after_append_and_delete(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        D = TransferMechanism()
+        assert D.name not in cal
+
+        cal.append(D)
+        assert cal[D.name] is D
+
+        del cal[A.name]
+        assert A.name not in cal
+        assert cal[D.name] is D
+        assert cal[B.name] is cal[0]
+
+    def test_get_by_name_after_assignment(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        E = TransferMechanism()
+        assert E.name not in cal
+
+        cal[1] = E
+        assert B.name not in cal
+        assert cal[E.name] is E
+
+        cal[B.name] = B
+        assert cal[B.name] is B
+        assert cal.names == [A.name, E.name, C.name, B.name]
+
+    @pytest.mark.parametrize('reorder', [
+        lambda cal: cal.reverse(),
+        lambda cal: cal.sort(key=lambda item: item.name, reverse=True),
+        lambda cal: cal.insert(0, cal.pop()),
+    ])
+    def test_get_by_name_after_reordering(self, reorder):
+        cal = self._make_list(3)
+        A, B, C = cal
+        assert cal[A.name] is A
+
+        reorder(cal)
+
+        for item in (A, B, C):
+            assert cal[item.name] is item
+
+    def test_index_not_rebuilt_for_other_lists(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        other = ContentAddressableList(component_type=TransferMechanism)
+        D = TransferMechanism()
+        cal[A.name]
+        name_index = cal._name_index
+
+        other.append(D)
+        ContentAddressableList(component_type=TransferMechanism, list=[D])
+
+        assert cal[B.name] is B
+        assert cal._name_index is name_index
+
+    def test_get_by_name_after_rename(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        old_name = B.name
+
+        B.name = old_name + ' renamed'
+        assert old_name not in cal
+        assert cal[old_name + ' renamed'] is B
+
+    def test_duplicate_names_return_first(self):
+        cal = self._make_list(3)
+        A, B, C = cal
+        C.name = A.name
+        assert cal[A.name] is A
+
+        del cal[0]
+        assert cal[C.name] is C
+
+    @pytest.mark.benchmark(group="ContentAddressableList")
+    def test_get_by_name_benchmark(self, benchmark):
+        cal = self._make_list(24)
+        benchmark(cal.__getitem__, cal[-1].name)
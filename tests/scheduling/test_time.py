@@ -1,7 +1,9 @@
+import random
+
 import psyneulink as pnl
 import pytest
 
-from psyneulink.scheduling.time import Time, TimeHistoryTree, TimeScale
+from psyneulink.scheduling.time import Clock, Time, TimeHistory, TimeHistoryTree, TimeScale, TimeScaleError
 
 
 class TestTime:
@@ -31,6 +33,21 @@ class TestTime:
         s.run(inputs={t1: [[4.0], [5.0], [6.0]]})
         assert s.scheduler_processing.clock.time == Time(run=2, trial=0, pass_=0, time_step=0)
 
+    def test_current_execution_time(self):
+        t1 = pnl.TransferMechanism()
+        t2 = pnl.TransferMechanism()
+
+        p = pnl.Process(pathway=[t1, t2])
+        s = pnl.System(processes=[p])
+
+        s.run(inputs={t1: [[1.0], [2.0], [3.0]]})
+        # time of last execution, rather than current time of the Clock (which has moved on to the next run)
+        assert t1.current_execution_time == (0, 2, 0, 0)
+        assert t2.current_execution_time == (0, 2, 0, 1)
+
+        s.run(inputs={t1: [[4.0]]})
+        assert t2.current_execution_time == (1, 0, 0, 1)
+
 
 class TestTimeHistoryTree:
     def test_defaults(self):
@@ -59,3 +76,115 @@ class TestTimeHistoryTree:
             assert node.time_scale >= max_depth
 
         assert found_max_depth
+
+
+class TestTimeHistory:
+    increments = [TimeScale.TIME_STEP] * 6 + [TimeScale.PASS] * 3 + [TimeScale.TRIAL] * 2 + [TimeScale.RUN]
+
+    base_indices = [
+        None,
+        {TimeScale.RUN: 0},
+        {TimeScale.RUN: 1, TimeScale.TRIAL: 0},
+        {TimeScale.RUN: None, TimeScale.TRIAL: 1},
+        {TimeScale.TRIAL: 0},
+        {TimeScale.RUN: 0, TimeScale.TRIAL: 2, TimeScale.PASS: 1},
+        {TimeScale.PASS: 0},
+    ]
+
+    @pytest.mark.parametrize('max_depth', [TimeScale.RUN, TimeScale.TRIAL, TimeScale.PASS])
+    def test_matches_time_history_tree(self, max_depth):
+        def get_total_times_relative(history, query_time_scale, base_indices):
+            try:
+                if base_indices is not None:
+                    base_indices = dict(base_indices)
+                return history.get_total_times_relative(query_time_scale, base_indices)
+            except TimeScaleError:
+                return TimeScaleError
+
+        rng = random.Random(0)
+        tree = TimeHistoryTree(max_depth=max_depth)
+        history = TimeHistory(max_depth=max_depth)
+
+        for i in range(300):
+            time_scale = rng.choice(self.increments)
+            tree.increment_time(time_scale)
+            history.increment_time(time_scale)
+
+            assert history.current_time == tree.current_time
+            for query_time_scale in [TimeScale.TIME_STEP, TimeScale.PASS, TimeScale.TRIAL, TimeScale.RUN]:
+                for base_indices in self.base_indices:
+                    assert (get_total_times_relative(history, query_time_scale, base_indices)
+                            == get_total_times_relative(tree, query_time_scale, base_indices))
+
+    def test_earlier_units(self):
+        history = TimeHistory()
+        for num_trials, num_passes in [(2, 3), (1, 5)]:
+            for trial in range(num_trials):
+                for p in range(num_passes):
+                    history.increment_time(TimeScale.PASS)
+                history.increment_time(TimeScale.TRIAL)
+            history.increment_time(TimeScale.RUN)
+
+        assert history.get_total_times_relative(TimeScale.PASS, {TimeScale.RUN: 0, TimeScale.TRIAL: 1}) == 3
+        assert history.get_total_times_relative(TimeScale.TRIAL, {TimeScale.RUN: 0}) == 2
+        assert history.get_total_times_relative(TimeScale.PASS, {TimeScale.RUN: 1}) == 5
+        assert history.get_total_times_relative(TimeScale.PASS, {TimeScale.RUN: 2}) == 0
+        assert history.get_total_times_relative(TimeScale.PASS) == 11
+
+    @pytest.mark.parametrize(
+        'query_time_scale, base_indices',
+        [
+            (TimeScale.LIFE, None),
+            (TimeScale.PASS, {TimeScale.RUN: 1}),
+            (TimeScale.PASS, {TimeScale.RUN: 0, TimeScale.TRIAL: 1}),
+            (TimeScale.TIME_STEP, {TimeScale.PASS: 0}),
+        ]
+    )
+    def test_invalid_query(self, query_time_scale, base_indices):
+        history = TimeHistory()
+        history.increment_time(TimeScale.PASS)
+        with pytest.raises(TimeScaleError):
+            history.get_total_times_relative(query_time_scale, base_indices)
+
+    def test_clock_uses_time_history(self):
+        clock = Clock()
+        for i in range(3):
+            clock._increment_time(TimeScale.TIME_STEP)
+            clock._increment_time(TimeScale.TRIAL)
+
+        assert isinstance(clock.history, TimeHistory)
+        assert clock.get_total_times_relative(TimeScale.TIME_STEP, TimeScale.TRIAL, 1) == 1
+        assert clock.get_total_times_relative(TimeScale.TRIAL, TimeScale.RUN) == 3
+        assert clock._get_time_by_index(2) == (0, 1, 0, 0)
+
+    def test_time_by_increment(self):
+        history = TimeHistory(max_depth=TimeScale.PASS)
+        times = [(0, 0, 0, 0)]
+        for time_scale in [
+            TimeScale.TIME_STEP, TimeScale.TIME_STEP, TimeScale.PASS, TimeScale.TIME_STEP, TimeScale.TRIAL,
+            TimeScale.PASS, TimeScale.TRIAL, TimeScale.RUN, TimeScale.TIME_STEP, TimeScale.PASS, TimeScale.RUN
+        ]:
+            history.increment_time(time_scale)
+            t = history.current_time
+            times.append((t.run, t.trial, t.pass_, t.time_step))
+
+        assert [history.get_time_by_increment(i) for i in range(len(times))] == times
+
+        with pytest.raises(TimeScaleError):
+            history.get_time_by_increment(len(times))
+        with pytest.raises(TimeScaleError):
+            TimeHistory().get_time_by_increment(0)
+
+    @pytest.mark.benchmark(group="TimeHistory")
+    @pytest.mark.parametrize('history_type', [TimeHistory, TimeHistoryTree])
+    def test_time_history_benchmark(self, benchmark, history_type):
+        def run_trials():
+            history = history_type()
+            for trial in range(1000):
+                for time_step in range(3):
+                    history.increment_time(TimeScale.TIME_STEP)
+                    history.get_total_times_relative(TimeScale.PASS, {TimeScale.TRIAL: None})
+                history.increment_time(TimeScale.TRIAL)
+            return history
+
+        benchmark(run_trials)
@@ -1,12 +1,15 @@
 import numpy as np
+import pytest
 
-from psyneulink.components.functions.function import BogaczEtAl, Linear, Logistic
+from psyneulink.components.functions.function import BogaczEtAl, Linear, Logistic, NormalDist
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferMechanism
 from psyneulink.components.process import Process
 from psyneulink.components.projections.modulatory.controlprojection import ControlProjection
 from psyneulink.components.system import System
-from psyneulink.globals.keywords import ALLOCATION_SAMPLES
+from psyneulink.globals.keywords import ALLOCATION_SAMPLES, ENABLED
+from psyneulink.globals.environment import ArrayResultsSink, CallbackResultsSink, ChunkedFileResultsSink, \
+    ResultsSink, RunError, StatisticsResultsSink
 from psyneulink.globals.keywords import CYCLE, INITIALIZE_CYCLE, INTERNAL, ORIGIN, TERMINAL
 from psyneulink.library.mechanisms.processing.integrator.ddm import DDM
 from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
@@ -458,6 +461,221 @@ class TestInputSpecsHeterogeneousVariables:
         inputs = {a: [[[1.1], [2.1, 2.1]], [[1.2], [2.2, 2.2]]]}
 
         s.run(inputs)
+
+
+class TestInputSpecsStreaming:
+
+    def test_generator_inputs(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2)
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        inputs = [[float(i), -float(i)] for i in range(5)]
+        results = s.run(inputs={a: (stim for stim in inputs)})
+
+        assert len(results) == 5
+        assert np.allclose(results, [[stim] for stim in inputs])
+
+    def test_generator_inputs_end_before_num_trials(self):
+        a = TransferMechanism(name='a', size=2)
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        results = s.run(inputs={a: iter([[1.0, 2.0], [3.0, 4.0]])}, num_trials=5)
+
+        assert len(results) == 2
+
+    def test_generator_and_list_inputs(self):
+        a = TransferMechanism(name='a')
+        b = TransferMechanism(name='b')
+        p1 = Process(pathway=[a])
+        p2 = Process(pathway=[b])
+        s = System(processes=[p1, p2])
+
+        values = []
+        # the list is cycled until the generator is exhausted
+        s.run(inputs={a: ([float(i)] for i in range(5)), b: [[10.0], [20.0]]},
+              call_after_trial=lambda: values.append([a.value[0][0], b.value[0][0]]))
+
+        assert values == [[0.0, 10.0], [1.0, 20.0], [2.0, 10.0], [3.0, 20.0], [4.0, 10.0]]
+
+    def test_generator_inputs_invalid_shape(self):
+        a = TransferMechanism(name='a', size=2)
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        with pytest.raises(RunError):
+            s.run(inputs={a: iter([[1.0, 2.0], [3.0, 4.0, 5.0]])})
+
+    def test_memmap_inputs(self, tmpdir):
+        a = TransferMechanism(name='a', size=2)
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        inputs = np.arange(12, dtype=float).reshape(6, 1, 2)
+        filename = str(tmpdir.join('inputs.npy'))
+        np.save(filename, inputs)
+        results = s.run(inputs={a: np.load(filename, mmap_mode='r')}, num_trials=8)
+
+        assert len(results) == 8
+        assert np.allclose(results[:6], inputs)
+        assert np.allclose(results[6:], inputs[:2])
+        assert not isinstance(a.input_state.value, np.memmap)
+
+    def test_stream_and_array_targets(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2)
+        p = Process(pathway=[a, b], learning=ENABLED)
+        s = System(processes=[p])
+
+        a_full = TransferMechanism(name='a_full', size=2)
+        b_full = TransferMechanism(name='b_full', size=2)
+        p_full = Process(pathway=[a_full, b_full], learning=ENABLED)
+        s_full = System(processes=[p_full])
+
+        inputs = [[[1.0, 0.5]], [[0.5, 1.0]], [[1.0, 1.0]]]
+        targets = [[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]]
+
+        results = s.run(inputs={a: iter(inputs)}, targets={b: np.array(targets)})
+        results_full = s_full.run(inputs={a_full: inputs}, targets={b_full: targets})
+        assert np.allclose(results, results_full)
+
+        results = s.run(inputs={a: np.array(inputs)}, targets={b: iter(targets)})
+        results_full = s_full.run(inputs={a_full: inputs}, targets={b_full: targets})
+        assert np.allclose(results, results_full)
+
+
+class TestResultsSinks:
+
+    def test_array_sink_matches_default_results(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2, function=Linear(slope=2.0))
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        inputs = [[float(i), 1.0 - i] for i in range(7)]
+        expected = s.run(inputs={a: inputs})
+        sink = ArrayResultsSink()
+        results = s.run(inputs={a: inputs}, results_sink=sink)
+
+        assert isinstance(results, np.ndarray)
+        assert results.shape == (7, 1, 2)
+        assert np.allclose(results, expected[-7:])
+        # results are not also accumulated on the System
+        assert len(s.results) == 7
+
+    def test_array_sink_grows_for_streamed_inputs(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2, function=Linear(slope=2.0))
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        sink = ArrayResultsSink()
+        sink._initial_size = 2
+        inputs = [[float(i), 1.0 - i] for i in range(5)]
+        results = s.run(inputs={a: iter(inputs)}, results_sink=sink)
+
+        assert results.shape == (5, 1, 2)
+        assert np.allclose(results, 2 * np.array(inputs)[:, np.newaxis, :])
+
+    def test_array_sink_shape_mismatch(self):
+        a = TransferMechanism(name='a', size=2)
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        with pytest.raises(RunError) as error_text:
+            s.run(inputs={a: [[1.0, 2.0], [3.0, 4.0]]}, results_sink=ArrayResultsSink(shape=(3,)))
+        assert 'does not match the shape' in str(error_text.value)
+
+    def test_callback_sink(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2, function=Linear(slope=2.0))
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        inputs = [[float(i), 1.0 - i] for i in range(4)]
+        received = []
+        sink = CallbackResultsSink(lambda trial, result: received.append((trial, result.copy())))
+        s.run(inputs={a: inputs}, results_sink=sink)
+
+        assert sink.num_results == 4
+        assert [trial for trial, result in received] == [0, 1, 2, 3]
+        assert np.allclose([result for trial, result in received], 2 * np.array(inputs)[:, np.newaxis, :])
+
+    def test_base_sink_counts_results(self):
+        a = TransferMechanism(name='a')
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        sink = ResultsSink()
+        assert s.run(inputs={a: [[1.0], [2.0], [3.0]]}, results_sink=sink) is None
+        assert sink.num_results == 3
+
+    def test_chunked_file_sink(self, tmpdir):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2, function=Linear(slope=2.0))
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        inputs = [[float(i), 1.0 - i] for i in range(7)]
+        filename = str(tmpdir.join('results.npy'))
+        sink = ChunkedFileResultsSink(filename, chunk_size=3)
+        assert s.run(inputs={a: inputs}, results_sink=sink) == filename
+        assert np.allclose(sink.read(), 2 * np.array(inputs)[:, np.newaxis, :])
+
+        # a second run appends to the file
+        s.run(inputs={a: inputs[:2]}, results_sink=sink)
+        assert len(sink.read()) == 9
+
+    def test_chunked_file_sink_written_when_trial_raises(self, tmpdir):
+        a = TransferMechanism(name='a')
+        p = Process(pathway=[a])
+        s = System(processes=[p])
+
+        def inputs():
+            for i in range(4):
+                yield [float(i)]
+            raise ValueError('input unavailable')
+
+        filename = str(tmpdir.join('results.npy'))
+        sink = ChunkedFileResultsSink(filename, chunk_size=3)
+        with pytest.raises(ValueError):
+            s.run(inputs={a: inputs()}, results_sink=sink)
+
+        assert np.allclose(sink.read(), [[[0.0]], [[1.0]], [[2.0]], [[3.0]]])
+
+    def test_statistics_sink(self):
+        a = TransferMechanism(name='a', size=2)
+        b = TransferMechanism(name='b', size=2, function=Linear(slope=2.0))
+        p = Process(pathway=[a, b])
+        s = System(processes=[p])
+
+        inputs = [[float(i), 1.0 - i] for i in range(10)]
+        expected = 2 * np.array(inputs)[:, np.newaxis, :]
+        stats = s.run(inputs={a: inputs}, results_sink=StatisticsResultsSink())
+
+        assert stats.num_results == 10
+        assert np.allclose(stats.mean, np.mean(expected, axis=0))
+        assert np.allclose(stats.variance, np.var(expected, axis=0))
+        assert np.allclose(stats.min, np.min(expected, axis=0))
+        assert np.allclose(stats.max, np.max(expected, axis=0))
+
+    def test_statistics_sink_reset_by_run(self):
+        a = TransferMechanism(name='a', size=2)
+        s = System(processes=[Process(pathway=[a])])
+        sink = StatisticsResultsSink()
+
+        s.run(inputs={a: [[5.0, -5.0]] * 3}, results_sink=sink)
+        stats = s.run(inputs={a: [[1.0, 2.0], [3.0, 0.0]]}, results_sink=sink)
+
+        assert stats.num_results == 2
+        assert np.allclose(stats.mean, [[2.0, 1.0]])
+        assert np.allclose(stats.variance, [[1.0, 1.0]])
+        assert np.allclose(stats.min, [[1.0, 0.0]])
+        assert np.allclose(stats.max, [[3.0, 2.0]])
+
+
 class TestGraphAndInput:
 
     def test_branch(self):
@@ -672,3 +890,91 @@ class TestInitialize:
         # Run 1 --> Execution 1: 1 + 2 = 3    |    Execution 2: 3 + 2 = 5    |    Execution 3: 5 + 3 = 8
         # Run 2 --> Execution 1: 8 + 1 = 9    |    Execution 2: 9 + 2 = 11    |    Execution 3: 11 + 3 = 14
         assert np.allclose(C.log.nparray_dictionary('value')['value'], [[[3]], [[5]], [[8]], [[9]], [[11]], [[14]]])
+
+
+class TestCacheState:
+
+    def test_restore_integrator_and_noise(self):
+        from psyneulink.components.functions.function import NormalDist
+        A = TransferMechanism(name='A', integrator_mode=True, smoothing_factor=0.5, noise=NormalDist().function)
+        B = TransferMechanism(name='B', integrator_mode=True, smoothing_factor=0.2)
+        s = System(processes=[Process(pathway=[A, B])])
+
+        s.run(inputs={A: [1.0, 2.0]})
+        s._cache_state()
+        first = [np.array(r) for r in s.run(inputs={A: [3.0, 4.0, 5.0]})[-3:]]
+        s._restore_state()
+        second = [np.array(r) for r in s.run(inputs={A: [3.0, 4.0, 5.0]})[-3:]]
+
+        assert np.allclose(first, second)
+
+    def test_restore_learned_matrix(self):
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2, function=Logistic())
+        p = Process(pathway=[A, B], learning=ENABLED)
+        s = System(processes=[p])
+        projection = B.path_afferents[0]
+
+        snapshot = s._cache_state()
+        matrix = projection.matrix.copy()
+        s.run(inputs={A: [[1.0, 0.5]] * 3}, targets={B: [[0.0, 1.0]] * 3})
+        assert not np.allclose(projection.matrix, matrix)
+
+        s._restore_state(snapshot)
+        assert np.allclose(projection.matrix, matrix)
+        assert s.scheduler_processing.clock.time.trial == 0
+
+    def test_restore_adaptive_step_size(self):
+        from psyneulink.components.functions.function import FHNIntegrator
+        from psyneulink.components.mechanisms.processing.integratormechanism import IntegratorMechanism
+        I = IntegratorMechanism(function=FHNIntegrator(integration_method="RK45", time_step_size=2.0))
+        s = System(processes=[Process(pathway=[I])])
+        function = I.function_object
+
+        s.run(inputs={I: [1.0]})
+        s._cache_state()
+        step_size = function._adaptive_step_size
+        first = [np.array(r) for r in s.run(inputs={I: [1.0, 1.0]})[-2:]]
+        assert function._adaptive_step_size != step_size
+        s._restore_state()
+        assert function._adaptive_step_size == step_size
+        second = [np.array(r) for r in s.run(inputs={I: [1.0, 1.0]})[-2:]]
+
+        assert np.allclose(first, second)
+
+
+class TestSeed:
+
+    def test_seed_reproducible_independent_of_global_state(self):
+        A = TransferMechanism(name='A', size=3, integrator_mode=True, smoothing_factor=0.5,
+                              noise=NormalDist().function)
+        B = TransferMechanism(name='B', size=3, noise=NormalDist(standard_dev=0.5).function)
+        s1 = System(processes=[Process(pathway=[A, B])], seed=7)
+        np.random.seed(1)
+        r1 = s1.run(inputs={s1.origin_mechanisms[0]: [[1.0, 2.0, 3.0]] * 3})
+
+        A = TransferMechanism(name='A', size=3, integrator_mode=True, smoothing_factor=0.5,
+                              noise=NormalDist().function)
+        B = TransferMechanism(name='B', size=3, noise=NormalDist(standard_dev=0.5).function)
+        s2 = System(processes=[Process(pathway=[A, B])], seed=7)
+        np.random.seed(2)
+        r2 = s2.run(inputs={s2.origin_mechanisms[0]: [[1.0, 2.0, 3.0]] * 3})
+
+        assert np.allclose(r1, r2)
+
+    def test_reseed(self):
+        A = TransferMechanism(name='A', size=3, integrator_mode=True, smoothing_factor=0.5,
+                              noise=NormalDist().function)
+        B = TransferMechanism(name='B', size=3, noise=NormalDist(standard_dev=0.5).function)
+        s = System(processes=[Process(pathway=[A, B])], seed=3)
+        inputs = {s.origin_mechanisms[0]: [[1.0, 2.0, 3.0]] * 2}
+        first = np.array(s.run(inputs=inputs)[-2:])
+        s.seed = 3
+        s.origin_mechanisms[0].integrator_function.reinitialize()
+        second = np.array(s.run(inputs=inputs)[-2:])
+        assert np.allclose(first, second)
+
+        s.seed = 4
+        s.origin_mechanisms[0].integrator_function.reinitialize()
+        third = np.array(s.run(inputs=inputs)[-2:])
+        assert not np.allclose(first, third)